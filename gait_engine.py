@@ -0,0 +1,117 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+gait_engine.py
+
+Last Modified: 10/19/2026
+
+An open-loop gait engine for any number of joints. A Gait gives each joint an amplitude, phase offset, frequency and
+waveform, and builds one (control steps, joints) table of motor targets for a run. Tables are cached by their
+parameters, so simulating many bodies with the same gait (or the same body with a few gaits) builds each table once.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+WAVEFORMS = ('sin', 'cos')
+
+
+@lru_cache(maxsize=64)
+def _target_table(duration, amplitude, phase_offset, frequency, waveform, control_every, control_interpolation):
+    """ Builds the read-only table of motor targets. Arguments are tuples (or numbers) so they can be cached. """
+
+    # The same driver phase as the original simulation: 0.003*pi*duration radians over the run at frequency 1
+    x = np.linspace(0, 0.003 * duration * np.pi, duration)
+    argument = x[:, None] * np.array(frequency) + np.array(phase_offset)
+
+    is_cos = np.array([wave == 'cos' for wave in waveform])
+    table = np.array(amplitude) * np.where(is_cos, np.cos(argument), np.sin(argument))
+
+    # Targets for the control steps (every control_every-th step)
+    control_steps = np.arange(0, duration, control_every)
+    if control_interpolation == 'interpolate':
+        at = np.minimum(control_steps + (control_every - 1) / 2, duration - 1)
+        table = np.stack([np.interp(at, np.arange(duration), column) for column in table.T], axis=1)
+    else:
+        table = table[control_steps]
+
+    table.setflags(write=False)
+    return table
+
+
+class Gait:
+    """ Per-joint sinusoidal motor drivers.
+
+        The target of joint j at step i is amplitude[j] * wave[j](frequency[j] * x[i] + phase_offset[j]), where x runs
+        over the same phase as the original four-leg drivers and wave is sin or cos. The default gait (see
+        default_gait) reproduces those drivers exactly.
+
+        Attributes
+        ----------
+        joints : tuple[bytes]
+            The joint names, in column order of the target table
+        amplitude, phase_offset, frequency : tuple[float]
+            The parameters of each joint's driver
+        waveform : tuple[str]
+            'sin' or 'cos' for each joint
+        max_force : float
+            The maximum motor force
+
+        Methods
+        -------
+        table(duration, control_every=1, control_interpolation='hold')
+            Returns the cached (control steps, joints) array of motor targets
+        from_vector(params, joints, waveform=None, max_force=500)
+            Builds a gait from a flat parameter vector (amplitudes, then phase offsets, then frequencies), e.g. the gait
+            part of an evolved genome
+    """
+
+    def __init__(self, joints, amplitude, phase_offset=None, frequency=None, waveform=None, max_force=500):
+        n = len(joints)
+
+        self.joints = tuple(name.encode() if isinstance(name, str) else name for name in joints)
+        self.amplitude = tuple(float(a) for a in amplitude)
+        self.phase_offset = tuple(float(a) for a in phase_offset) if phase_offset is not None else (0.0,) * n
+        self.frequency = tuple(float(a) for a in frequency) if frequency is not None else (1.0,) * n
+        self.waveform = tuple(waveform) if waveform is not None else ('sin',) * n
+        self.max_force = max_force
+
+        if not len(self.amplitude) == len(self.phase_offset) == len(self.frequency) == len(self.waveform) == n:
+            raise ValueError("amplitude, phase_offset, frequency and waveform need one value for each joint")
+
+        if any(wave not in WAVEFORMS for wave in self.waveform):
+            raise ValueError(f"Every waveform must be one of {WAVEFORMS}")
+
+    def __len__(self):
+        return len(self.joints)
+
+    def __repr__(self):
+        return (f"Gait(joints={self.joints}, amplitude={self.amplitude}, phase_offset={self.phase_offset}, "
+                f"frequency={self.frequency}, waveform={self.waveform}, max_force={self.max_force})")
+
+    @classmethod
+    def from_vector(cls, params, joints, waveform=None, max_force=500):
+        params = np.asarray(params, dtype=np.float64)
+        n = len(joints)
+
+        if len(params) != 3 * n:
+            raise ValueError(f"Expected {3 * n} gait parameters for {n} joints, got {len(params)}")
+
+        return cls(joints, params[:n], params[n:2*n], params[2*n:], waveform, max_force)
+
+    def table(self, duration, control_every=1, control_interpolation='hold'):
+        """ Returns the read-only (control steps, joints) array of motor targets for a run of `duration` steps, with
+            one row for every control_every-th step (see simulate_body). The array is cached, so it must not be
+            modified.
+        """
+
+        return _target_table(duration, self.amplitude, self.phase_offset, self.frequency, self.waveform,
+                             control_every, control_interpolation)
+
+
+def default_gait(joints, amplitude=(1, -1, -1, 1), phase_offset=(0, 0, 0, 0)):
+    """ The original four-leg drivers: sin, cos, cos, sin at frequency 1 with the given amplitudes and phase offsets. """
+
+    return Gait(joints, amplitude, phase_offset, waveform=('sin', 'cos', 'cos', 'sin'))
@@ -0,0 +1,178 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+DifferentialEvolution.py
+
+Last Modified: 10/19/2026
+"""
+
+import numpy as np
+from genalgs import GeneticAlgorithm
+
+
+class DifferentialEvolution(GeneticAlgorithm):
+    """ A vectorized DE/rand/1/bin Differential Evolution for real-valued genomes, child class of GeneticAlgorithm.
+
+        Algorithm Methodology:
+            1. For every individual (the target), build a mutant vector from three other distinct individuals:
+            a + differential_weight * (b - c)
+            2. Binomial crossover: each gene of the trial vector comes from the mutant with probability crossover_rate
+            (and at least one gene always does), otherwise from the target
+            3. Repair trial genes outside their bounds, if bounds are set
+            4. After the trials are evaluated, each one replaces its target if it is at least as fit
+
+        Steps 1-3 are computed for the whole population at once with NumPy array operations. cycle() writes the trial
+        vectors into the population and returns the indices of all individuals, so the caller evaluates each
+        generation as one batch. When the caller then passes the trial fitness values to setFitness, the selection
+        (step 4) happens there: individuals whose trial lost are restored to their target, in both the population and
+        the fitness list that was passed in, so after setFitness the population holds the survivors.
+
+        For inherited attributes and methods, refer to the GeneticAlgorithm class documentation.
+
+        Attributes
+        ----------
+        differential_weight : float
+            The scale factor F applied to the difference vector
+        crossover_rate : float
+            The probability CR that a trial gene comes from the mutant (also stored as prob_reproduction)
+        bounds : GenomeSchema or None
+            Per-gene bounds applied to every trial vector
+        generation : int
+            The number of completed cycles
+        success_rate : float
+            The fraction of trials that replaced their target in the last selection
+
+        Methods
+        -------
+        trials()
+            Returns the trial vectors for the whole population, without changing it
+        select(fitness)
+            Keeps each trial that is at least as fit as its target and restores the others
+        cycle(verbosity=0)
+            Writes a new generation of trial vectors into the population and returns it with the indices of all
+            individuals
+    """
+
+    def __init__(self, initial_population, fitness, differential_weight=0.8, crossover_rate=0.9, minimise=False,
+                 name="DifferentialEvolution", bounds=None, rng=None):
+        """ Calls __init__ from the parent class (GeneticAlgorithm) with crossover_rate as the probability of
+            reproduction, then sets the attributes unique to Differential Evolution.
+
+            Parameters
+            ----------
+            differential_weight : float, optional
+                The scale factor F, usually in [0.4, 1.0] (default is 0.8)
+            crossover_rate : float, optional
+                The crossover probability CR (default is 0.9)
+            bounds : GenomeSchema, optional
+                If given, trial genes outside their bounds are repaired before evaluation
+            rng : RandomStream, int or np.random.Generator, optional
+                The random stream trials are drawn from, or a seed for a new one
+        """
+
+        super().__init__(initial_population, fitness, 0.0, crossover_rate, minimise, name, rng)
+
+        if self.population_size < 4:
+            raise ValueError("Differential Evolution needs a population of at least 4 individuals")
+
+        self.differential_weight = differential_weight
+        self.crossover_rate = crossover_rate
+        self.bounds = bounds
+        self.generation = 0
+        self.success_rate = 0.0
+
+        # The targets of the trials in the population, kept until the trials have been evaluated
+        self.targets = None
+        self.target_fitness = None
+
+    def __str__(self):
+        """ Custom method for string representation of Differential Evolution """
+
+        return (f"{self.name} DE/rand/1/bin with population size: {self.population_size}, differential weight: "
+                f"{self.differential_weight}, crossover rate: {self.crossover_rate}, minimise = {self.minimise == 1}")
+
+    def trials(self):
+        """ Builds a trial vector for every individual with rand/1 mutation and binomial crossover.
+
+            Returns
+            -------
+            np.ndarray
+                A (population size, genome length) array of trial vectors
+        """
+
+        population = np.asarray(self.population, dtype=np.float64)
+        n, length = population.shape
+
+        # Three distinct partners for each target, none of them the target itself
+        keys = self.rng.random((n, n))
+        keys[np.arange(n), np.arange(n)] = np.inf
+        a, b, c = np.argsort(keys, axis=1)[:, :3].T
+
+        mutants = population[a] + self.differential_weight * (population[b] - population[c])
+
+        # Binomial crossover, with one gene per individual always taken from the mutant
+        from_mutant = self.rng.random((n, length)) < self.crossover_rate
+        from_mutant[np.arange(n), self.rng.integers(0, length, n)] = True
+
+        trials = np.where(from_mutant, mutants, population)
+
+        if self.bounds is not None:
+            trials = self.bounds.repair(trials)
+
+        return trials
+
+    def select(self, fitness):
+        """ Compares each evaluated trial in the population with its target. Trials that are at least as fit survive;
+            the others are replaced by their target, in the population and in fitness (in place).
+        """
+
+        trial_fitness = np.asarray(fitness, dtype=np.float64)
+        lost = self.minimise * trial_fitness > self.minimise * self.target_fitness
+
+        for i in np.flatnonzero(lost):
+            self.population[i][:] = self.targets[i].tolist()
+            fitness[i] = self.target_fitness[i]
+
+        self.success_rate = 1 - lost.mean()
+        self.targets = None
+        self.target_fitness = None
+
+    def setFitness(self, fitness):
+        """ Runs the selection if the population holds evaluated trials, then sets self.fitness and recalculates the
+            most fit individual as in GeneticAlgorithm.
+        """
+
+        if self.targets is not None:
+            self.select(fitness)
+
+        super().setFitness(fitness)
+
+    def cycle(self, verbosity: int = 0):
+        """ Saves the current population as the targets and writes a trial vector for every individual into the
+            population.
+
+            Parameters
+            ----------
+            verbosity : int, optional
+                verbosity = 1 or 2 prints the success rate of the last selection
+
+            Returns
+            -------
+            tuple[list[list[float]], list[int]]
+                The population of trial vectors and the indices of the individuals that were replaced (all of them)
+        """
+
+        self.targets = np.array(self.population, dtype=np.float64)
+        self.target_fitness = np.array(self.fitness, dtype=np.float64)
+
+        for i, trial in enumerate(self.trials().tolist()):
+            self.population[i][:] = trial
+
+        self.generation += 1
+        self.replaced = [1] * self.population_size
+
+        if verbosity:
+            print(f"Generation {self.generation}: {self.success_rate:.1%} of the last trials replaced their target")
+
+        return self.population, list(range(self.population_size))
@@ -0,0 +1,159 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+DiversityTracker.py
+
+Last Modified: 10/19/2026
+"""
+
+import numpy as np
+from genalgs import bitpacked
+
+METRICS = ("euclidean", "hamming", "packed")
+
+
+class DiversityTracker:
+    """ Keeps the matrix of pairwise distances between the individuals of a population up to date.
+
+        A steady-state cycle replaces one individual, so only its row and column of the distance matrix change:
+        update() recomputes them in O(n) distance evaluations instead of O(n^2) for the whole matrix, and keeps the sum
+        of all distances for the mean. The tracker holds its own copy of the genomes, so it can be updated after the
+        population has been changed in place.
+
+        Attributes
+        ----------
+        metric : str
+            "euclidean" for real-valued genomes, "hamming" for binary genomes and "packed" for the bit-packed genomes of
+            a PackedMicrobial
+        distances : np.ndarray
+            The (population size, population size) matrix of pairwise distances
+        history : list[dict]
+            The statistics saved by each call of record()
+
+        Methods
+        -------
+        refresh(population)
+            Recomputes the whole matrix
+        update(population, indices)
+            Recomputes the rows and columns of the individuals at the given indices
+        niche_counts(indices, radius, alpha=1.0)
+            Returns the fitness-sharing niche count of each of the given individuals
+        stats()
+            Returns the mean distance, nearest-neighbour distances and gene entropy of the population
+        record(generation)
+            Saves the current statistics in self.history
+    """
+
+    def __init__(self, population, metric="euclidean", bins=10, length=None):
+        """ Parameters
+            ----------
+            population : list[list] or np.ndarray
+                The population to track
+            metric : str, optional
+                One of "euclidean", "hamming" or "packed" (default is "euclidean")
+            bins : int, optional
+                The number of histogram bins per gene for the entropy of real-valued genomes (default is 10)
+            length : int, optional
+                The number of genes in each genome, needed only for the "packed" metric
+        """
+
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {METRICS}")
+        if metric == "packed" and length is None:
+            raise ValueError("length is needed for the packed metric")
+
+        self.metric = metric
+        self.bins = bins
+        self.genome_length = length
+        self.history = []
+
+        self.refresh(population)
+
+    def __len__(self):
+        return len(self.genomes)
+
+    def _copy(self, population):
+        if self.metric == "euclidean":
+            return np.array(population, dtype=np.float64)
+        return np.array(population)
+
+    def _row(self, index):
+        """ The distances from the individual at index to every individual. """
+
+        if self.metric == "euclidean":
+            return np.sqrt(np.square(self.genomes - self.genomes[index]).sum(axis=1))
+        elif self.metric == "hamming":
+            return (self.genomes != self.genomes[index]).sum(axis=1).astype(np.float64)
+        else:
+            return bitpacked.hamming(self.genomes, index).astype(np.float64)
+
+    def refresh(self, population):
+        """ Copies the population and recomputes every pairwise distance. """
+
+        self.genomes = self._copy(population)
+        self.distances = np.stack([self._row(i) for i in range(len(self.genomes))])
+        self.total = float(self.distances.sum())
+
+    def update(self, population, indices):
+        """ Copies the individuals at the given indices from the population and recomputes their distances to every
+            other individual, O(n) distance evaluations per individual.
+        """
+
+        for i in indices:
+            self.genomes[i] = population[i]
+            row = self._row(i)
+
+            # The row and the column of i both change, but d(i, i) = 0 is counted in neither
+            self.total += 2 * (row.sum() - self.distances[i].sum())
+            self.distances[i] = row
+            self.distances[:, i] = row
+
+    def niche_counts(self, indices, radius, alpha=1.0):
+        """ Returns the niche count sum_j sh(d_ij) of each individual i in indices, with the sharing function
+            sh(d) = 1 - (d / radius) ** alpha for d < radius and 0 otherwise. Each count includes the individual
+            itself, so it is at least 1.
+        """
+
+        distances = self.distances[np.asarray(indices)]
+        return np.where(distances < radius, 1 - (distances / radius) ** alpha, 0.0).sum(axis=-1)
+
+    def entropy(self):
+        """ The mean Shannon entropy of the genes, normalised to [0, 1]: the bit entropy for binary genomes, and the
+            entropy of a histogram over each gene's range in the population for real-valued genomes.
+        """
+
+        if self.metric == "euclidean":
+            low = self.genomes.min(axis=0)
+            span = self.genomes.max(axis=0) - low
+            scaled = np.divide(self.genomes - low, span, out=np.zeros_like(self.genomes), where=span > 0)
+            binned = np.minimum((scaled * self.bins).astype(np.int64), self.bins - 1)
+
+            counts = np.stack([np.bincount(gene, minlength=self.bins) for gene in binned.T])
+            levels = self.bins
+        else:
+            genomes = bitpacked.unpack(self.genomes, self.genome_length) if self.metric == "packed" else self.genomes
+            ones = np.count_nonzero(genomes, axis=0)
+            counts = np.stack([len(genomes) - ones, ones], axis=1)
+            levels = 2
+
+        p = counts / counts.sum(axis=1, keepdims=True)
+        h = -np.sum(np.where(p > 0, p * np.log2(np.where(p > 0, p, 1)), 0.0), axis=1)
+
+        return float(h.mean() / np.log2(levels))
+
+    def stats(self):
+        """ Returns the mean pairwise distance, the mean and smallest distance to each individual's nearest
+            neighbour, and the mean gene entropy.
+        """
+
+        n = len(self)
+        nearest = np.min(self.distances + np.diag(np.full(n, np.inf)), axis=1)
+
+        return {'mean_distance': float(self.total / (n * (n - 1))), 'mean_nearest': float(nearest.mean()),
+                'min_nearest': float(nearest.min()), 'entropy': self.entropy()}
+
+    def record(self, generation):
+        """ Saves the statistics of the current population, labelled with the generation, in self.history. """
+
+        self.history.append({'generation': generation, **self.stats()})
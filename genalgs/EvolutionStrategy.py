@@ -0,0 +1,237 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+EvolutionStrategy.py
+
+Last Modified: 10/19/2026
+"""
+
+import numpy as np
+from genalgs import GeneticAlgorithm
+
+
+class CMAES(GeneticAlgorithm):
+    """ A (mu/mu_w, lambda) Covariance Matrix Adaptation Evolution Strategy for real-valued genomes, child class of
+        GeneticAlgorithm.
+
+        Algorithm Methodology:
+            1. Rank the current population (the lambda offspring of the last generation) by fitness
+            2. Move the mean of the search distribution to the weighted mean of the best mu offspring
+            3. Update the evolution paths, the covariance matrix and the step size from the selected steps
+            4. Sample lambda new offspring from the updated distribution, replacing the whole population
+
+        Every cycle replaces the whole population, so cycle() returns the indices of all individuals and the caller
+        evaluates them as one batch (e.g. in parallel) before calling setFitness. The first cycle only sets the mean
+        from the initial population; the initial step size and (diagonal) covariance come from its spread.
+
+        With diagonal=True only the variance of each gene is adapted (sep-CMA-ES), which learns faster per
+        generation but cannot follow correlations between genes.
+
+        For inherited attributes and methods, refer to the GeneticAlgorithm class documentation. Because the
+        population is replaced every generation, most_fit and best_fitness are the best individual found so far rather
+        than the best of the current population.
+
+        Attributes
+        ----------
+        mean : np.ndarray
+            The mean of the search distribution
+        sigma : float
+            The global step size
+        covariance : np.ndarray
+            The covariance matrix, or its diagonal if diagonal is True
+        mu : int
+            The number of offspring the mean is recombined from
+        weights : np.ndarray
+            The recombination weights of the mu best offspring
+        diagonal : bool
+            Whether only a diagonal covariance is adapted
+        bounds : GenomeSchema or None
+            Per-gene bounds applied to every sampled offspring
+        generation : int
+            The number of completed cycles
+
+        Methods
+        -------
+        update()
+            Updates the search distribution from the current population and fitness
+        sample()
+            Samples lambda new offspring into the population
+        cycle(verbosity=0)
+            Updates the distribution, samples a new population and returns it with the indices of all individuals
+    """
+
+    def __init__(self, initial_population, fitness, sigma=None, mu=None, diagonal=False, minimise=False,
+                 name="CMAES", bounds=None, rng=None):
+        """ Calls __init__ from the parent class (GeneticAlgorithm), then sets the strategy parameters from the
+            population size and genome length. (The probabilities of mutation and reproduction are not used.)
+
+            Parameters
+            ----------
+            sigma : float, optional
+                The initial step size (default is the root-mean-square standard deviation of the genes in the initial
+                population, with the covariance starting as the genes' relative variances)
+            mu : int, optional
+                The number of offspring selected for recombination (default is half the population size)
+            diagonal : bool, optional
+                Whether to adapt only a diagonal covariance matrix (default is False)
+            bounds : GenomeSchema, optional
+                If given, offspring genes outside their bounds are repaired as soon as they are sampled, and the update
+                uses the repaired offspring
+            rng : RandomStream, int or np.random.Generator, optional
+                The random stream offspring are sampled from, or a seed for a new one
+        """
+
+        super().__init__(initial_population, fitness, 0.0, 0.0, minimise, name, rng)
+
+        population = np.asarray(initial_population, dtype=np.float64)
+        n = population.shape[1]
+        lam = self.population_size
+
+        self.diagonal = diagonal
+        self.bounds = bounds
+        self.generation = 0
+
+        # Recombination weights
+        self.mu = mu or lam // 2
+        weights = np.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mueff = 1 / np.sum(self.weights ** 2)
+
+        # Adaptation rates
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1 - self.c1, 2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff))
+        if diagonal:
+            self.c1 = min(1.0, self.c1 * (n + 2) / 3)
+            self.cmu = min(1 - self.c1, self.cmu * (n + 2) / 3)
+        self.damps = 1 + 2 * max(0.0, np.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        # Initial distribution from the spread of the initial population
+        variance = np.maximum(population.var(axis=0), 1e-12)
+        self.mean = population.mean(axis=0)
+        self.sigma = sigma if sigma is not None else float(np.sqrt(variance.mean()))
+        relative = variance / variance.mean()
+        self.covariance = relative if diagonal else np.diag(relative)
+
+        self.path_c = np.zeros(n)
+        self.path_s = np.zeros(n)
+        self.basis = np.eye(n)
+        self.scales = np.sqrt(relative)
+
+    def __str__(self):
+        """ Custom method for string representation of the evolution strategy """
+
+        kind = "diagonal " if self.diagonal else ""
+        return (f"{self.name} {kind}CMA-ES with population size (lambda): {self.population_size}, mu: {self.mu}, "
+                f"step size: {self.sigma:.4g}, minimise = {self.minimise == 1}")
+
+    def findMostFit(self):
+        """ Keeps a copy of the best individual found so far and its fitness in self.most_fit and self.best_fitness.
+        """
+
+        fitness = np.asarray(self.fitness, dtype=np.float64)
+        best = int(np.argmin(self.minimise * fitness))
+
+        if self.best_fitness is None or self.minimise * fitness[best] < self.minimise * self.best_fitness:
+            self.best_fitness = self.fitness[best]
+            self.most_fit = np.asarray(self.population[best], dtype=np.float64).tolist()
+
+    def ranked(self):
+        """ Returns the population as an array, ordered from best to worst fitness. """
+
+        order = np.argsort(self.minimise * np.asarray(self.fitness, dtype=np.float64), kind="stable")
+        return np.asarray(self.population, dtype=np.float64)[order]
+
+    def update(self):
+        """ Updates the mean, evolution paths, covariance and step size from the current population and fitness. """
+
+        selected = self.ranked()[:self.mu]
+        old_mean = self.mean
+        self.mean = self.weights @ selected
+
+        if self.generation == 0:
+            # The initial population was not sampled from this distribution, so only the mean is taken from it
+            return
+
+        n = len(self.mean)
+        step = (self.mean - old_mean) / self.sigma
+
+        # Step-size path, in the coordinates where the distribution is isotropic
+        if self.diagonal:
+            whitened = step / np.sqrt(self.covariance)
+        else:
+            whitened = self.basis @ ((self.basis.T @ step) / self.scales)
+        self.path_s = (1 - self.cs) * self.path_s + np.sqrt(self.cs * (2 - self.cs) * self.mueff) * whitened
+
+        norm_s = np.linalg.norm(self.path_s)
+        h_sigma = (norm_s / np.sqrt(1 - (1 - self.cs) ** (2 * self.generation)) / self.chi_n
+                   < 1.4 + 2 / (n + 1))
+
+        self.path_c = (1 - self.cc) * self.path_c + h_sigma * np.sqrt(self.cc * (2 - self.cc) * self.mueff) * step
+
+        # Rank-one and rank-mu covariance updates
+        steps = (selected - old_mean) / self.sigma
+        correction = (1 - h_sigma) * self.cc * (2 - self.cc)
+
+        if self.diagonal:
+            self.covariance = ((1 - self.c1 - self.cmu) * self.covariance
+                               + self.c1 * (self.path_c ** 2 + correction * self.covariance)
+                               + self.cmu * self.weights @ steps ** 2)
+            self.scales = np.sqrt(self.covariance)
+        else:
+            self.covariance = ((1 - self.c1 - self.cmu) * self.covariance
+                               + self.c1 * (np.outer(self.path_c, self.path_c) + correction * self.covariance)
+                               + self.cmu * (steps.T * self.weights) @ steps)
+            self.covariance = (self.covariance + self.covariance.T) / 2
+
+            eigenvalues, self.basis = np.linalg.eigh(self.covariance)
+            self.scales = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+        self.sigma *= np.exp((self.cs / self.damps) * (norm_s / self.chi_n - 1))
+
+    def sample(self):
+        """ Samples lambda offspring from the search distribution (repairing them if bounds are set) and writes them
+            into the population in place.
+        """
+
+        z = self.rng.standard_normal((self.population_size, len(self.mean)))
+
+        if self.diagonal:
+            offspring = self.mean + self.sigma * z * self.scales
+        else:
+            offspring = self.mean + self.sigma * (z * self.scales) @ self.basis.T
+
+        if self.bounds is not None:
+            offspring = self.bounds.repair(offspring)
+
+        for i, individual in enumerate(offspring.tolist()):
+            self.population[i][:] = individual
+
+    def cycle(self, verbosity: int = 0):
+        """ Completes one generation: updates the search distribution from the evaluated population, then samples a
+            new population.
+
+            Parameters
+            ----------
+            verbosity : int, optional
+                verbosity = 1 or 2 prints the step size and mean after each update
+
+            Returns
+            -------
+            tuple[list[list[float]], list[int]]
+                The new population and the indices of the individuals that were replaced (all of them)
+        """
+
+        self.update()
+        self.sample()
+        self.generation += 1
+
+        self.replaced = [1] * self.population_size
+
+        if verbosity:
+            print(f"Generation {self.generation}: step size {self.sigma:.4g}, mean {self.mean}")
+
+        return self.population, list(range(self.population_size))
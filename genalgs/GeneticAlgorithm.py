@@ -4,11 +4,14 @@ SPDX License: BSD-3-Clause
 
 GeneticAlgorithm.py
 
-Last Modified: 7/25/2024
+Last Modified: 10/19/2026
 
 Distribution Statement: Distribution A
 """
 
+from genalgs.DiversityTracker import DiversityTracker
+from genalgs.RandomStream import RandomStream
+
 
 class GeneticAlgorithm:
     """ A parent class for all Genetic Algorithms.
@@ -31,7 +34,8 @@ class GeneticAlgorithm:
         Attributes
         ----------
         population : list[list[int]]
-            A list of individuals where each individual is a list of binary values
+            A list of individuals where each individual is a list of binary values (a 2-D NumPy array, such as the
+            population of a SharedPopulation, also works and is modified in place)
         fitness : list[float]
             A list of fitness values, where a given index represents the fitness value of the individual at that
             same index in the population
@@ -56,6 +60,10 @@ class GeneticAlgorithm:
             The most fit individual in the population
         best_fitness : float
             The fitness of the most fit member of the population
+        rng : RandomStream
+            The source of every random number the algorithm draws
+        diversity_tracker : DiversityTracker or None
+            The pairwise distances of the population, if track_diversity() has been called
 
         Methods
         -------
@@ -68,9 +76,13 @@ class GeneticAlgorithm:
         findMostFit()
             Determines the most fit individual in the population and its fitness and sets self.most_fit and
             self.best_fitness accordingly
+
+        track_diversity(metric=None, bins=10)
+            Starts tracking the pairwise distances of the population
     """
 
-    def __init__(self, initial_population, fitness, prob_mutation, prob_reproduction, minimise=False, name="Parent"):
+    def __init__(self, initial_population, fitness, prob_mutation, prob_reproduction, minimise=False, name="Parent",
+                 rng=None):
         """ Parameters
             ----------
             initial_population : list[list[int]]
@@ -87,6 +99,8 @@ class GeneticAlgorithm:
                 Whether the genetic algorithm will minimise or maximise the fitness of the population (default is False)
             name : str, optional
                 The name of the genetic algorithm (default is 'Parent')
+            rng : RandomStream, int or np.random.Generator, optional
+                The random stream, or a seed for a new one (default is a stream seeded from fresh entropy)
         """
 
         self.population = initial_population
@@ -95,6 +109,7 @@ class GeneticAlgorithm:
         self.prob_mutation = prob_mutation
         self.prob_reproduction = prob_reproduction
         self.name = name
+        self.rng = rng if isinstance(rng, RandomStream) else RandomStream(rng)
 
         self.population_size = len(initial_population)
         self.replaced = [0] * self.population_size
@@ -103,6 +118,8 @@ class GeneticAlgorithm:
         self.best_fitness = None
         self.findMostFit()
 
+        self.diversity_tracker = None
+
     def __str__(self):
         """ Custom method for string representation of the GeneticAlgorithm
 
@@ -131,6 +148,10 @@ class GeneticAlgorithm:
         self.fitness = fitness
         self.findMostFit()
 
+        # The individuals replaced since the last call have been evaluated, so their distances are brought up to date
+        if self.diversity_tracker is not None:
+            self.diversity_tracker.update(self.population, [i for i, r in enumerate(self.replaced) if r])
+
     def getMostFit(self):
         """ Returns the most fit individual in the population and its fitness.
 
@@ -148,6 +169,8 @@ class GeneticAlgorithm:
         """
 
         current_best = self.fitness[0] * self.minimise
+        self.best_fitness = self.fitness[0]
+        self.most_fit = self.population[0]
 
         for i in range(1, len(self.fitness)):
             current_fitness = self.fitness[i] * self.minimise
@@ -155,3 +178,34 @@ class GeneticAlgorithm:
                 current_best = current_fitness
                 self.best_fitness = self.fitness[i]
                 self.most_fit = self.population[i]
+
+    def track_diversity(self, metric=None, bins=10):
+        """ Attaches a DiversityTracker to the population. From then on, setFitness updates the distances of the
+            replaced individuals.
+
+            Parameters
+            ----------
+            metric : str, optional
+                "euclidean", "hamming" or "packed" (default is "hamming" for a binary encoding, "packed" for a
+                bit-packed population and "euclidean" otherwise)
+            bins : int, optional
+                Histogram bins per gene for the entropy of real-valued genomes (default is 10)
+
+            Returns
+            -------
+            DiversityTracker
+                The tracker, also kept in self.diversity_tracker
+        """
+
+        length = getattr(self, 'length', None)
+
+        if metric is None:
+            if length is not None:
+                metric = "packed"
+            elif getattr(self, 'encoding_type', 1) == 0:
+                metric = "hamming"
+            else:
+                metric = "euclidean"
+
+        self.diversity_tracker = DiversityTracker(self.population, metric, bins, length)
+        return self.diversity_tracker
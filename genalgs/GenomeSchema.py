@@ -0,0 +1,163 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+GenomeSchema.py
+
+Last Modified: 10/19/2026
+"""
+
+import numpy as np
+
+REPAIR_METHODS = ("clip", "reflect", "resample")
+
+
+class GenomeSchema:
+    """ Per-gene lower and upper bounds for a real-valued genome, with vectorized repair of out-of-bounds genes.
+
+        A schema can be given to Microbial (and so Recombination) as `bounds`, and it is then applied to every new
+        individual after crossover and mutation. It counts how often repairs happen.
+
+        Attributes
+        ----------
+        lower : np.ndarray
+            The lower bound of each gene
+        upper : np.ndarray
+            The upper bound of each gene
+        method : str
+            How out-of-bounds genes are repaired:
+                * "clip" - set to the nearest bound
+                * "reflect" - mirrored back into the range at the bound it crossed
+                * "resample" - redrawn uniformly within the bounds
+        names : list[str] or None
+            Optional gene names, used by report()
+        checked : int
+            The number of individuals checked
+        repaired : int
+            The number of individuals that had at least one gene repaired
+        gene_repairs : np.ndarray
+            The number of repairs of each gene
+
+        Methods
+        -------
+        repair(genomes)
+            Repairs a (n, genome length) array of genomes and returns the repaired copy
+        repair_individual(population, index)
+            Repairs one individual of a population in place
+        sample(n)
+            Draws n genomes uniformly within the bounds
+        report()
+            Returns a summary of the repair statistics
+    """
+
+    def __init__(self, lower, upper, method="clip", names=None, rng=np.random, length=None):
+        """ Parameters
+            ----------
+            lower : float or list[float]
+                The lower bound of each gene (a single value applies to every gene)
+            upper : float or list[float]
+                The upper bound of each gene
+            method : str, optional
+                One of "clip", "reflect" or "resample" (default is "clip")
+            names : list[str], optional
+                Gene names
+            rng : np.random.Generator or module, optional
+                Source of random numbers for "resample" and sample() (default is the global np.random)
+            length : int, optional
+                The genome length, needed only when both bounds are single values
+        """
+
+        if method not in REPAIR_METHODS:
+            raise ValueError(f"Unknown repair method {method!r}, expected one of {REPAIR_METHODS}")
+
+        lower = np.asarray(lower, dtype=np.float64)
+        upper = np.asarray(upper, dtype=np.float64)
+
+        if lower.ndim == 0 and upper.ndim == 0:
+            if length is None:
+                raise ValueError("length is needed when both bounds are single values")
+            lower = np.full(length, lower)
+
+        self.lower, self.upper = (bound.copy() for bound in np.broadcast_arrays(lower, upper))
+
+        if np.any(self.lower > self.upper):
+            raise ValueError("Every lower bound must be less than or equal to its upper bound")
+
+        self.method = method
+        self.names = names
+        self.rng = rng
+
+        self.checked = 0
+        self.repaired = 0
+        self.gene_repairs = np.zeros(self.lower.shape, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.lower)
+
+    def violations(self, genomes):
+        """ Returns a boolean mask of the genes outside their bounds. """
+
+        genomes = np.asarray(genomes, dtype=np.float64)
+        return (genomes < self.lower) | (genomes > self.upper)
+
+    def repair(self, genomes):
+        """ Repairs a batch of genomes with self.method and updates the repair statistics.
+
+            Parameters
+            ----------
+            genomes : array_like
+                A (n, genome length) array of genomes, or a single genome
+
+            Returns
+            -------
+            np.ndarray
+                The repaired genomes, with the same shape as the input
+        """
+
+        genomes = np.array(genomes, dtype=np.float64)
+        batch = np.atleast_2d(genomes)
+        outside = self.violations(batch)
+
+        self.checked += len(batch)
+
+        if outside.any():
+            self.repaired += int(outside.any(axis=1).sum())
+            self.gene_repairs += outside.sum(axis=0)
+
+            if self.method == "clip":
+                repaired = np.clip(batch, self.lower, self.upper)
+            elif self.method == "reflect":
+                width = self.upper - self.lower
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    offset = np.mod(batch - self.lower, 2*width)
+                repaired = np.where(width > 0, self.lower + width - np.abs(offset - width), self.lower)
+            else:
+                repaired = self.rng.uniform(self.lower, self.upper, batch.shape)
+
+            batch[outside] = repaired[outside]
+
+        return batch.reshape(genomes.shape)
+
+    def repair_individual(self, population, index):
+        """ Repairs the individual at `index` of a population (a list of lists or a 2-D array) in place. """
+
+        population[index][:] = self.repair(population[index]).tolist()
+
+    def sample(self, n):
+        """ Returns n genomes drawn uniformly within the bounds, as an (n, genome length) array. """
+
+        return self.rng.uniform(self.lower, self.upper, (n, len(self)))
+
+    def repair_rate(self):
+        """ The fraction of checked individuals that needed a repair. """
+
+        return self.repaired / self.checked if self.checked else 0.0
+
+    def report(self):
+        """ Returns a short summary of how often repairs happened, listing the genes that were repaired. """
+
+        names = self.names or [f"gene {i}" for i in range(len(self))]
+        genes = ", ".join(f"{name}: {count}" for name, count in zip(names, self.gene_repairs) if count)
+
+        return (f"Repaired {self.repaired} of {self.checked} individuals ({self.repair_rate():.1%}) with "
+                f"{self.method}" + (f" ({genes})" if genes else ""))
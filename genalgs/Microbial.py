@@ -4,15 +4,13 @@ SPDX License: BSD-3-Clause
 
 Microbial.py
 
-Last Modified: 7/24/2024
+Last Modified: 10/19/2026
 
 Distribution Statement: Distribution A
 """
-import random
-
 import numpy as np
-import random as rd
 from genalgs import GeneticAlgorithm
+from genalgs.batch_crossover import crossover_batch, uniform_masks
 
 
 class Microbial(GeneticAlgorithm):
@@ -36,11 +34,21 @@ class Microbial(GeneticAlgorithm):
             encoding type is 1.
         deme_size : int
             The size of the local neighborhood (or deme) from which the second parent is chosen
+        bounds : GenomeSchema or None
+            Per-gene bounds applied to the new individual after crossover and mutation (real-valued encoding only)
+        sharing_radius : float or None
+            The niche radius of fitness sharing in the tournaments, or None for raw fitness
+        sharing_alpha : float
+            The shape of the sharing function
 
         Methods
         -------
         select(verbosity=0)
             Chooses at random two individuals from the same deme (local "neighborhood")
+        tournament_fitness(indices)
+            Returns the fitness the given individuals compete with in a tournament (shared, if fitness sharing is on)
+        wins(index1, index2)
+            Returns whether the individual at index1 beats the individual at index2 in a tournament
         reproduce(index1, index2, verbosity=0)
             Takes indices of two individuals in the population, assigns a winner and loser based on fitness, and infects
             each of the loser\'s genes with the winner\'s with probability self.prob_reproduction
@@ -50,10 +58,14 @@ class Microbial(GeneticAlgorithm):
         cycle(verbosity=0)
             Completes one generational cycle of selection, reproduction, and mutation then returns the new population
             and the list of what member of the population was infected/replaced
+        batch_cycle(pairs=None, verbosity=0)
+            Runs many disjoint tournaments at once with vectorized crossover and mutation, then returns the new
+            population and the list of the infected/replaced members
     """
 
     def __init__(self, initial_population, fitness, prob_reproduction, prob_mutation, mutation_deviation=0.01,
-                 encoding_type=0, minimise=False, name="Microbial", deme_size: int = None):
+                 encoding_type=0, minimise=False, name="Microbial", deme_size: int = None, bounds=None,
+                 rng=None, sharing_radius=None, sharing_alpha=1.0):
         """ Calls __init__ from the parent class (GeneticAlgorithm) to set all attributes inherited from the parent.
         (For inherited attributes, refer to the GeneticAlgorithm class documentation.) Then, it sets self.deme_size,
         which is unique to the Microbial Genetic Algorithm.
@@ -75,9 +87,23 @@ class Microbial(GeneticAlgorithm):
             If encoding_type = 0, then the encoding is in binary, so mutation is a bit flip
             If encoding_type = 1, then the encoding is a real-valued number, so mutation is +- some percentage of the
             current value
+
+        self.bounds : GenomeSchema, optional
+            If given, any gene of the new individual that crossover or mutation has moved outside its bounds is
+            repaired (clipped, reflected or resampled) at the end of each cycle
+
+        rng : RandomStream, int or np.random.Generator, optional
+            The random stream every operator draws from, or a seed for a new one
+
+        self.sharing_radius : float, optional
+            If given, tournaments compare shared fitness: each individual's fitness is divided (or multiplied, when
+            minimising) by its niche count, the sum of 1 - (d / sharing_radius) ** sharing_alpha over the individuals
+            within distance d < sharing_radius of it. This needs a diversity tracker, which is attached here, and
+            fitness values that are positive. Distances are Euclidean for a real-valued encoding and Hamming for a
+            binary one.
         """
 
-        super().__init__(initial_population, fitness, prob_mutation, prob_reproduction, minimise, name)
+        super().__init__(initial_population, fitness, prob_mutation, prob_reproduction, minimise, name, rng)
 
         if deme_size is None:
             self.deme_size = 0
@@ -88,8 +114,14 @@ class Microbial(GeneticAlgorithm):
 
         self.mutation_deviation = mutation_deviation
         self.encoding_type = encoding_type
+        self.bounds = bounds
         self.loser_index = -1
 
+        self.sharing_radius = sharing_radius
+        self.sharing_alpha = sharing_alpha
+        if sharing_radius is not None:
+            self.track_diversity()
+
     def __str__(self):
         """ Custom method for string representation of the Microbial Genetic Algorithm
 
@@ -121,15 +153,15 @@ class Microbial(GeneticAlgorithm):
                 The indices of the two individuals selected from the population
         """
 
-        index = rd.randrange(0, self.population_size)
+        index = self.rng.randrange(0, self.population_size)
         index2 = index
 
         while index == index2:
             if self.deme_size:
-                deme_offset = rd.randint(-self.deme_size, self.deme_size)
+                deme_offset = self.rng.randint(-self.deme_size, self.deme_size)
                 index2 = (index + deme_offset) % self.population_size
             else:
-                index2 = rd.randrange(0, self.population_size)
+                index2 = self.rng.randrange(0, self.population_size)
 
         if verbosity == 2:
             print(f"Population Members Selected: {self.population[index]} (index = {index}, "
@@ -138,6 +170,28 @@ class Microbial(GeneticAlgorithm):
 
         return index, index2
 
+    def tournament_fitness(self, indices):
+        """ Returns the fitness of the individuals at the given indices (any array shape), shared by their niche count
+            if fitness sharing is on.
+        """
+
+        fitness = np.asarray(self.fitness, dtype=np.float64)[np.asarray(indices)]
+
+        if self.sharing_radius is None:
+            return fitness
+
+        niche = self.diversity_tracker.niche_counts(indices, self.sharing_radius, self.sharing_alpha)
+        return fitness * niche if self.minimise == 1 else fitness / niche
+
+    def wins(self, index1, index2) -> bool:
+        """ Returns whether the individual at index1 beats the individual at index2 (ties go to index2). """
+
+        if self.sharing_radius is None:
+            return self.minimise * self.fitness[index1] < self.minimise * self.fitness[index2]
+
+        fitness1, fitness2 = self.tournament_fitness([index1, index2])
+        return self.minimise * fitness1 < self.minimise * fitness2
+
     def reproduce(self, index1, index2, verbosity=0) -> int:
         """ With some probability self.prob_reproduction, each gene of the more fit individual will replace the gene of
             the less fit individual.
@@ -164,7 +218,7 @@ class Microbial(GeneticAlgorithm):
                     population by reproduction.
         """
 
-        if self.minimise * self.fitness[index1] < self.minimise * self.fitness[index2]:
+        if self.wins(index1, index2):
             winner = self.population[index1]
             loser = self.population[index2]
 
@@ -184,7 +238,7 @@ class Microbial(GeneticAlgorithm):
                       f"(score = {self.fitness[index1]})")
 
         for i in range(len(winner)):
-            infect = np.random.uniform(0, 1)
+            infect = self.rng.uniform(0, 1)
 
             if infect <= self.prob_reproduction:
                 loser[i] = winner[i]
@@ -213,10 +267,10 @@ class Microbial(GeneticAlgorithm):
         """
 
         loser = self.population[index]
-        mutate = np.random.uniform(0, 1)
+        mutate = self.rng.uniform(0, 1)
 
         if mutate <= self.prob_mutation:
-            to_flip = rd.randrange(0, len(loser))
+            to_flip = self.rng.randrange(0, len(loser))
 
             if loser[to_flip]:
                 loser[to_flip] = 0
@@ -231,12 +285,12 @@ class Microbial(GeneticAlgorithm):
 
     def real_mutate(self, index, verbosity: int = 0):
         loser = self.population[index]
-        mutate = np.random.uniform(0, 1)
+        mutate = self.rng.uniform(0, 1)
 
         if mutate <= self.prob_mutation:
-            to_mutate = rd.randrange(0, len(loser))
+            to_mutate = self.rng.randrange(0, len(loser))
 
-            loser[to_mutate] += loser[to_mutate] * self.mutation_deviation * random.choice([-1, 1])
+            loser[to_mutate] += loser[to_mutate] * self.mutation_deviation * self.rng.choice([-1, 1])
 
             if verbosity == 2:
                 print(f"Mutation at gene {to_mutate}")
@@ -277,6 +331,10 @@ class Microbial(GeneticAlgorithm):
         else:
             self.bit_mutate(loser_index, verbosity)
 
+        # Step 4: Repair any genes outside their bounds
+        if self.bounds is not None:
+            self.bounds.repair_individual(self.population, loser_index)
+
         if verbosity == 1:
             print(f"Evolved Individual at index {loser_index}: {self.population[loser_index]}\n")
 
@@ -284,3 +342,87 @@ class Microbial(GeneticAlgorithm):
 
         # Return the new population and the list of which individuals (in this case only 1) were replaced
         return self.population, self.loser_index
+
+    def batch_select(self, pairs):
+        """ Pairs up 2 * pairs distinct individuals at random (across the whole population, ignoring the deme) and
+            holds all the tournaments at once.
+
+            Returns
+            -------
+            tuple[np.ndarray, np.ndarray]
+                The indices of the winner and of the loser of each tournament
+        """
+
+        chosen = self.rng.permutation(self.population_size)[:2 * pairs].reshape(pairs, 2)
+        fitness = self.minimise * self.tournament_fitness(chosen)
+
+        first_wins = fitness[:, 0] < fitness[:, 1]
+        winners = np.where(first_wins, chosen[:, 0], chosen[:, 1])
+        losers = np.where(first_wins, chosen[:, 1], chosen[:, 0])
+
+        return winners, losers
+
+    def batch_masks(self, pairs, length):
+        """ Returns the crossover masks for a batch of tournaments: uniform infection with self.prob_reproduction. """
+
+        return uniform_masks(pairs, length, self.prob_reproduction, self.rng)
+
+    def batch_crossover(self, population, winners, losers):
+        """ Infects every loser with its winner\'s genes through the masks of batch_masks, in one NumPy call. """
+
+        crossover_batch(population, winners, losers, self.batch_masks(len(losers), population.shape[1]))
+
+    def batch_mutate(self, population, losers):
+        """ With probability self.prob_mutation, mutates one random gene of each loser (a bit flip or a deviation of
+            +- self.mutation_deviation, based on encoding type), all at once.
+        """
+
+        mutate = losers[self.rng.uniform(0, 1, len(losers)) <= self.prob_mutation]
+        genes = self.rng.integers(0, population.shape[1], len(mutate))
+
+        if self.encoding_type:
+            signs = self.rng.choice([-1, 1], len(mutate))
+            population[mutate, genes] += population[mutate, genes] * self.mutation_deviation * signs
+        else:
+            population[mutate, genes] = 1 - population[mutate, genes]
+
+    def batch_cycle(self, pairs: int = None, verbosity: int = 0):
+        """ Completes a batch of tournaments in one step: selection of disjoint pairs, crossover of every pair with one
+            NumPy call, mutation and repair of the losers. Each loser is a new individual to evaluate.
+
+            Parameters
+            ----------
+            pairs : int, optional
+                The number of tournaments (default is half the population size)
+            verbosity : int, optional
+                verbosity = 1 or 2 prints the winners and losers of the tournaments
+
+            Returns
+            -------
+            tuple[list[list[int]], list[int]]
+                The new population and the indices of the individuals that were infected/replaced
+        """
+
+        pairs = min(pairs or self.population_size // 2, self.population_size // 2)
+        population = np.asarray(self.population)
+
+        winners, losers = self.batch_select(pairs)
+        self.batch_crossover(population, winners, losers)
+        self.batch_mutate(population, losers)
+
+        if self.bounds is not None:
+            population[losers] = self.bounds.repair(population[losers])
+
+        # A list population was copied into the array, so copy the new individuals back
+        if population is not self.population:
+            for index in losers:
+                self.population[index][:] = population[index].tolist()
+
+        self.replaced = [0] * self.population_size
+        for index in losers:
+            self.replaced[index] = 1
+
+        if verbosity:
+            print(f"Winners: {winners.tolist()}, Losers: {losers.tolist()}")
+
+        return self.population, losers.tolist()
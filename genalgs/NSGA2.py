@@ -0,0 +1,312 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+NSGA2.py
+
+Last Modified: 10/19/2026
+"""
+
+import csv
+
+import numpy as np
+from genalgs import GeneticAlgorithm
+from genalgs.batch_crossover import uniform_masks
+
+
+def non_dominated_sort(objectives):
+    """ Sorts a population into Pareto fronts.
+
+        Parameters
+        ----------
+        objectives : array_like
+            A (population size, objectives) array, every objective to be minimised
+
+        Returns
+        -------
+        np.ndarray
+            The front (0 is the non-dominated front) of each individual
+    """
+
+    objectives = np.asarray(objectives, dtype=np.float64)
+
+    # dominates[i, j]: i is no worse than j in every objective and better in at least one
+    no_worse = np.all(objectives[:, None, :] <= objectives[None, :, :], axis=2)
+    better = np.any(objectives[:, None, :] < objectives[None, :, :], axis=2)
+    dominates = no_worse & better
+
+    dominated_by = dominates.sum(axis=0)
+    rank = np.full(len(objectives), -1)
+    front = 0
+
+    # Peel off the individuals nobody left dominates, one front at a time
+    current = np.flatnonzero(dominated_by == 0)
+    while len(current):
+        rank[current] = front
+        dominated_by[current] = -1
+        dominated_by -= dominates[current].sum(axis=0)
+        current = np.flatnonzero(dominated_by == 0)
+        front += 1
+
+    return rank
+
+
+def crowding_distance(objectives, rank):
+    """ Returns the crowding distance of each individual within its front: the sum over the objectives of the
+        normalised gap between its two neighbours, infinite for the individuals at the ends of a front.
+    """
+
+    objectives = np.asarray(objectives, dtype=np.float64)
+    distance = np.zeros(len(objectives))
+
+    for front in np.unique(rank):
+        members = np.flatnonzero(rank == front)
+        values = objectives[members]
+
+        order = np.argsort(values, axis=0, kind="stable")
+        ordered = np.take_along_axis(values, order, axis=0)
+        span = ordered[-1] - ordered[0]
+
+        gaps = np.zeros_like(values)
+        gaps[1:-1] = np.divide(ordered[2:] - ordered[:-2], span, out=np.zeros_like(ordered[2:]), where=span > 0)
+        gaps[[0, -1]] = np.inf
+
+        # Scatter each objective's gaps back to the members they belong to
+        contribution = np.zeros_like(values)
+        np.put_along_axis(contribution, order, gaps, axis=0)
+        distance[members] = contribution.sum(axis=1)
+
+    return distance
+
+
+class NSGA2(GeneticAlgorithm):
+    """ A multi-objective NSGA-II genetic algorithm for real-valued genomes, child class of GeneticAlgorithm.
+
+        Algorithm Methodology:
+            1. Rank the population by Pareto front and, within a front, by crowding distance
+            2. Choose parents by binary tournament on (front, crowding distance)
+            3. Create one offspring per individual by uniform crossover of two parents, then mutate each gene with
+            probability prob_mutation by +- mutation_deviation of its value
+            4. After the offspring are evaluated, keep the best population size individuals of parents and offspring
+            together: whole fronts first, then the most spread-out members of the front that does not fit
+
+        The fitness of each individual is a sequence of objective values, and minimise gives the direction of each
+        objective. Like DifferentialEvolution, cycle() writes the offspring into the population and returns all
+        indices, so each generation is evaluated as one batch; the survivor selection (step 4) happens when the
+        offspring fitness is passed to setFitness, which writes the survivors back into the population and the fitness
+        list in place. The non-dominated sort and crowding distance are computed with NumPy array operations.
+
+        For inherited attributes and methods, refer to the GeneticAlgorithm class documentation. most_fit and
+        best_fitness are the member of the first front with the best first objective, and that objective's value.
+
+        Attributes
+        ----------
+        minimise : np.ndarray
+            1 for each objective that is minimised, -1 for each that is maximised
+        mutation_deviation : float
+            The fraction of a gene's value added or subtracted by mutation
+        bounds : GenomeSchema or None
+            Per-gene bounds applied to every offspring
+        rank : np.ndarray
+            The Pareto front of each individual
+        crowding : np.ndarray
+            The crowding distance of each individual within its front
+        generation : int
+            The number of completed cycles
+
+        Methods
+        -------
+        cycle(verbosity=0)
+            Writes a generation of offspring into the population and returns it with the indices of all individuals
+        select(fitness)
+            Keeps the best of the parents and the evaluated offspring
+        pareto_front()
+            Returns the genomes and objective values of the first front
+        export_front(filename, names=None)
+            Writes the first front to a CSV file
+    """
+
+    def __init__(self, initial_population, fitness, prob_reproduction=0.5, prob_mutation=0.1, mutation_deviation=0.05,
+                 minimise=False, name="NSGA2", bounds=None, rng=None):
+        """ Calls __init__ from the parent class (GeneticAlgorithm), then sets the attributes unique to NSGA-II.
+
+            Parameters
+            ----------
+            fitness : list[tuple[float]]
+                The objective values of each individual
+            prob_reproduction : float, optional
+                The probability that an offspring gene comes from the first parent (default is 0.5)
+            prob_mutation : float, optional
+                The probability that each gene of an offspring is mutated (default is 0.1)
+            mutation_deviation : float, optional
+                The fraction of its value a mutated gene changes by (default is 0.05)
+            minimise : bool or list[bool], optional
+                Whether each objective is minimised; a single value applies to every objective (default is False)
+            bounds : GenomeSchema, optional
+                If given, offspring genes outside their bounds are repaired before evaluation
+            rng : RandomStream, int or np.random.Generator, optional
+                The random stream, or a seed for a new one
+        """
+
+        objectives = np.asarray(fitness, dtype=np.float64)
+        self.directions = np.broadcast_to(np.where(np.asarray(minimise, dtype=bool), 1, -1),
+                                          objectives.shape[1:]).copy()
+
+        super().__init__(initial_population, fitness, prob_mutation, prob_reproduction, False, name, rng)
+
+        self.minimise = self.directions
+        self.mutation_deviation = mutation_deviation
+        self.bounds = bounds
+        self.generation = 0
+
+        # The parents of the offspring in the population, kept until the offspring have been evaluated
+        self.parents = None
+        self.parent_fitness = None
+
+    def __str__(self):
+        """ Custom method for string representation of NSGA-II """
+
+        return (f"{self.name} NSGA-II with population size: {self.population_size}, reproduction rate: "
+                f"{self.prob_reproduction}, mutation rate: {self.prob_mutation}, minimise = "
+                f"{(self.minimise == 1).tolist()}")
+
+    def objectives(self, fitness=None):
+        """ Returns the fitness as a (population size, objectives) array with every objective to be minimised. """
+
+        return self.directions * np.asarray(self.fitness if fitness is None else fitness, dtype=np.float64)
+
+    def findMostFit(self):
+        """ Ranks the population (self.rank and self.crowding) and sets self.most_fit and self.best_fitness to the
+            member of the first front with the best first objective.
+        """
+
+        objectives = self.objectives()
+        self.rank = non_dominated_sort(objectives)
+        self.crowding = crowding_distance(objectives, self.rank)
+
+        front = np.flatnonzero(self.rank == 0)
+        best = int(front[np.argmin(objectives[front, 0])])
+
+        self.most_fit = self.population[best]
+        self.best_fitness = self.fitness[best][0]
+
+    def tournament(self, count):
+        """ Returns the indices of count parents, each the winner of a binary tournament on (front, -crowding). """
+
+        pairs = self.rng.integers(0, self.population_size, (count, 2))
+        rank = self.rank[pairs]
+        crowding = self.crowding[pairs]
+
+        first_wins = (rank[:, 0] < rank[:, 1]) | ((rank[:, 0] == rank[:, 1]) & (crowding[:, 0] >= crowding[:, 1]))
+        return np.where(first_wins, pairs[:, 0], pairs[:, 1])
+
+    def offspring(self):
+        """ Returns a (population size, genome length) array of offspring of tournament-selected parents. """
+
+        population = np.asarray(self.population, dtype=np.float64)
+        n, length = population.shape
+
+        first = population[self.tournament(n)]
+        second = population[self.tournament(n)]
+        children = np.where(uniform_masks(n, length, self.prob_reproduction, self.rng), first, second)
+
+        mutate = self.rng.uniform(0, 1, (n, length)) <= self.prob_mutation
+        signs = self.rng.choice([-1, 1], (n, length))
+        children += mutate * children * self.mutation_deviation * signs
+
+        if self.bounds is not None:
+            children = self.bounds.repair(children)
+
+        return children
+
+    def select(self, fitness):
+        """ Keeps the best population size individuals of the parents and the evaluated offspring, and writes them
+            into the population and fitness (in place).
+        """
+
+        n = self.population_size
+        genomes = np.concatenate([self.parents, np.asarray(self.population, dtype=np.float64)])
+        values = list(self.parent_fitness) + list(fitness)
+
+        objectives = self.objectives(values)
+        rank = non_dominated_sort(objectives)
+        crowding = crowding_distance(objectives, rank)
+
+        # Whole fronts first; the front that does not fit is cut by crowding distance, most spread out first
+        survivors = np.lexsort((-crowding, rank))[:n]
+
+        for i, survivor in enumerate(survivors):
+            self.population[i][:] = genomes[survivor].tolist()
+            fitness[i] = values[survivor]
+
+        self.parents = None
+        self.parent_fitness = None
+
+    def setFitness(self, fitness):
+        """ Runs the survivor selection if the population holds evaluated offspring, then sets self.fitness and ranks
+            the population.
+        """
+
+        if self.parents is not None:
+            self.select(fitness)
+
+        super().setFitness(fitness)
+
+    def cycle(self, verbosity: int = 0):
+        """ Saves the current population as the parents and writes one offspring per individual into the population.
+
+            Parameters
+            ----------
+            verbosity : int, optional
+                verbosity = 1 or 2 prints the size of the first front
+
+            Returns
+            -------
+            tuple[list[list[float]], list[int]]
+                The population of offspring and the indices of the individuals that were replaced (all of them)
+        """
+
+        self.parents = np.array(self.population, dtype=np.float64)
+        self.parent_fitness = list(self.fitness)
+
+        for i, child in enumerate(self.offspring().tolist()):
+            self.population[i][:] = child
+
+        self.generation += 1
+        self.replaced = [1] * self.population_size
+
+        if verbosity:
+            print(f"Generation {self.generation}: {int(np.sum(self.rank == 0))} individuals in the first front")
+
+        return self.population, list(range(self.population_size))
+
+    def pareto_front(self):
+        """ Returns the genomes and the objective values of the first front, ordered by the first objective. """
+
+        front = np.flatnonzero(self.rank == 0)
+        front = front[np.argsort(self.objectives()[front, 0], kind="stable")]
+
+        return (np.asarray(self.population, dtype=np.float64)[front],
+                np.asarray(self.fitness, dtype=np.float64)[front])
+
+    def export_front(self, filename, names=None):
+        """ Writes the first front to a CSV file, one row per individual: its objective values, then its genes.
+
+            Parameters
+            ----------
+            filename : str
+                The CSV file to write
+            names : list[str], optional
+                Column names for the objectives followed by the genes (default is objective_i and gene_i)
+        """
+
+        genomes, objectives = self.pareto_front()
+
+        if names is None:
+            names = ([f"objective_{i}" for i in range(objectives.shape[1])]
+                     + [f"gene_{i}" for i in range(genomes.shape[1])])
+
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            writer.writerows(np.hstack([objectives, genomes]).tolist())
@@ -0,0 +1,157 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+PackedMicrobial.py
+
+Last Modified: 10/19/2026
+"""
+
+import numpy as np
+from genalgs import Microbial
+from genalgs import bitpacked
+
+
+class PackedMicrobial(Microbial):
+    """ A Microbial Genetic Algorithm for binary genomes stored bit-packed, child class of Microbial.
+
+        The population is an (population size, words) array of uint64 with 64 genes per word (see bitpacked), so a
+        genome of 10,000 bits takes 1,256 bytes instead of a list of 10,000 Python ints. Infection and crossover are
+        bitwise masks, (winner & mask) | (loser & ~mask), mutation is an XOR of one bit, and Hamming distances between
+        individuals are popcounts. Selection and the algorithm itself are the same as in Microbial with a binary
+        encoding (encoding_type=0).
+
+        For inherited attributes and methods, refer to the Microbial and GeneticAlgorithm class documentation. The
+        population (and most_fit) hold the packed words; use unpack() or getMostFit() to decode them.
+
+        Attributes
+        ----------
+        length : int
+            The number of genes (bits) in each genome
+        crossover_method : int
+            The infection masks: 0 is uniform infection with probability prob_reproduction (as in Microbial), 1 is
+            single-point and 2 is two-point crossover (as in Recombination)
+
+        Methods
+        -------
+        unpack(index=None)
+            Returns the genomes (or the genome at the given index) as arrays of 0/1 values
+        diversity()
+            Returns the mean pairwise Hamming distance of the population
+        hamming(index)
+            Returns the Hamming distance from the individual at the given index to every individual
+    """
+
+    def __init__(self, initial_population, fitness, prob_reproduction, prob_mutation, minimise=False,
+                 name="PackedMicrobial", deme_size: int = None, crossover_method=0, length=None, rng=None,
+                 sharing_radius=None, sharing_alpha=1.0):
+        """ Packs the initial population (unless it is already packed), then calls __init__ from the parent class
+            (Microbial) with a binary encoding.
+
+            Parameters
+            ----------
+            initial_population : list[list[int]] or np.ndarray
+                The genomes as lists or an array of 0/1 values, or an already packed uint64 array (in which case length
+                is required)
+            crossover_method : int, optional
+                0 for uniform infection, 1 for single-point and 2 for two-point crossover (default is 0)
+            length : int, optional
+                The number of genes in each genome (default is the length of the unpacked genomes)
+        """
+
+        population = np.asarray(initial_population)
+
+        if population.dtype == np.uint64:
+            if length is None:
+                raise ValueError("length is required when the initial population is already packed")
+            population = np.ascontiguousarray(population)
+        else:
+            length = population.shape[1]
+            population = bitpacked.pack(population)
+
+        self.length = length
+        self.crossover_method = crossover_method
+
+        super().__init__(population, fitness, prob_reproduction, prob_mutation, encoding_type=0, minimise=minimise,
+                         name=name, deme_size=deme_size, rng=rng, sharing_radius=sharing_radius,
+                         sharing_alpha=sharing_alpha)
+
+    def __str__(self):
+        """ Custom method for string representation of the packed Microbial Genetic Algorithm """
+
+        return super().__str__() + f", and genome length {self.length} bits packed in {self.population.shape[1]} words"
+
+    def unpack(self, index=None):
+        """ Returns the whole population as a (population size, length) uint8 array of 0/1 values, or the genome at
+            index as a 1-D array.
+        """
+
+        if index is None:
+            return bitpacked.unpack(self.population, self.length)
+
+        return bitpacked.unpack(self.population[index], self.length)[0]
+
+    def getMostFit(self):
+        """ Returns the most fit individual in the population (unpacked) and its fitness. """
+
+        return bitpacked.unpack(self.most_fit, self.length)[0], self.best_fitness
+
+    def hamming(self, index):
+        """ Returns the Hamming distance from the individual at index to every individual in the population. """
+
+        return bitpacked.hamming(self.population, index)
+
+    def diversity(self):
+        """ Returns the mean Hamming distance over all pairs of distinct individuals. """
+
+        n = self.population_size
+        return float(bitpacked.hamming_matrix(self.population).sum() / (n * (n - 1)))
+
+    def reproduce(self, index1, index2, verbosity=0) -> int:
+        """ Assigns a winner and a loser as in Microbial, then copies the masked bits of the winner into the loser
+            with one bitwise operation per word.
+        """
+
+        if self.wins(index1, index2):
+            winner, replace = index1, index2
+        else:
+            winner, replace = index2, index1
+
+        mask = bitpacked.crossover_masks(self.crossover_method, 1, self.length, self.prob_reproduction, self.rng)[0]
+        self.population[replace] = bitpacked.crossover(self.population[winner], self.population[replace], mask)
+
+        if verbosity == 2:
+            print(f"Winner: index {winner} (score = {self.fitness[winner]}), Loser: index {replace} "
+                  f"(score = {self.fitness[replace]}), {bitpacked.popcount(mask)[0]} genes infected")
+
+        self.replaced[replace] = 1
+        self.loser_index = replace
+
+        return self.loser_index
+
+    def bit_mutate(self, index, verbosity: int = 0):
+        """ With some probability prob_mutation, flips a random bit of the individual at index. """
+
+        if self.rng.uniform(0, 1) <= self.prob_mutation:
+            to_flip = self.rng.randrange(0, self.length)
+            bitpacked.flip(self.population, [index], [to_flip])
+
+            if verbosity == 2:
+                print(f"Mutation at gene {to_flip} of individual {index}")
+
+    def batch_masks(self, pairs, length):
+        """ Returns packed crossover masks of the selected method for a batch of tournaments. """
+
+        return bitpacked.crossover_masks(self.crossover_method, pairs, self.length, self.prob_reproduction, self.rng)
+
+    def batch_crossover(self, population, winners, losers):
+        """ Infects every loser with its winner's masked bits, all at once. """
+
+        masks = self.batch_masks(len(losers), self.length)
+        population[losers] = bitpacked.crossover(population[winners], population[losers], masks)
+
+    def batch_mutate(self, population, losers):
+        """ With probability self.prob_mutation, flips one random bit of each loser, all at once. """
+
+        mutate = losers[self.rng.uniform(0, 1, len(losers)) <= self.prob_mutation]
+        bitpacked.flip(population, mutate, self.rng.integers(0, self.length, len(mutate)))
@@ -0,0 +1,137 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+RandomStream.py
+
+Last Modified: 10/19/2026
+"""
+
+import numpy as np
+
+
+class RandomStream:
+    """ A seedable source of random numbers for one genetic algorithm, built on a numpy.random.Generator.
+
+        The operators of the genetic algorithms draw many single numbers (one per tournament, or one per gene). Drawing
+        each from NumPy has a fixed per-call overhead, so single draws are served from a buffer of uniforms that is
+        refilled block_size at a time; single integers (randrange, randint, choice) are derived from the same buffer.
+        Array draws go directly to the generator. Because every draw of a genetic algorithm comes from its own stream,
+        a run with a seed can be repeated exactly.
+
+        spawn(n) returns n statistically independent child streams (through numpy.random.SeedSequence.spawn), one for
+        each parallel worker or island.
+
+        Attributes
+        ----------
+        generator : np.random.Generator
+            The underlying generator
+        seed_sequence : np.random.SeedSequence
+            The seed of the generator, from which child streams are spawned
+        block_size : int
+            The number of uniforms drawn each time the buffer is refilled
+
+        Methods
+        -------
+        random(size=None), uniform(low=0.0, high=1.0, size=None)
+            Uniform floats (single values from the buffer)
+        randrange(start, stop=None), randint(a, b), choice(a, size=None)
+            Integers and choices as in the random module (single values from the buffer)
+        integers(low, high=None, size=None), standard_normal(size=None), normal(loc=0.0, scale=1.0, size=None),
+        permutation(x), bytes(length)
+            Draws passed to the generator
+        spawn(n)
+            Returns n independent child streams
+    """
+
+    def __init__(self, seed=None, block_size=1024):
+        """ Parameters
+            ----------
+            seed : int, np.random.SeedSequence, np.random.Generator or RandomStream, optional
+                The seed (default is fresh entropy from the operating system); a Generator is used as it is, and a
+                RandomStream shares its generator
+            block_size : int, optional
+                The number of uniforms buffered at a time (default is 1024)
+        """
+
+        if isinstance(seed, RandomStream):
+            seed = seed.generator
+
+        if isinstance(seed, np.random.Generator):
+            self.generator = seed
+            self.seed_sequence = seed.bit_generator.seed_seq
+        else:
+            self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+            self.generator = np.random.Generator(np.random.PCG64(self.seed_sequence))
+
+        self.block_size = block_size
+        self._buffer = []
+        self._next = 0
+
+    def __repr__(self):
+        return f"RandomStream(entropy={self.seed_sequence.entropy}, spawn_key={self.seed_sequence.spawn_key})"
+
+    def _uniform(self):
+        """ Returns the next buffered uniform in [0, 1), refilling the buffer when it runs out. """
+
+        if self._next == len(self._buffer):
+            self._buffer = self.generator.random(self.block_size).tolist()
+            self._next = 0
+
+        self._next += 1
+        return self._buffer[self._next - 1]
+
+    def random(self, size=None):
+        """ Uniform floats in [0, 1). """
+
+        if size is None:
+            return self._uniform()
+        return self.generator.random(size)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        """ Uniform floats in [low, high). """
+
+        if size is None:
+            return low + (high - low) * self._uniform()
+        return self.generator.uniform(low, high, size)
+
+    def randrange(self, start, stop=None):
+        """ A single integer in [start, stop), or [0, start) if stop is not given, as random.randrange. """
+
+        if stop is None:
+            start, stop = 0, start
+        return start + int(self._uniform() * (stop - start))
+
+    def randint(self, a, b):
+        """ A single integer in [a, b], both inclusive, as random.randint. """
+
+        return self.randrange(a, b + 1)
+
+    def choice(self, a, size=None):
+        """ A random element of a sequence, or an array of size elements drawn with replacement. """
+
+        if size is None:
+            return a[self.randrange(len(a))]
+        return self.generator.choice(a, size)
+
+    def integers(self, low, high=None, size=None):
+        """ Integers in [low, high), as np.random.Generator.integers. """
+
+        return self.generator.integers(low, high, size)
+
+    def standard_normal(self, size=None):
+        return self.generator.standard_normal(size)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return self.generator.normal(loc, scale, size)
+
+    def permutation(self, x):
+        return self.generator.permutation(x)
+
+    def bytes(self, length):
+        return self.generator.bytes(length)
+
+    def spawn(self, n):
+        """ Returns n independent child streams with the same block size. """
+
+        return [RandomStream(child, self.block_size) for child in self.seed_sequence.spawn(n)]
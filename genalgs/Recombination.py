@@ -4,15 +4,15 @@ SPDX License: BSD-3-Clause
 
 Recombination.py
 
-Last Modified: 04/09/2025
+Last Modified: 10/19/2026
 """
 
-import numpy as np
 import random as rd
 from genalgs import Microbial
+from genalgs.batch_crossover import crossover_masks
 
 
-def point_crossover(winner, loser):
+def point_crossover(winner, loser, rng=rd):
     """ A single point along the genotype will be randomly chosen, and from that point to the end of the gene, the
         genes of the more fit individual (winner) will replace the genes of the less fit individual (loser).
 
@@ -22,6 +22,8 @@ def point_crossover(winner, loser):
             A list representing the winner's genotype
         loser : list
             A list representing the loser's genotype
+        rng : RandomStream or module, optional
+            The source of the crossover point (default is the random module)
 
         Returns
         -------
@@ -29,7 +31,7 @@ def point_crossover(winner, loser):
             Returns the modified list representing the loser's genotype after gene crossover
     """
 
-    point = rd.randint(0, len(winner) - 1)
+    point = rng.randint(0, len(winner) - 1)
 
     for i in range(point, len(winner)):
         loser[i] = winner[i]
@@ -37,7 +39,7 @@ def point_crossover(winner, loser):
     return loser
 
 
-def two_point_crossover(winner, loser):
+def two_point_crossover(winner, loser, rng=rd):
     """ A single point along the genotype will be randomly chosen, and from that point to the end of the gene, the
         genes of the more fit individual (winner) will replace the genes of the less fit individual (loser).
 
@@ -47,6 +49,8 @@ def two_point_crossover(winner, loser):
             A list representing the winner's genotype
         loser : list
             A list representing the loser's genotype
+        rng : RandomStream or module, optional
+            The source of the crossover points (default is the random module)
 
         Returns
         -------
@@ -54,7 +58,11 @@ def two_point_crossover(winner, loser):
             Returns the modified list representing the loser's genotype after gene crossover
     """
 
-    points = sorted(rd.sample(range(0, len(winner)), 2))
+    # Two distinct points: the second is drawn from the remaining positions
+    first = rng.randrange(0, len(winner))
+    second = rng.randrange(0, len(winner) - 1)
+    second += second >= first
+    points = sorted((first, second))
 
     for i in range(points[0], points[1] + 1):
         loser[i] = winner[i]
@@ -85,10 +93,13 @@ class Recombination(Microbial):
         -------
         reproduce(index1, index2, verbosity=0)
             Takes indices of two individuals in the population, assigns a winner and loser based on fitness,
+        batch_masks(pairs, length)
+            Returns the crossover masks of the selected method for the batch tournaments of batch_cycle (inherited)
     """
 
     def __init__(self, initial_population, fitness, prob_reproduction=0.5, prob_mutation=0.05, mutation_deviation=0.01,
-                 encoding_type=0, minimise=False, name="Recombination", deme_size: int = None, crossover_method=0):
+                 encoding_type=0, minimise=False, name="Recombination", deme_size: int = None, crossover_method=0,
+                 bounds=None, rng=None, sharing_radius=None, sharing_alpha=1.0):
         """ Calls __init__ from the parent class (Microbial) to set all attributes inherited from the parent.
         (For inherited attributes, refer to the Microbial and GeneticAlgorithm class documentation.) Then, it sets
         self.crossover_method, which is unique to the Recombination class.
@@ -103,7 +114,7 @@ class Recombination(Microbial):
         """
 
         super().__init__(initial_population, fitness, prob_reproduction, prob_mutation, mutation_deviation,
-                         encoding_type, minimise, name, deme_size)
+                         encoding_type, minimise, name, deme_size, bounds, rng, sharing_radius, sharing_alpha)
 
         self.crossover_method = crossover_method
 
@@ -125,7 +136,7 @@ class Recombination(Microbial):
         """
 
         for i in range(len(winner)):
-            infect = np.random.uniform(0, 1)
+            infect = self.rng.uniform(0, 1)
 
             if infect <= self.prob_reproduction:
                 loser[i] = winner[i]
@@ -155,7 +166,7 @@ class Recombination(Microbial):
         """
 
         # Compare the fitnesses of the selected individuals and find the winner
-        if self.minimise * self.fitness[index1] < self.minimise * self.fitness[index2]:
+        if self.wins(index1, index2):
             winner = self.population[index1]
             loser = self.population[index2]
 
@@ -178,9 +189,9 @@ class Recombination(Microbial):
         if self.crossover_method == 0:
             loser = self.uniform_crossover(winner, loser)
         elif self.crossover_method == 1:
-            loser = point_crossover(winner, loser)
+            loser = point_crossover(winner, loser, self.rng)
         else:
-            loser = two_point_crossover(winner, loser)
+            loser = two_point_crossover(winner, loser, self.rng)
 
         if verbosity == 2:
             print(f'''Infected Loser: {loser} (replaces individual at index {replace})''')
@@ -190,3 +201,8 @@ class Recombination(Microbial):
         self.loser_index = replace
 
         return self.loser_index
+
+    def batch_masks(self, pairs, length):
+        """ Returns the crossover masks for a batch of tournaments with the selected method of recombination. """
+
+        return crossover_masks(self.crossover_method, pairs, length, self.prob_reproduction, self.rng)
@@ -0,0 +1,163 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+SharedPopulation.py
+
+Last Modified: 10/19/2026
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedPopulation:
+    """ A population matrix and fitness vector stored in multiprocessing.shared_memory blocks.
+
+        The population and fitness attributes are NumPy arrays backed directly by the shared blocks, so they can be
+        passed to any GeneticAlgorithm as its population and fitness. Worker processes attach to the same blocks by
+        name (using spec) and read genomes / write fitness values in place by index, so nothing is pickled between
+        processes except the indices themselves, and the genetic algorithm sees the new fitness values without a copy.
+
+        Attributes
+        ----------
+        population : np.ndarray
+            A (population size, genome length) array backed by shared memory
+        fitness : np.ndarray
+            A (population size,) float64 array backed by shared memory
+        spec : dict
+            The names, shape and dtype needed by attach() to map the same blocks in another process
+
+        Methods
+        -------
+        create(initial_population, fitness=None, dtype=np.float64)
+            Allocates new shared blocks and copies the initial population (and fitness) into them
+        attach(spec)
+            Maps existing shared blocks, for use in worker processes
+        detach(ga=None)
+            Copies the population and fitness out of shared memory (and points a GeneticAlgorithm at the copies)
+        close()
+            Releases this process's mapping of the blocks
+        unlink()
+            Frees the blocks (only the creating process should call this, once all workers are done)
+    """
+
+    def __init__(self, population_block, fitness_block, shape, dtype, owner=False):
+        """ Use SharedPopulation.create() or SharedPopulation.attach() rather than calling this directly.
+
+            Parameters
+            ----------
+            population_block : shared_memory.SharedMemory
+                The block holding the population matrix
+            fitness_block : shared_memory.SharedMemory
+                The block holding the fitness vector
+            shape : tuple[int, int]
+                The shape of the population matrix
+            dtype : str
+                The dtype of the population matrix
+            owner : bool, optional
+                Whether this process created the blocks and is responsible for unlinking them (default is False)
+        """
+
+        self.population_block = population_block
+        self.fitness_block = fitness_block
+        self.owner = owner
+
+        self.population = np.ndarray(shape, dtype=dtype, buffer=population_block.buf)
+        self.fitness = np.ndarray((shape[0],), dtype=np.float64, buffer=fitness_block.buf)
+
+        self.spec = {'population': population_block.name, 'fitness': fitness_block.name, 'shape': tuple(shape),
+                     'dtype': np.dtype(dtype).str}
+
+    @classmethod
+    def create(cls, initial_population, fitness=None, dtype=np.float64):
+        """ Allocates new shared blocks and copies the initial population into them.
+
+            Parameters
+            ----------
+            initial_population : array_like
+                A (population size, genome length) population
+            fitness : array_like, optional
+                Initial fitness values. If not given, fitness is filled with NaN until it is evaluated.
+            dtype : np.dtype, optional
+                The dtype of the population matrix (default is float64, use e.g. uint8 for binary genomes)
+
+            Returns
+            -------
+            SharedPopulation
+                The new shared population, owned by this process
+        """
+
+        initial_population = np.asarray(initial_population, dtype=dtype)
+        shape = initial_population.shape
+
+        population_block = shared_memory.SharedMemory(create=True, size=max(1, initial_population.nbytes))
+        fitness_block = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * 8))
+
+        shared = cls(population_block, fitness_block, shape, dtype, owner=True)
+        shared.population[:] = initial_population
+        shared.fitness[:] = np.nan if fitness is None else fitness
+
+        return shared
+
+    @classmethod
+    def attach(cls, spec):
+        """ Maps the shared blocks described by spec (the spec attribute of the creating SharedPopulation).
+
+            Returns
+            -------
+            SharedPopulation
+                A view of the same population and fitness arrays
+        """
+
+        population_block = shared_memory.SharedMemory(name=spec['population'])
+        fitness_block = shared_memory.SharedMemory(name=spec['fitness'])
+
+        return cls(population_block, fitness_block, spec['shape'], spec['dtype'])
+
+    def close(self):
+        """ Releases this process's mapping of the shared blocks.
+
+            Any arrays taken from this SharedPopulation (including a GeneticAlgorithm's population, fitness and most
+            fit individual) become invalid, so copy out anything still needed and detach it first (see detach()).
+        """
+
+        self.population = None
+        self.fitness = None
+        self.population_block.close()
+        self.fitness_block.close()
+
+    def detach(self, ga=None):
+        """ Copies the population and fitness out of shared memory into plain lists. If a GeneticAlgorithm is given,
+            it is switched over to the copies so it can still be used after the blocks are closed.
+
+            Returns
+            -------
+            tuple[list[list], list[float]]
+                The copied population and fitness
+        """
+
+        population = self.population.tolist()
+        fitness = self.fitness.tolist()
+
+        if ga is not None:
+            ga.population = population
+            ga.setFitness(fitness)
+
+        return population, fitness
+
+    def unlink(self):
+        """ Closes and frees the shared blocks. Only the creating process should call this. """
+
+        self.close()
+
+        if self.owner:
+            self.population_block.unlink()
+            self.fitness_block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.unlink()
@@ -2,7 +2,7 @@
 © 2025 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
 SPDX License: BSD-3-Clause
 
-Last Modified: 04/09/2025
+Last Modified: 10/19/2026
 
 This package, containing the GeneticAlgorithm parent class and its children, was created to make genetic algorithm models
 that are completely agnostic to the fitness function and to the details of the population, individual genetics, or
@@ -16,8 +16,37 @@ The fitness function (and therefore calculating the fitness of the population) a
 is to be handled outside the GeneticAlgorithm class and its children. This is to account for complex simulation-based
 fitness calculations, which could be calculated in other programs/programming languages, and so all models and their
 methods will be able to handle any properly encoded population.
+
+SharedPopulation stores the population and fitness in shared memory, so fitness can be calculated by worker processes
+that write their results in place.
+
+CMAES is a covariance matrix adaptation evolution strategy for real-valued genomes; it replaces the whole population
+every cycle, so each generation can be evaluated as one batch. DifferentialEvolution works the same way, with its
+selection applied when the trial fitness values are passed to setFitness. NSGA2 is a multi-objective genetic algorithm
+whose fitness values are sequences of objectives; it evaluates in batches the same way and keeps a Pareto front.
+
+GenomeSchema holds per-gene bounds for real-valued genomes and repairs genes that crossover or mutation moved outside
+them.
+
+Every genetic algorithm draws its random numbers from its own RandomStream (a seedable numpy Generator that buffers
+single draws), so runs can be repeated from a seed, and independent streams can be spawned for parallel workers or
+islands.
+
+DiversityTracker keeps the pairwise distances of a population up to date with O(n) work per replaced individual
+(GeneticAlgorithm.track_diversity attaches one); Microbial can use it for fitness sharing in its tournaments.
+
+PackedMicrobial is a Microbial Genetic Algorithm for binary genomes stored bit-packed in uint64 words (see bitpacked),
+so long bitstrings stay small in memory and crossover, mutation and Hamming distances are bitwise operations.
 """
 
+from genalgs.RandomStream import RandomStream
+from genalgs.DiversityTracker import DiversityTracker
 from genalgs.GeneticAlgorithm import GeneticAlgorithm
+from genalgs.GenomeSchema import GenomeSchema
 from genalgs.Microbial import Microbial
 from genalgs.Recombination import Recombination
+from genalgs.PackedMicrobial import PackedMicrobial
+from genalgs.EvolutionStrategy import CMAES
+from genalgs.DifferentialEvolution import DifferentialEvolution
+from genalgs.NSGA2 import NSGA2
+from genalgs.SharedPopulation import SharedPopulation
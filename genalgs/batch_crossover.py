@@ -0,0 +1,91 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+batch_crossover.py
+
+Last Modified: 10/19/2026
+
+Vectorized crossover kernels. Each mask function draws the random numbers for many (winner, loser) pairs at once and
+returns a (pairs, genome length) boolean mask of the genes the loser takes from the winner; crossover_batch then
+applies the masks to a 2-D population in one NumPy call. The masks follow the same rules as the one-pair versions in
+Microbial and Recombination.
+
+Every mask function takes the rng to draw from (a RandomStream or np.random.Generator, normally the rng of the genetic
+algorithm); without one, a module-level generator is used.
+"""
+
+import numpy as np
+
+_rng = np.random.default_rng()
+
+
+def uniform_masks(pairs, length, prob_reproduction, rng=None):
+    """ Uniform crossover: each gene is taken from the winner with probability prob_reproduction. """
+
+    rng = _rng if rng is None else rng
+    return rng.uniform(0, 1, (pairs, length)) <= prob_reproduction
+
+
+def point_masks(pairs, length, rng=None):
+    """ Single-point crossover: from a random point (inclusive) to the end of the genome, genes are taken from the
+        winner.
+    """
+
+    rng = _rng if rng is None else rng
+    points = rng.integers(0, length, pairs)
+    return np.arange(length) >= points[:, None]
+
+
+def two_point_masks(pairs, length, rng=None):
+    """ Two-point crossover: between two distinct random points (both inclusive), genes are taken from the winner. """
+
+    rng = _rng if rng is None else rng
+    first = rng.integers(0, length, pairs)
+    second = rng.integers(0, length - 1, pairs)
+    second += second >= first
+
+    low = np.minimum(first, second)[:, None]
+    high = np.maximum(first, second)[:, None]
+    genes = np.arange(length)
+
+    return (genes >= low) & (genes <= high)
+
+
+def crossover_masks(method, pairs, length, prob_reproduction=0.5, rng=None):
+    """ Returns the masks for a Recombination crossover_method: 0 is uniform, 1 single-point and 2 two-point. """
+
+    if method == 0:
+        return uniform_masks(pairs, length, prob_reproduction, rng)
+    elif method == 1:
+        return point_masks(pairs, length, rng)
+    else:
+        return two_point_masks(pairs, length, rng)
+
+
+def crossover_batch(population, winners, losers, masks):
+    """ Copies the masked genes of each winner into its loser, for all pairs at once.
+
+        Parameters
+        ----------
+        population : np.ndarray
+            A 2-D (population size, genome length) array, modified in place
+        winners : array_like
+            The index of the winner of each pair
+        losers : array_like
+            The index of the loser of each pair (they should be distinct, or later pairs overwrite earlier ones)
+        masks : np.ndarray
+            A (pairs, genome length) boolean mask of the genes each loser takes from its winner
+
+        Returns
+        -------
+        np.ndarray
+            The population
+    """
+
+    winners = np.asarray(winners)
+    losers = np.asarray(losers)
+
+    population[losers] = np.where(masks, population[winners], population[losers])
+
+    return population
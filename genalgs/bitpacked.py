@@ -0,0 +1,119 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+bitpacked.py
+
+Last Modified: 10/19/2026
+
+Bit-packed binary genomes. A population of n genomes of `length` bits is stored as an (n, words) array of uint64, with
+gene j in bit j % 64 of word j // 64 and unused bits of the last word always 0. Crossover and infection are bitwise
+masks, mutation is an XOR, and Hamming distances are popcounts. The mask functions take an rng as in batch_crossover.
+"""
+
+import numpy as np
+
+from genalgs import batch_crossover
+
+WORD_BITS = 64
+
+_rng = np.random.default_rng()
+
+# Popcount of every byte, for NumPy versions without np.bitwise_count
+_BYTE_COUNTS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+
+def num_words(length):
+    """ The number of uint64 words needed for a genome of `length` bits. """
+
+    return -(-length // WORD_BITS)
+
+
+def pack(bits):
+    """ Packs an (n, length) array of 0/1 values (or a single genome) into an (n, words) uint64 array. """
+
+    bits = np.atleast_2d(np.asarray(bits)).astype(bool)
+    n, length = bits.shape
+
+    padded = np.zeros((n, num_words(length) * WORD_BITS), dtype=bool)
+    padded[:, :length] = bits
+
+    return np.ascontiguousarray(np.packbits(padded, axis=1, bitorder="little")).view("<u8")
+
+
+def unpack(words, length):
+    """ Unpacks an (n, words) uint64 array (or a single packed genome) into an (n, length) uint8 array of 0/1 values.
+    """
+
+    words = np.ascontiguousarray(np.atleast_2d(words), dtype="<u8")
+    return np.unpackbits(words.view(np.uint8), axis=1, bitorder="little")[:, :length]
+
+
+def valid_mask(length):
+    """ The (words,) uint64 mask of the bits that belong to a genome of `length` bits. """
+
+    mask = np.full(num_words(length), np.iinfo(np.uint64).max, dtype=np.uint64)
+    if length % WORD_BITS:
+        mask[-1] = np.uint64((1 << (length % WORD_BITS)) - 1)
+    return mask
+
+
+def uniform_masks(pairs, length, prob_reproduction, rng=None):
+    """ Packed uniform crossover masks: each bit is set with probability prob_reproduction. For a probability of 0.5
+        the words are drawn directly, without one random number per gene.
+    """
+
+    rng = _rng if rng is None else rng
+
+    if prob_reproduction == 0.5:
+        words = np.frombuffer(rng.bytes(pairs * num_words(length) * 8), dtype="<u8")
+        return words.reshape(pairs, num_words(length)) & valid_mask(length)
+
+    return pack(rng.uniform(0, 1, (pairs, length)) <= prob_reproduction)
+
+
+def crossover_masks(method, pairs, length, prob_reproduction=0.5, rng=None):
+    """ Packed masks for a Recombination crossover_method: 0 is uniform, 1 single-point and 2 two-point. The points
+        are drawn as in batch_crossover.
+    """
+
+    if method == 0:
+        return uniform_masks(pairs, length, prob_reproduction, rng)
+
+    return pack(batch_crossover.crossover_masks(method, pairs, length, rng=rng))
+
+
+def crossover(winners, losers, masks):
+    """ Returns the losers with the masked bits taken from the winners: (w & m) | (l & ~m). """
+
+    return (winners & masks) | (losers & ~masks)
+
+
+def flip(words, rows, genes):
+    """ Flips one gene in each of the given rows of a packed population, in place. """
+
+    words[rows, np.asarray(genes) // WORD_BITS] ^= np.left_shift(np.uint64(1),
+                                                                 (np.asarray(genes) % WORD_BITS).astype(np.uint64))
+
+
+def popcount(words):
+    """ The number of set bits in each row of a packed array. """
+
+    words = np.ascontiguousarray(np.atleast_2d(words), dtype="<u8")
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+
+    return _BYTE_COUNTS[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+def hamming(words, index):
+    """ The Hamming distance from the genome at `index` to every genome of a packed population. """
+
+    return popcount(words ^ words[index])
+
+
+def hamming_matrix(words):
+    """ The (n, n) matrix of pairwise Hamming distances of a packed population. """
+
+    return np.stack([hamming(words, i) for i in range(len(words))])
@@ -0,0 +1,161 @@
+import io
+
+from pyrosim.nndf import NNDF
+
+from pyrosim.linksdf  import LINK_SDF
+
+from pyrosim.linkurdf import LINK_URDF
+
+from pyrosim.model import MODEL
+
+from pyrosim.sdf   import SDF
+
+from pyrosim.urdf  import URDF
+
+from pyrosim.joint import JOINT
+
+SDF_FILETYPE  = 0
+
+URDF_FILETYPE = 1
+
+NNDF_FILETYPE   = 2
+
+class BUILDER:
+
+    """ Renders one URDF, SDF or NNDF document into an in-memory buffer.
+
+        All of the state that pyrosim used to keep in module globals (the open file, the file type, the links and
+        the link name to index map) lives on the builder, so separate builders can be used from separate threads
+        or processes without interfering with each other. Nothing touches the disk until End(), which writes the
+        finished document with a single call if a filename was given.
+    """
+
+    def __init__(self):
+
+        self.f = None
+
+        self.filename = None
+
+        self.filetype = None
+
+        self.document = None
+
+        self.model = None
+
+        self.links = []
+
+        self.availableLinkIndex = -1
+
+        self.linkNamesToIndices = {}
+
+        self.text = None
+
+    def End(self):
+
+        self.document.Save_End_Tag(self.f)
+
+        self.text = self.f.getvalue()
+
+        self.f.close()
+
+        self.f = None
+
+        if self.filename is not None:
+
+            with open(self.filename, "w") as outFile:
+
+                outFile.write(self.text)
+
+        return self.text
+
+    def Get_Bytes(self):
+
+        return self.text.encode("utf-8")
+
+    def Get_String(self):
+
+        return self.text
+
+    def Send_Cube(self,name="default",pos=[0,0,0],size=[1,1,1]):
+
+        if self.filetype == SDF_FILETYPE:
+
+            self.Start_Model(name,pos)
+
+            link = LINK_SDF(name,pos,size)
+        else:
+            link = LINK_URDF(name,pos,size)
+
+        self.links.append(link)
+
+        link.Save(self.f)
+
+        if self.filetype == SDF_FILETYPE:
+
+            self.End_Model()
+
+        self.linkNamesToIndices[name] = self.availableLinkIndex
+
+        self.availableLinkIndex = self.availableLinkIndex + 1
+
+    def Send_Joint(self,name,parent,child,type,position):
+
+        joint = JOINT(name,parent,child,type,position)
+
+        joint.Save(self.f)
+
+    def Send_Motor_Neuron(self,name,jointName):
+
+        self.f.write('    <neuron name = "' + str(name) + '" type = "motor"  jointName = "' + jointName + '" />\n')
+
+    def Send_Sensor_Neuron(self,name,linkName):
+
+        self.f.write('    <neuron name = "' + str(name) + '" type = "sensor" linkName = "' + linkName + '" />\n')
+
+    def Send_Synapse(self,sourceNeuronName,targetNeuronName,weight):
+
+        self.f.write('    <synapse sourceNeuronName = "' + str(sourceNeuronName) + '" targetNeuronName = "' + str(targetNeuronName) + '" weight = "' + str(weight) + '" />\n')
+
+    def Start_NeuralNetwork(self,filename=None):
+
+        self.Start(filename,NNDF_FILETYPE,NNDF())
+
+    def Start_SDF(self,filename=None):
+
+        self.Start(filename,SDF_FILETYPE,SDF())
+
+    def Start_URDF(self,filename=None):
+
+        self.Start(filename,URDF_FILETYPE,URDF())
+
+# ------------------- Private methods -----------------
+
+    def End_Model(self):
+
+        self.model.Save_End_Tag(self.f)
+
+    def Start(self,filename,filetype,document):
+
+        self.f = io.StringIO()
+
+        self.filename = filename
+
+        self.filetype = filetype
+
+        self.document = document
+
+        self.links = []
+
+        self.availableLinkIndex = -1
+
+        self.linkNamesToIndices = {}
+
+        self.text = None
+
+        self.document.Save_Start_Tag(self.f)
+
+    def Start_Model(self,modelName,pos):
+
+        self.model = MODEL(modelName,pos)
+
+        self.model.Save_Start_Tag(self.f)
@@ -1,46 +1,29 @@
-import pybullet as p
-
-from pyrosim.nndf import NNDF
-
-from pyrosim.linksdf  import LINK_SDF
-
-from pyrosim.linkurdf import LINK_URDF
+import threading
 
-from pyrosim.model import MODEL
-
-from pyrosim.sdf   import SDF
+import pybullet as p
 
-from pyrosim.urdf  import URDF
+from pyrosim.builder import BUILDER, SDF_FILETYPE, URDF_FILETYPE, NNDF_FILETYPE
 
-from pyrosim.joint import JOINT
+# Each thread gets its own builder, so the module-level Start/Send/End functions below can be called from
+# several threads at once without clobbering each other's documents.
 
-SDF_FILETYPE  = 0
+_builders = threading.local()
 
-URDF_FILETYPE = 1
+def Get_Builder():
 
-NNDF_FILETYPE   = 2
+    if not hasattr(_builders, "builder"):
 
-# global availableLinkIndex
+        _builders.builder = BUILDER()
 
-# global linkNamesToIndices
+    return _builders.builder
 
 def End():
 
-    if filetype == SDF_FILETYPE:
-
-        sdf.Save_End_Tag(f)
-
-    elif filetype == NNDF_FILETYPE:
-
-        nndf.Save_End_Tag(f)
-    else:
-        urdf.Save_End_Tag(f)
-
-    f.close()
+    return Get_Builder().End()
 
 def End_Model():
 
-    model.Save_End_Tag(f)
+    Get_Builder().End_Model()
 
 def Get_Touch_Sensor_Value_For_Link(linkName):
 
@@ -108,51 +91,24 @@ def Prepare_To_Simulate(bodyID):
 
 def Send_Cube(name="default",pos=[0,0,0],size=[1,1,1]):
 
-    global availableLinkIndex
-
-    global links
-
-    if filetype == SDF_FILETYPE:
-
-        Start_Model(name,pos)
-
-        link = LINK_SDF(name,pos,size)
-
-        links.append(link)
-    else:
-        link = LINK_URDF(name,pos,size)
-
-        links.append(link)
-
-    link.Save(f)
-
-    if filetype == SDF_FILETYPE:
-
-        End_Model()
-
-    linkNamesToIndices[name] = availableLinkIndex
-
-    availableLinkIndex = availableLinkIndex + 1
+    Get_Builder().Send_Cube(name,pos,size)
 
 def Send_Joint(name,parent,child,type,position):
 
-    joint = JOINT(name,parent,child,type,position)
-
-    joint.Save(f)
+    Get_Builder().Send_Joint(name,parent,child,type,position)
 
 def Send_Motor_Neuron(name,jointName):
 
-    f.write('    <neuron name = "' + str(name) + '" type = "motor"  jointName = "' + jointName + '" />\n')
+    Get_Builder().Send_Motor_Neuron(name,jointName)
 
 def Send_Sensor_Neuron(name,linkName):
 
-    f.write('    <neuron name = "' + str(name) + '" type = "sensor" linkName = "' + linkName + '" />\n')
+    Get_Builder().Send_Sensor_Neuron(name,linkName)
 
 def Send_Synapse( sourceNeuronName , targetNeuronName , weight ):
 
-    f.write('    <synapse sourceNeuronName = "' + str(sourceNeuronName) + '" targetNeuronName = "' + str(targetNeuronName) + '" weight = "' + str(weight) + '" />\n')
+    Get_Builder().Send_Synapse(sourceNeuronName,targetNeuronName,weight)
 
- 
 def Set_Motor_For_Joint(bodyIndex,jointName,controlMode,targetPosition,maxForce):
 
     p.setJointMotorControl2(
@@ -169,80 +125,16 @@ def Set_Motor_For_Joint(bodyIndex,jointName,controlMode,targetPosition,maxForce)
 
 def Start_NeuralNetwork(filename):
 
-    global filetype
-
-    filetype = NNDF_FILETYPE
-
-    global f
-
-    f = open(filename,"w")
-
-    global nndf
-
-    nndf = NNDF()
-
-    nndf.Save_Start_Tag(f)
+    Get_Builder().Start_NeuralNetwork(filename)
 
 def Start_SDF(filename):
 
-    global availableLinkIndex
-
-    availableLinkIndex = -1
-
-    global linkNamesToIndices
-
-    linkNamesToIndices = {}
-
-    global filetype
-
-    filetype = SDF_FILETYPE
-
-    global f
- 
-    f = open(filename,"w")
-
-    global sdf
-
-    sdf = SDF()
-
-    sdf.Save_Start_Tag(f)
-
-    global links
-
-    links = []
+    Get_Builder().Start_SDF(filename)
 
 def Start_URDF(filename):
 
-    global availableLinkIndex
-
-    availableLinkIndex = -1
-
-    global linkNamesToIndices
-
-    linkNamesToIndices = {}
-
-    global filetype
-
-    filetype = URDF_FILETYPE
-
-    global f
-
-    f = open(filename,"w")
-
-    global urdf 
-
-    urdf = URDF()
-
-    urdf.Save_Start_Tag(f)
-
-    global links
-
-    links = []
+    Get_Builder().Start_URDF(filename)
 
 def Start_Model(modelName,pos):
 
-    global model 
-
-    model = MODEL(modelName,pos)
-
-    model.Save_Start_Tag(f)
+    Get_Builder().Start_Model(modelName,pos)
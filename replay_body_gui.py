@@ -0,0 +1,110 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+replay_body_gui.py
+
+Last Modified: 10/19/2026
+"""
+import pybullet as p
+import pybullet_data
+import pyrosim.pyrosim as ps
+import numpy as np
+import time
+
+from simulate_body_gui import move_camera
+from simulate_body_nogui import load_trajectory
+
+# Keys used to control playback (pybullet key codes)
+PAUSE_KEY = ord(' ')
+SEEK_BACK_KEY = p.B3G_LEFT_ARROW
+SEEK_FORWARD_KEY = p.B3G_RIGHT_ARROW
+
+
+def replay_body_gui(body: str, trajectory, speed=1.0, start=0, frame_skip=1, seek_step=500, step_rate=240):
+    """ Replays a trajectory recorded by simulate_body(..., record=filename) in the GUI without running any physics.
+
+        Each displayed frame just places the body with resetBasePositionAndOrientation and resetJointState, so
+        playback can run at any speed, start anywhere in the run and skip frames.
+
+        Controls: space pauses/resumes, the left and right arrow keys seek back and forward by seek_step steps, and
+        I/J/K/L move the camera as in simulate_body_gui.
+
+        Parameters
+        ----------
+        body : str
+            The URDF file of the body that was recorded
+        trajectory : str or dict
+            The .npz file written by the recording, or the dict returned by load_trajectory
+        speed : float, optional
+            Playback speed as a multiple of simulated time (default is 1.0)
+        start : int, optional
+            The recorded sample to start playback from (default is 0)
+        frame_skip : int, optional
+            Only every frame_skip-th recorded sample is displayed (default is 1)
+        seek_step : int, optional
+            The number of recorded samples one arrow key press seeks by (default is 500)
+        step_rate : float, optional
+            Recorded steps per simulated second (default is 240, pybullet's default time step)
+
+        Returns
+        -------
+        float
+            The final distance between the body and its starting position in the recording
+    """
+
+    if isinstance(trajectory, str):
+        trajectory = load_trajectory(trajectory)
+
+    base_pos = trajectory['base_pos']
+    base_orn = trajectory['base_orn']
+    joint_angles = trajectory['joint_angles']
+    joint_names = [name.encode() for name in trajectory['joint_names']]
+    steps = len(base_pos)
+    stride = int(trajectory.get('stride', 1))
+
+    p.connect(p.GUI)
+    p.configureDebugVisualizer(p.COV_ENABLE_GUI, 0)
+    p.setAdditionalSearchPath(pybullet_data.getDataPath())
+
+    # Same 500x500 ground as the simulation, for reference only (no physics is stepped)
+    half_extents = [250, 250, 0.1]
+    plane_visual = p.createVisualShape(shapeType=p.GEOM_BOX, halfExtents=half_extents, rgbaColor=[0.6, 0.6, 0.6, 1])
+    p.createMultiBody(baseMass=0, baseVisualShapeIndex=plane_visual, basePosition=[0, 0, -0.1])
+
+    robot_id = p.loadURDF(body)
+    ps.Prepare_To_Simulate(robot_id)
+    joint_indices = [ps.jointNamesToIndices[name] for name in joint_names]
+
+    frame_time = frame_skip * stride / (step_rate * speed)
+    paused = False
+    i = max(0, min(start, steps - 1))
+
+    print(f"Replaying {body} from step {i} of {steps}...")
+
+    while i < steps:
+        keys = p.getKeyboardEvents()
+
+        if keys.get(PAUSE_KEY, 0) & p.KEY_WAS_TRIGGERED:
+            paused = not paused
+        if keys.get(SEEK_BACK_KEY, 0) & p.KEY_WAS_TRIGGERED:
+            i = max(0, i - seek_step)
+        if keys.get(SEEK_FORWARD_KEY, 0) & p.KEY_WAS_TRIGGERED:
+            i = min(steps - 1, i + seek_step)
+
+        p.resetBasePositionAndOrientation(robot_id, base_pos[i].tolist(), base_orn[i].tolist())
+        for joint, angle in zip(joint_indices, joint_angles[i].tolist()):
+            p.resetJointState(robot_id, joint, angle)
+
+        move_camera()
+        time.sleep(frame_time)
+
+        if not paused:
+            i += frame_skip
+
+    p.disconnect()
+
+    distance = float(np.linalg.norm(base_pos[-1] - base_pos[0]))
+    print(f"Final Distance: {distance}")
+
+    return distance
@@ -4,42 +4,128 @@ SPDX License: BSD-3-Clause
 
 simulate_body_nogui.py
 
-Last Modified: 11/18/2024
+Last Modified: 10/19/2026
 """
 import pybullet as p
 import pybullet_data
 import pyrosim.pyrosim as ps
 import numpy as np
-import time
-import math
-from matplotlib import pyplot as plt
+
+from gait_engine import default_gait
+
+
+# Leg joints driven by the simulation, in leg order
+LEG_JOINTS = [b'Body_Leg1', b'Body_Leg2', b'Body_Leg3', b'Body_Leg4']
+
+# Fields that can be captured into a trajectory buffer and the number of columns each one takes
+TRAJECTORY_FIELDS = {
+    'pos': 3,           # base position (x, y, z)
+    'orn': 4,           # base orientation quaternion (x, y, z, w)
+    'joints': 4,        # leg joint angles
+    'joint_vel': 4,     # leg joint velocities
+}
+
+# Named physics profiles: parameters for setPhysicsEngineParameter and the ground shape. "default" keeps pybullet's
+# default engine parameters and the 500x500 box the bodies have always been simulated on. Every profile keeps the
+# 1/240 s time step, so a given duration is the same amount of simulated time whichever profile is used.
+PHYSICS_PROFILES = {
+    'fast': {
+        'engine': {'numSolverIterations': 10, 'enableConeFriction': 0, 'deterministicOverlappingPairs': 0},
+        'ground': 'plane',
+    },
+    'default': {
+        'engine': {},
+        'ground': 'box',
+    },
+    'accurate': {
+        'engine': {'numSolverIterations': 150, 'numSubSteps': 4},
+        'ground': 'box',
+    },
+}
 
 
 def get_distances(positions):
-    distances = [None] * len(positions)
+    """ Returns the distance of every position from the first one, computed with one vectorized norm. """
+    positions = np.asarray(positions)
+    return np.linalg.norm(positions - positions[0], axis=1)
 
-    for i in range(len(positions)):
-        position = positions[i]
 
-        distance = math.sqrt((positions[0][0] - position[0]) ** 2 +
-                             (positions[0][1] - position[1]) ** 2 +
-                             (positions[0][2] - position[2]) ** 2)
+def sample_steps(duration: int, stride: int = 1):
+    """ Returns the simulation steps that are sampled for a given stride: every stride-th step, plus the final step so
+        the final distance is always captured.
+    """
+    steps = np.arange(0, duration, stride)
+    if steps[-1] != duration - 1:
+        steps = np.append(steps, duration - 1)
+    return steps
 
-        distances[i] = distance
 
-    return distances
+def trajectory_columns(capture):
+    """ Returns a dict mapping each captured field to its column slice in the trajectory buffer. """
+    columns = {}
+    start = 0
+    for field in capture:
+        columns[field] = slice(start, start + TRAJECTORY_FIELDS[field])
+        start += TRAJECTORY_FIELDS[field]
+    return columns
 
 
-def simulate_body(body:str, duration=10000, amplitude=(1, -1, -1, 1), phase_offset=(0, 0, 0, 0)):
-    # Configuration
+def save_trajectory(filename: str, base_pos, base_orn, joint_angles, joint_names, stride=1):
+    """ Saves a recorded state trajectory as a compressed .npz file of float32 arrays: base position (samples, 3), base
+        orientation quaternion (samples, 4) and joint angles (samples, joints), plus the joint names they belong to and
+        the number of simulation steps between samples.
+    """
+    np.savez_compressed(filename,
+                        base_pos=np.asarray(base_pos, dtype=np.float32),
+                        base_orn=np.asarray(base_orn, dtype=np.float32),
+                        joint_angles=np.asarray(joint_angles, dtype=np.float32),
+                        joint_names=np.array(joint_names),
+                        stride=stride)
 
-    # No GUI version (much faster)
-    p.connect(p.DIRECT)
-    p.setAdditionalSearchPath(pybullet_data.getDataPath())
-    p.setGravity(0, 0, -9.8)
-    p.setRealTimeSimulation(0)
 
-    # Create plane for robot
+def load_trajectory(filename: str):
+    """ Loads a trajectory saved by save_trajectory and returns it as a dict of arrays. """
+    with np.load(filename) as data:
+        return {key: data[key] for key in data.files}
+
+
+def body_volume(robot_id):
+    """ Returns the total volume of the collision shapes of a body (boxes, spheres, cylinders and capsules). """
+    volume = 0.0
+    for link in range(-1, p.getNumJoints(robot_id)):
+        for shape in p.getCollisionShapeData(robot_id, link):
+            geometry, dimensions = shape[2], shape[3]
+            if geometry == p.GEOM_BOX:
+                volume += dimensions[0] * dimensions[1] * dimensions[2]
+            elif geometry == p.GEOM_SPHERE:
+                volume += 4 / 3 * np.pi * dimensions[0] ** 3
+            elif geometry == p.GEOM_CYLINDER:
+                volume += np.pi * dimensions[1] ** 2 * dimensions[0]
+            elif geometry == p.GEOM_CAPSULE:
+                volume += np.pi * dimensions[1] ** 2 * (dimensions[0] + 4 / 3 * dimensions[1])
+    return volume
+
+
+def get_profile(profile):
+    """ Returns the physics profile dict for a profile name from PHYSICS_PROFILES, or the profile itself if it is
+        already a dict with 'engine' and 'ground' entries.
+    """
+    if isinstance(profile, dict):
+        return profile
+
+    try:
+        return PHYSICS_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown physics profile {profile!r}, expected one of {list(PHYSICS_PROFILES)}") from None
+
+
+def create_ground(ground: str = 'box'):
+    """ Creates the ground: 'box' is a 500x500 box with its top face at z = 0, 'plane' an infinite plane at z = 0. """
+    if ground == 'plane':
+        # pybullet has no visual shape for planes, so the plane is collision-only (there is no GUI here anyway)
+        plane_collision = p.createCollisionShape(p.GEOM_PLANE)
+        return p.createMultiBody(baseMass=0, baseCollisionShapeIndex=plane_collision)
+
     # Define half extents for a 500x500 plane
     half_extents = [250, 250, 0.1]
 
@@ -54,26 +140,121 @@ def simulate_body(body:str, duration=10000, amplitude=(1, -1, -1, 1), phase_offs
     )
 
     # Create the multibody with both collision and visual shapes
-    plane_body = p.createMultiBody(
+    return p.createMultiBody(
         baseMass=0,
         baseCollisionShapeIndex=plane_collision,
         baseVisualShapeIndex=plane_visual,
         basePosition=[0, 0, -0.1]
     )
 
+
+def simulate_body(body:str, duration=10000, amplitude=(1, -1, -1, 1), phase_offset=(0, 0, 0, 0), record: str = None,
+                  on_step=None, capture=None, stride=None, checkpoints=(), on_checkpoint=None, profile='default',
+                  control_every=1, control_interpolation='hold', gait=None, measures=None):
+    """ Simulates the body without a GUI and returns its distance from the starting position at every sampled step.
+
+        The base position is written into a preallocated array every stride-th step (and at the final step), and the
+        distances are computed from it with one vectorized norm. The stride defaults to control_every, so with the
+        default of 1 every step is sampled.
+
+        Motor targets are sent every control_every physics steps (the physics step itself is unchanged), which cuts the
+        Python overhead per simulated second roughly control_every-fold. In between, the motors keep tracking the last
+        target. With control_interpolation='hold' the target is the driver value at the control step; with
+        'interpolate' it is the driver interpolated at the middle of the control_every-step window, which halves the
+        lag behind the original drivers. With control_every=1 both reproduce the original simulation.
+
+        The motor targets come from gait (a gait_engine.Gait, for any list of joints), or if it is None from the
+        original four-leg drivers with the given amplitude and phase_offset. The whole target table is cached by the
+        gait parameters and each control step sends one row of it with setJointMotorControlArray.
+
+        If capture is a sequence of fields from TRAJECTORY_FIELDS (e.g. ('pos', 'orn', 'joints')), those fields are
+        also written into one preallocated (samples, k) float32 array, and (distances, trajectory) is returned instead,
+        where trajectory is a dict with:
+            * 'data' - the (samples, k) float32 buffer
+            * 'steps' - the simulation step of each sample
+            * one entry per captured field, a view of its columns in 'data'
+
+        If record is a filename, the base pose and the leg joint angles are also saved there (see save_trajectory) so
+        the run can be replayed in the GUI with replay_body_gui without re-running the physics.
+
+        If on_step is given, it is called as on_step(step, robot_id) after every simulation step (used, for example,
+        to grab camera frames while the body walks).
+
+        If on_checkpoint is given, it is called as on_checkpoint(steps, distance) once each number of steps in
+        checkpoints has been simulated (these steps are always sampled). If it returns False the simulation stops
+        there and the distances (and trajectory) up to that point are returned. The motor drivers are always built for
+        the full duration, so a run stopped early is identical to the start of the full run.
+
+        profile selects the physics engine parameters and ground shape, by name from PHYSICS_PROFILES or as a dict of
+        the same form. The default profile reproduces the original simulation.
+
+        If measures is a dict, the cost of the walk is written into it:
+            * 'volume' - the total volume of the body's links (m^3)
+            * 'effort' - the mechanical work of the motors (J), the sum of |torque * velocity| * dt over the driven
+              joints, read with one getJointStates call per step
+    """
+    # Configuration
+    if control_interpolation not in ('hold', 'interpolate'):
+        raise ValueError(f"control_interpolation must be 'hold' or 'interpolate', not {control_interpolation!r}")
+
+    if stride is None:
+        stride = control_every
+
+    # No GUI version (much faster)
+    p.connect(p.DIRECT)
+    p.setAdditionalSearchPath(pybullet_data.getDataPath())
+    p.setGravity(0, 0, -9.8)
+    p.setRealTimeSimulation(0)
+
+    # Physics engine parameters and ground for robot
+    profile = get_profile(profile)
+    if profile['engine']:
+        p.setPhysicsEngineParameter(**profile['engine'])
+
+    plane_body = create_ground(profile['ground'])
+
     # Load plane and robot body
     robot_id = p.loadURDF(body)
 
     # Prepare body for simulation
     ps.Prepare_To_Simulate(robot_id)
-    body_pos = [None] * duration
+    joint_indices = [ps.jointNamesToIndices[name] for name in LEG_JOINTS]
+
+    if measures is not None:
+        measures['volume'] = body_volume(robot_id)
+        time_step = p.getPhysicsEngineParameters()['fixedTimeStep']
+        power = 0.0
+
+    # Preallocated buffers for the sampled steps
+    steps = sample_steps(duration, stride)
+    is_checkpoint = np.zeros(duration, dtype=bool)
+    if on_checkpoint is not None:
+        is_checkpoint[[step - 1 for step in checkpoints if 0 < step <= duration]] = True
+        steps = np.union1d(steps, np.flatnonzero(is_checkpoint))
 
-    # Prepare driver functions for motors
-    x = np.linspace(0, 0.003 * duration * np.pi, duration)
-    y_1 = amplitude[0] * np.sin(x + phase_offset[0])
-    y_2 = amplitude[1] * np.cos(x + phase_offset[1])
-    y_3 = amplitude[2] * np.cos(x + phase_offset[2])
-    y_4 = amplitude[3] * np.sin(x + phase_offset[3])
+    body_pos = np.empty((len(steps), 3))
+    is_sampled = np.zeros(duration, dtype=bool)
+    is_sampled[steps] = True
+
+    fields = list(capture) if capture is not None else []
+    if record is not None:
+        fields.extend(field for field in ('pos', 'orn', 'joints') if field not in fields)
+
+    columns = trajectory_columns(fields)
+    trajectory = np.empty((len(steps), sum(TRAJECTORY_FIELDS[field] for field in fields)), dtype=np.float32)
+    capture_pos = columns.get('pos')
+    capture_orn = columns.get('orn')
+    capture_joints = columns.get('joints')
+    capture_joint_vel = columns.get('joint_vel')
+    capture_states = capture_joints is not None or capture_joint_vel is not None
+
+    # Motor targets for the control steps (every control_every-th step), cached by gait parameters
+    if gait is None:
+        gait = default_gait(LEG_JOINTS, amplitude, phase_offset)
+
+    targets = gait.table(duration, control_every, control_interpolation)
+    gait_indices = [ps.jointNamesToIndices[name] for name in gait.joints]
+    forces = [gait.max_force] * len(gait)
 
     # Progress Measuring Setup
     ten_percent = duration//10
@@ -81,54 +262,73 @@ def simulate_body(body:str, duration=10000, amplitude=(1, -1, -1, 1), phase_offs
 
     # Begin simulation loop
     #print(f"Starting Simulation of {body}...")
+    row = 0
     for i in range(duration):
 
-        # Set position of Leg 1
-        ps.Set_Motor_For_Joint(bodyIndex=robot_id,
-                               jointName=b'Body_Leg1',
-                               controlMode=p.POSITION_CONTROL,
-                               targetPosition=y_1[i],
-                               maxForce=500)
-
-        # Set position of Leg 2
-        ps.Set_Motor_For_Joint(bodyIndex=robot_id,
-                               jointName=b'Body_Leg2',
-                               controlMode=p.POSITION_CONTROL,
-                               targetPosition=y_2[i],
-                               maxForce=500)
-
-        # Set position of Leg 3
-        ps.Set_Motor_For_Joint(bodyIndex=robot_id,
-                               jointName=b'Body_Leg3',
-                               controlMode=p.POSITION_CONTROL,
-                               targetPosition=y_3[i],
-                               maxForce=500)
-
-        # Set position of Leg 4
-        ps.Set_Motor_For_Joint(bodyIndex=robot_id,
-                               jointName=b'Body_Leg4',
-                               controlMode=p.POSITION_CONTROL,
-                               targetPosition=y_4[i],
-                               maxForce=500)
+        # Send motor targets on control steps; in between the motors keep tracking the last targets
+        if i % control_every == 0:
+            p.setJointMotorControlArray(robot_id, gait_indices, p.POSITION_CONTROL,
+                                        targetPositions=targets[i // control_every], forces=forces)
 
         # Next step in simulation
         p.stepSimulation()
 
-        # Record current position of body's center
-        body_pos[i] = p.getBasePositionAndOrientation(robot_id)[0]
+        # Record current position of body's center (and any captured state) on sampled steps
+        if is_sampled[i]:
+            position, orientation = p.getBasePositionAndOrientation(robot_id)
+            body_pos[row] = position
+
+            if capture_pos is not None:
+                trajectory[row, capture_pos] = position
+            if capture_orn is not None:
+                trajectory[row, capture_orn] = orientation
+            if capture_states:
+                states = p.getJointStates(robot_id, joint_indices)
+                if capture_joints is not None:
+                    trajectory[row, capture_joints] = [state[0] for state in states]
+                if capture_joint_vel is not None:
+                    trajectory[row, capture_joint_vel] = [state[1] for state in states]
+
+            row += 1
+
+        # Motor power of the driven joints on every step, so the effort does not depend on the sampling stride
+        if measures is not None:
+            states = p.getJointStates(robot_id, gait_indices)
+            power += sum(abs(state[1] * state[3]) for state in states)
+
+        if on_step is not None:
+            on_step(i, robot_id)
+
+        if is_checkpoint[i]:
+            distance = float(np.linalg.norm(body_pos[row - 1] - body_pos[0]))
+            if on_checkpoint(i + 1, distance) is False:
+                break
 
         # Uncomment for print out
         # if i % ten_percent == 0:
         #     percent_complete += 10
         #     print(f"{percent_complete}% Complete")
 
+    if measures is not None:
+        measures['effort'] = power * time_step
+
     p.disconnect()
 
+    # Drop the unused rows if the run was stopped at a checkpoint
+    body_pos = body_pos[:row]
+    trajectory = trajectory[:row]
+    steps = steps[:row]
+
+    if record is not None:
+        save_trajectory(record, trajectory[:, columns['pos']], trajectory[:, columns['orn']],
+                        trajectory[:, columns['joints']], [name.decode() for name in LEG_JOINTS], stride)
+
     #print("Simulation Complete")
 
     body_dist = get_distances(body_pos)
     # print(f"Final Distance: {body_dist[-1]}")
     #
+    # from matplotlib import pyplot as plt
     # plt.plot(body_dist, 'b')
     #
     # plt.title("Distance between Body and Starting Position")
@@ -137,4 +337,10 @@ def simulate_body(body:str, duration=10000, amplitude=(1, -1, -1, 1), phase_offs
     #
     # plt.show()
 
+    if capture is not None:
+        captured = {field: trajectory[:, columns[field]] for field in capture}
+        captured['data'] = trajectory
+        captured['steps'] = steps
+        return body_dist, captured
+
     return body_dist
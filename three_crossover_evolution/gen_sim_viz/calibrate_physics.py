@@ -0,0 +1,116 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+calibrate_physics.py
+
+Last Modified: 10/19/2026
+
+Measures the speed/accuracy tradeoff of the physics profiles in simulate_body_nogui.PHYSICS_PROFILES: every profile
+simulates the same seeded sample of random bodies, and is reported with its simulation steps per second and the
+Spearman rank correlation of its fitness values with those of a reference profile. A cheap profile that ranks bodies
+like the reference is a good choice for search, and the reference can be kept for final validation.
+
+Run it with:
+    python -m three_crossover_evolution.gen_sim_viz.calibrate_physics [num_bodies] [duration]
+"""
+
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+import three_crossover_evolution.gen_sim_viz.generate_body as gb
+import simulate_body_nogui as sb
+from three_crossover_evolution.gen_sim_viz.multi_fidelity import spearman
+
+
+def _time_body(args):
+    """ Simulates one body with a profile and returns (fitness, wall-clock seconds spent simulating). """
+
+    body_dims, profile, duration = args
+    urdf = gb.generate_body_fast(f"calibrate{os.getpid()}", body_dims)
+
+    try:
+        start = time.perf_counter()
+        distance = float(sb.simulate_body(urdf, duration=duration, profile=profile)[-1])
+        return distance, time.perf_counter() - start
+    finally:
+        os.remove(urdf)
+
+
+def sample_bodies(num_bodies=32, seed=0):
+    """ Returns a seeded sample of random bodies drawn within the body parameter bounds. """
+
+    from three_crossover_evolution.gen_sim_viz.evolution_trial import body_schema
+
+    schema = body_schema()
+    return np.random.default_rng(seed).uniform(schema.lower, schema.upper, (num_bodies, len(schema))).tolist()
+
+
+def calibrate_profiles(profiles=None, reference="accurate", num_bodies=32, duration=10000, seed=0, processes=None):
+    """ Simulates a seeded body sample with each physics profile and compares them with the reference profile.
+
+        Parameters
+        ----------
+        profiles : list[str], optional
+            Profile names from PHYSICS_PROFILES (default is all of them)
+        reference : str, optional
+            The profile the others are compared with (default is "accurate")
+        num_bodies : int, optional
+            The number of random bodies (default is 32)
+        duration : int, optional
+            Simulation steps per body (default is 10000)
+        seed : int, optional
+            Seed for the body sample (default is 0)
+        processes : int, optional
+            Worker processes to simulate with (default is the number of CPUs). Steps per second are measured per
+            worker, so they do not depend on this.
+
+        Returns
+        -------
+        dict[str, dict]
+            For each profile: 'steps_per_second', 'spearman' (with the reference fitness values), 'mean_abs_error'
+            (mean absolute fitness difference from the reference) and 'fitness'
+    """
+
+    profiles = list(profiles or sb.PHYSICS_PROFILES)
+    if reference not in profiles:
+        profiles.append(reference)
+
+    bodies = sample_bodies(num_bodies, seed)
+    results = {}
+
+    with Pool(processes) as pool:
+        for profile in profiles:
+            timed = pool.map(_time_body, [(body, profile, duration) for body in bodies])
+            fitness = np.array([distance for distance, _ in timed])
+            seconds = sum(elapsed for _, elapsed in timed)
+            results[profile] = {'steps_per_second': num_bodies * duration / seconds, 'fitness': fitness}
+
+    for profile in profiles:
+        results[profile]['spearman'] = spearman(results[profile]['fitness'], results[reference]['fitness'])
+        results[profile]['mean_abs_error'] = float(np.mean(np.abs(results[profile]['fitness'] -
+                                                                  results[reference]['fitness'])))
+
+    return results
+
+
+def print_calibration(results, reference="accurate"):
+    """ Prints a calibration table from calibrate_profiles. """
+
+    print(f"{'profile':<10} {'steps/s':>10} {'speedup':>8} {'spearman':>9} {'mean |error|':>13}")
+
+    for profile, result in results.items():
+        print(f"{profile:<10} {result['steps_per_second']:>10.0f} "
+              f"{result['steps_per_second'] / results[reference]['steps_per_second']:>7.2f}x "
+              f"{result['spearman']:>9.3f} {result['mean_abs_error']:>13.3f}")
+
+
+if __name__ == "__main__":
+    num_bodies = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    duration = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    print_calibration(calibrate_profiles(num_bodies=num_bodies, duration=duration))
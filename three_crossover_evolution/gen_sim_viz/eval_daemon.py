@@ -0,0 +1,256 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+eval_daemon.py
+
+Last Modified: 10/19/2026
+
+A long-lived local evaluation daemon. It keeps a pool of worker processes with pybullet and the simulation core
+already imported, and serves batches of body evaluations over a Unix socket, so repeated interactive runs (trials,
+visualizations, hyperparameter tweaks) do not pay the import and start-up cost every time.
+
+Start it with:
+    python -m three_crossover_evolution.gen_sim_viz.eval_daemon [processes]
+
+and use EvaluationClient (or evaluate_remote) from any script in place of simulate_body.
+"""
+
+import os
+import signal
+import sys
+import tempfile
+import threading
+from multiprocessing import Pool
+from multiprocessing.connection import Client, Listener
+
+DEFAULT_ADDRESS = os.path.join(tempfile.gettempdir(), f"bmth302_eval_{os.getuid()}.sock")
+DEFAULT_AUTHKEY = b"bmth302"
+
+
+def _warm_worker():
+    """ Pool initializer: import the simulation stack and run one connect/disconnect so the first real request does
+        not pay for it.
+    """
+
+    import pybullet as p
+    import three_crossover_evolution.gen_sim_viz.parallel_evaluation
+
+    p.connect(p.DIRECT)
+    p.disconnect()
+
+
+def _evaluate(args):
+    from three_crossover_evolution.gen_sim_viz.parallel_evaluation import evaluate_body
+
+    body_dims, sim_kwargs = args
+    return evaluate_body(body_dims, **sim_kwargs)
+
+
+class EvaluationDaemon:
+    """ Serves body evaluation requests from a pool of warm pybullet workers.
+
+        Each client connection is handled on its own thread. A request carries a whole batch of bodies, which is
+        spread across the pool with one map call, and requests from several clients share the same pool.
+
+        Messages (tuples sent over a multiprocessing.connection):
+            * ('evaluate', bodies, sim_kwargs) - replies ('ok', [fitness, ...]) or ('error', message)
+            * ('ping',) - replies ('ok', number of workers)
+            * ('shutdown',) - replies ('ok', None), then stops accepting connections, lets in-flight batches finish and
+              shuts the pool down
+
+        Attributes
+        ----------
+        address : str
+            The Unix socket path the daemon listens on
+        processes : int
+            The number of worker processes
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, authkey=DEFAULT_AUTHKEY, processes=None):
+        self.address = address
+        self.authkey = authkey
+        self.processes = processes or os.cpu_count()
+
+        self.pool = None
+        self.listener = None
+        self.stopping = threading.Event()
+        self.in_flight = 0
+        self.idle = threading.Condition()
+
+    def serve(self):
+        """ Starts the worker pool and serves requests until a shutdown message or SIGINT/SIGTERM arrives. """
+
+        if os.path.exists(self.address):
+            os.remove(self.address)
+
+        self.pool = Pool(self.processes, initializer=_warm_worker)
+        self.listener = Listener(self.address, family="AF_UNIX", authkey=self.authkey)
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, lambda signum, frame: self.stop())
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+
+        print(f"Evaluation daemon listening on {self.address} with {self.processes} workers")
+
+        try:
+            while not self.stopping.is_set():
+                try:
+                    connection = self.listener.accept()
+                except (OSError, EOFError):
+                    continue
+
+                if self.stopping.is_set():
+                    connection.close()
+                    break
+
+                threading.Thread(target=self.handle, args=(connection,), daemon=True).start()
+        finally:
+            self.close()
+
+    def handle(self, connection):
+        """ Answers requests on one client connection until the client disconnects. """
+
+        with connection:
+            while True:
+                try:
+                    message = connection.recv()
+                except (EOFError, OSError):
+                    return
+
+                command = message[0]
+
+                if command == "evaluate":
+                    _, bodies, sim_kwargs = message
+                    with self.idle:
+                        if self.stopping.is_set():
+                            connection.send(("error", "Evaluation daemon is shutting down"))
+                            continue
+                        self.in_flight += 1
+                    try:
+                        fitness = self.pool.map(_evaluate, [(list(body), sim_kwargs) for body in bodies])
+                        connection.send(("ok", fitness))
+                    except Exception as e:
+                        connection.send(("error", repr(e)))
+                    finally:
+                        with self.idle:
+                            self.in_flight -= 1
+                            self.idle.notify_all()
+                elif command == "ping":
+                    connection.send(("ok", self.processes))
+                elif command == "shutdown":
+                    connection.send(("ok", None))
+                    self.stop()
+                    return
+                else:
+                    connection.send(("error", f"Unknown command {command!r}"))
+
+    def stop(self):
+        """ Stops accepting new connections and batches. The accept loop is woken up with a dummy connection. """
+
+        with self.idle:
+            if self.stopping.is_set():
+                return
+
+            self.stopping.set()
+
+        # Connect from another thread: stop() may run in a signal handler on the thread that is blocked in accept()
+        threading.Thread(target=self.wake, daemon=True).start()
+
+    def wake(self):
+        try:
+            Client(self.address, family="AF_UNIX", authkey=self.authkey).close()
+        except (OSError, EOFError):
+            pass
+
+    def close(self):
+        """ Waits for in-flight batches to be answered, then shuts the pool down and removes the socket. """
+
+        with self.idle:
+            self.idle.wait_for(lambda: self.in_flight == 0)
+
+        if self.listener is not None:
+            self.listener.close()
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+        if os.path.exists(self.address):
+            os.remove(self.address)
+
+        print("Evaluation daemon stopped")
+
+
+class EvaluationClient:
+    """ A small client for EvaluationDaemon.
+
+        Example
+        -------
+            with EvaluationClient() as client:
+                fitness = client.evaluate(bodies)
+
+        Methods
+        -------
+        evaluate(bodies, **sim_kwargs)
+            Evaluates a batch of body parameter vectors and returns their fitness values
+        ping()
+            Returns the number of workers in the daemon
+        shutdown()
+            Asks the daemon to shut down gracefully
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, authkey=DEFAULT_AUTHKEY):
+        self.connection = Client(address, family="AF_UNIX", authkey=authkey)
+
+    def request(self, *message):
+        self.connection.send(message)
+        status, result = self.connection.recv()
+
+        if status != "ok":
+            raise RuntimeError(f"Evaluation daemon error: {result}")
+
+        return result
+
+    def evaluate(self, bodies, **sim_kwargs):
+        """ Evaluates a batch of bodies in one request.
+
+            Parameters
+            ----------
+            bodies : list[list[float]]
+                Body parameter vectors
+            **sim_kwargs
+                Passed on to simulate_body (e.g. duration)
+
+            Returns
+            -------
+            list[float]
+                The fitness (final distance) of each body
+        """
+
+        return self.request("evaluate", [[float(gene) for gene in body] for body in bodies], sim_kwargs)
+
+    def ping(self):
+        return self.request("ping")
+
+    def shutdown(self):
+        self.request("shutdown")
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def evaluate_remote(bodies, address=DEFAULT_ADDRESS, authkey=DEFAULT_AUTHKEY, **sim_kwargs):
+    """ Convenience function for ad-hoc scripts: evaluates a batch of bodies on a running daemon. """
+
+    with EvaluationClient(address, authkey) as client:
+        return client.evaluate(bodies, **sim_kwargs)
+
+
+if __name__ == "__main__":
+    EvaluationDaemon(processes=int(sys.argv[1]) if len(sys.argv) > 1 else None).serve()
@@ -0,0 +1,245 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+evaluation_store.py
+
+Last Modified: 10/19/2026
+
+A persistent evaluation database shared across trials and processes. Every simulated body is recorded with a hash of
+the simulation settings that produced its fitness, so any later evaluation of the same genome under the same settings
+(in this trial, another crossover method's trial, or another run altogether) is read back instead of re-simulated. The
+table also doubles as a dataset for analysis (see rows()).
+
+SQLite runs in WAL mode, so many processes can read while one writes, and results are inserted in batches.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+import simulate_body_nogui as sb
+
+DEFAULT_PATH = "evaluations.sqlite"
+
+# simulate_body arguments that change the fitness of a body
+FITNESS_SETTINGS = ('duration', 'amplitude', 'phase_offset', 'profile', 'control_every', 'control_interpolation',
+                    'gait')
+
+# Hashes per SELECT, well under SQLite's limit on query parameters
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    genome_hash TEXT NOT NULL,
+    settings_hash TEXT NOT NULL,
+    genome BLOB NOT NULL,
+    fitness REAL NOT NULL,
+    duration INTEGER NOT NULL,
+    wall_time REAL,
+    created REAL NOT NULL,
+    PRIMARY KEY (genome_hash, settings_hash)
+);
+CREATE TABLE IF NOT EXISTS settings (
+    settings_hash TEXT PRIMARY KEY,
+    settings TEXT NOT NULL
+);
+"""
+
+
+def canonical_settings(sim_kwargs=None):
+    """ Returns the fitness-relevant simulate_body settings as a dict, with defaults filled in for anything not given.
+    """
+
+    defaults = {name: parameter.default for name, parameter in inspect.signature(sb.simulate_body).parameters.items()
+                if name in FITNESS_SETTINGS}
+    settings = dict(defaults, **{key: value for key, value in (sim_kwargs or {}).items() if key in FITNESS_SETTINGS})
+
+    # Numbers are compared as floats, and gaits by their parameters
+    settings['amplitude'] = [float(value) for value in settings['amplitude']]
+    settings['phase_offset'] = [float(value) for value in settings['phase_offset']]
+    if settings['gait'] is not None:
+        settings['gait'] = repr(settings['gait'])
+
+    return settings
+
+
+def settings_hash(sim_kwargs=None):
+    """ Returns a stable hash of the fitness-relevant simulate_body settings, and their JSON text. """
+
+    text = json.dumps(canonical_settings(sim_kwargs), sort_keys=True, default=repr)
+    return hashlib.sha1(text.encode()).hexdigest(), text
+
+
+def genome_hash(genome):
+    """ Returns the hash of a genome's exact float64 values. """
+
+    return hashlib.sha1(np.asarray(genome, dtype=np.float64).tobytes()).hexdigest()
+
+
+class EvaluationStore:
+    """ An on-disk cache and log of body evaluations.
+
+        Each process opens its own connection the first time it uses the store, so a store can be handed to worker
+        processes. Writes go through one transaction per batch.
+
+        Attributes
+        ----------
+        path : str
+            The SQLite database file
+        hits : int
+            Lookups (by this process) answered from the store
+        misses : int
+            Lookups (by this process) that had to be simulated
+
+        Methods
+        -------
+        lookup(genomes, sim_kwargs=None)
+            Returns the stored fitness of each genome, or None where it has not been evaluated with those settings
+        add(genomes, fitness, wall_time=None, sim_kwargs=None)
+            Records a batch of evaluations
+        evaluate(genomes, simulate, sim_kwargs=None)
+            Looks genomes up, simulates only the missing ones with simulate, records them and returns every fitness
+        rows(sim_kwargs=None)
+            Returns every stored evaluation (optionally only for some settings) for analysis
+    """
+
+    def __init__(self, path=DEFAULT_PATH, timeout=60.0):
+        self.path = path
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['_pid'] = None
+        return state
+
+    @property
+    def connection(self):
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def lookup(self, genomes, sim_kwargs=None):
+        """ Returns a list with the stored fitness of each genome, or None for genomes not yet evaluated with these
+            settings.
+        """
+
+        settings, _ = settings_hash(sim_kwargs)
+        hashes = [genome_hash(genome) for genome in genomes]
+        found = {}
+
+        unique = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique), _LOOKUP_CHUNK):
+            chunk = unique[start:start + _LOOKUP_CHUNK]
+            query = (f"SELECT genome_hash, fitness FROM evaluations WHERE settings_hash = ? AND genome_hash IN "
+                     f"({', '.join('?' * len(chunk))})")
+            found.update(self.connection.execute(query, [settings] + chunk).fetchall())
+
+        fitness = [found.get(key) for key in hashes]
+
+        misses = fitness.count(None)
+        self.misses += misses
+        self.hits += len(fitness) - misses
+
+        return fitness
+
+    def add(self, genomes, fitness, wall_time=None, sim_kwargs=None):
+        """ Records a batch of evaluations in one transaction. Genomes already stored with these settings are kept.
+
+            Parameters
+            ----------
+            genomes : list[list[float]]
+                The evaluated genomes
+            fitness : list[float]
+                Their fitness values
+            wall_time : float or list[float], optional
+                Seconds spent simulating each genome (a single value applies to all of them)
+            sim_kwargs : dict, optional
+                The simulate_body arguments the fitness values were computed with
+        """
+
+        settings, text = settings_hash(sim_kwargs)
+        duration = canonical_settings(sim_kwargs)['duration']
+        now = time.time()
+
+        if wall_time is None or np.ndim(wall_time) == 0:
+            wall_time = [wall_time] * len(genomes)
+
+        rows = [(genome_hash(genome), settings, np.asarray(genome, dtype=np.float64).tobytes(), float(value),
+                 duration, seconds, now) for genome, value, seconds in zip(genomes, fitness, wall_time)]
+
+        with self.connection as connection:
+            connection.execute("INSERT OR IGNORE INTO settings VALUES (?, ?)", (settings, text))
+            connection.executemany("INSERT OR IGNORE INTO evaluations VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def evaluate(self, genomes, simulate, sim_kwargs=None):
+        """ Returns the fitness of each genome, simulating (with simulate(list of genomes) -> list of fitness values)
+            and recording only those not already in the store.
+        """
+
+        fitness = self.lookup(genomes, sim_kwargs)
+        missing = [i for i, value in enumerate(fitness) if value is None]
+
+        if missing:
+            batch = [genomes[i] for i in missing]
+
+            start = time.perf_counter()
+            values = list(simulate(batch))
+            elapsed = time.perf_counter() - start
+
+            self.add(batch, values, elapsed / len(batch), sim_kwargs)
+
+            for i, value in zip(missing, values):
+                fitness[i] = value
+
+        return fitness
+
+    def rows(self, sim_kwargs=None):
+        """ Returns every stored evaluation as a list of dicts with the genome decoded to a list of floats. If
+            sim_kwargs is given, only evaluations with those settings are returned.
+        """
+
+        query = "SELECT genome, fitness, duration, wall_time, created, settings_hash FROM evaluations"
+        parameters = []
+        if sim_kwargs is not None:
+            query += " WHERE settings_hash = ?"
+            parameters.append(settings_hash(sim_kwargs)[0])
+
+        return [{'genome': np.frombuffer(genome, dtype=np.float64).tolist(), 'fitness': fitness, 'duration': duration,
+                 'wall_time': wall_time, 'created': created, 'settings_hash': settings}
+                for genome, fitness, duration, wall_time, created, settings in self.connection.execute(query, parameters)]
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+    def report(self):
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"Evaluation store: {self.hits} of {total} evaluations read from {self.path} ({rate:.1%})"
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -4,15 +4,19 @@ SPDX License: BSD-3-Clause
 
 evolution_trial.py
 
-Last Modified: 11/18/2024
+Last Modified: 10/19/2026
 """
 
+import time
+
 import three_crossover_evolution.gen_sim_viz.generate_body as gb
+import three_crossover_evolution.gen_sim_viz.novelty as novelty_search
+import three_crossover_evolution.gen_sim_viz.stability as stability
 import simulate_body_nogui as sb
-from genalgs import Microbial
+from three_crossover_evolution.gen_sim_viz.parallel_evaluation import ParallelEvaluator
+from genalgs import CMAES, DifferentialEvolution, GenomeSchema, Microbial, NSGA2, RandomStream, SharedPopulation
 
 import numpy as np
-import pandas as pd
 
 # Limits for body parameters
 body_w_lim = 5
@@ -22,36 +26,34 @@ leg_w_lim = 5
 leg_l_lim = 5
 leg_h_lim = 5
 
+# Smallest allowed value of any body parameter, so no link is (nearly) zero-sized
+dim_min = 0.05
 
-def randomize_bodies(num_bodies: int):
-    all_bodies = [None] * num_bodies
-
-    for i in range(num_bodies):
-        body = [np.random.uniform(0, body_w_lim), np.random.uniform(0, body_l_lim),
-                np.random.uniform(0, body_h_lim)]
+BODY_GENES = ('body_w', 'body_l', 'body_h', 'leg_w1', 'leg_w2', 'leg_w3', 'leg_w4', 'leg_l1', 'leg_l2', 'leg_l3',
+              'leg_l4', 'leg_h1', 'leg_h2', 'leg_h3', 'leg_h4')
 
-        body.extend(np.random.uniform(0, leg_w_lim, 4))
-        body.extend(np.random.uniform(0, leg_l_lim, 4))
-        body.extend(np.random.uniform(0, leg_h_lim, 4))
 
-        all_bodies[i] = body
+def body_schema(method="reflect", rng=np.random):
+    """ Returns a new GenomeSchema with the bounds of every body parameter, repairing with the given method and
+        drawing from rng.
+    """
 
-    return all_bodies
+    upper = [body_w_lim, body_l_lim, body_h_lim] + [leg_w_lim] * 4 + [leg_l_lim] * 4 + [leg_h_lim] * 4
+    return GenomeSchema(dim_min, upper, method, names=list(BODY_GENES), rng=rng)
 
 
-def generate_urdfs(bodies: list[list]):
-    all_urdfs = [None] * len(bodies)
+def randomize_bodies(num_bodies: int, rng=np.random):
+    # Each parameter is drawn uniformly within its bounds
+    return body_schema(rng=rng).sample(num_bodies).tolist()
 
-    for i in range(len(bodies)):
-        body_urdf = gb.generate_body(i, bodies[i])
 
-        all_urdfs[i] = body_urdf
-
-    return all_urdfs
+def generate_urdfs(bodies: list[list]):
+    # Template fast path, byte-identical to gb.generate_body for each body
+    return gb.generate_bodies_fast(bodies)
 
 
 def generate_urdf(body: list, index: int = 0):
-    body_urdf = gb.generate_body(index, body)
+    body_urdf = gb.generate_body_fast(index, body)
     return body_urdf
 
 
@@ -60,56 +62,291 @@ def simulate_body(body_urdf: str):
 
 
 def body_trial(num_bodies: int, generations: int, title: str, prob_reproduction=0.8, prob_mutation=0.1,
-               mutation_deviation=0.05, encoding_type=1, minimise=False):
+               mutation_deviation=0.05, encoding_type=1, minimise=False, processes=None, client=None,
+               fidelity=None, surrogate=None, precheck=None, floor_fitness=0.0, repair="reflect",
+               store=None, algorithm="microbial", batch_pairs=None, seed=None, diversity=False,
+               sharing_radius=None, novelty=None):
+    """ Evolves a population of bodies with the Microbial GA and logs the most fit body of each generation.
+
+        With algorithm="cmaes" (or "sep-cmaes" for the diagonal variant) a CMA-ES is used instead, with the population
+        size as lambda, and with algorithm="de" Differential Evolution. Both replace the whole population each
+        generation, so every generation evaluates num_bodies bodies as one batch (the GA parameters other than
+        minimise are not used).
+
+        With algorithm="nsga2" the evolution is multi-objective (see genalgs.NSGA2): each body is scored by its
+        distance (direction set by minimise), the mechanical work of its motors and its volume (both minimised),
+        measured in the simulation. Each generation evaluates num_bodies offspring as one batch, the log follows the
+        farthest-walking body of the Pareto front, and the final front is written to pareto_front_{title}.csv. It
+        needs the measurements of the simulation, so it only works with local evaluation (not with processes, client,
+        fidelity, store, surrogate, precheck or novelty).
+
+        If batch_pairs is given (only with algorithm="microbial"), the Microbial GA holds that many disjoint tournaments
+        per generation with vectorized crossover (see Microbial.batch_cycle), and their losers are evaluated as one
+        batch.
+
+        If processes is given, the population and fitness live in shared memory and bodies are simulated by that
+        many worker processes, which write each fitness value in place (see parallel_evaluation).
+
+        If client is given (an eval_daemon.EvaluationClient), bodies are instead evaluated in batches by a running
+        evaluation daemon.
+
+        If fidelity is given (a multi_fidelity.SuccessiveHalving), bodies are evaluated with it instead: the initial
+        population with successive halving across the batch and each offspring with early stopping at the cheaper
+        horizons. Its promotion log is written to fidelity_log_{title}.csv. At most one of processes, client and
+        fidelity can be given.
+
+        If surrogate is given (a surrogate.SurrogateFilter), it is trained on every simulated body and offspring it is
+        confident would be worse than the current worst member of the population are given their predicted fitness
+        instead of being simulated. When a whole generation is replaced (cmaes, sep-cmaes, de), the bar is the worst
+        fitness of the previous generation. Its skip rate and prediction error are printed at the end.
+
+        If precheck is given (a failure-score threshold, see stability.stability_check), bodies whose analytic
+        static-stability score reaches it are given floor_fitness without being simulated.
+
+        Offspring genes outside the body parameter bounds are repaired with the given repair method ("clip", "reflect"
+        or "resample", or None to turn repair off), and the repair statistics are printed at the end.
+
+        If store is given (an evaluation_store.EvaluationStore), bodies it already holds are not simulated again, and
+        every simulated body is recorded in it. It cannot be combined with fidelity, whose fitness values are not
+        full-duration distances.
+
+        The initial population, the GA, the repair and the surrogate's exploration each draw from their own stream
+        spawned from seed (see genalgs.RandomStream), so with a seed the evolution can be repeated exactly; a seed
+        replaces the surrogate's own exploration stream.
+
+        If diversity is True, the pairwise distances of the population are tracked (see genalgs.DiversityTracker) and
+        the mean distance, nearest-neighbour distances and gene entropy of each generation are written to
+        diversity_log_{title}.csv. If sharing_radius is given (only with algorithm="microbial"), the Microbial GA's
+        tournaments use fitness sharing with that niche radius (in body parameter units), and diversity is tracked as
+        well.
+
+        If novelty is given (a novelty.NoveltyArchive), every body is simulated with its trajectory, its behaviour
+        descriptor is added to the archive, and the fitness of the population is the blend of distance and novelty the
+        archive scores, recomputed for every body each time the archive grows. It needs the trajectories, so it only
+        works with local evaluation (not with processes, client, fidelity, store, surrogate or precheck), and not with
+        algorithm="de", whose selection restores targets with their old scores.
+    """
+    # pandas is only needed for logging here, so it is not imported by evaluation workers that import this module
+    import pandas as pd
+
+    if algorithm not in ("microbial", "cmaes", "sep-cmaes", "de", "nsga2"):
+        raise ValueError(f"Unknown algorithm {algorithm!r}, expected 'microbial', 'cmaes', 'sep-cmaes', 'de' or "
+                         f"'nsga2'")
+
+    if sum(option is not None for option in (processes, client, fidelity)) > 1:
+        raise ValueError("processes, client and fidelity are different ways to evaluate bodies, so give at most one")
+
+    if novelty is not None and any(option is not None for option in (processes, client, fidelity, store, surrogate,
+                                                                      precheck)):
+        raise ValueError("Novelty search needs the trajectory of every body, so it only works with local evaluation")
+
+    if novelty is not None and algorithm == "de":
+        raise ValueError("Differential Evolution restores losing targets with their old scores, so novelty (rescored "
+                         "as the archive grows) does not work with algorithm='de'")
+
+    if algorithm == "nsga2" and any(option is not None for option in (processes, client, fidelity, store, surrogate,
+                                                                      precheck, novelty)):
+        raise ValueError("NSGA-II needs the effort and volume of every body, so it only works with local evaluation")
+
+    if batch_pairs and algorithm != "microbial":
+        raise ValueError("batch_pairs holds batched Microbial tournaments, so it only works with algorithm='microbial'")
+
+    if sharing_radius is not None and algorithm != "microbial":
+        raise ValueError("Fitness sharing is applied in Microbial tournaments, so sharing_radius only works with "
+                         "algorithm='microbial'")
+
+    population_stream, ga_stream, repair_stream, surrogate_stream = RandomStream(seed).spawn(4)
+    if surrogate is not None and seed is not None:
+        surrogate.rng = surrogate_stream
 
     # Generate bodies (list of parameters)
-    bodies = randomize_bodies(num_bodies)
-
-    # Generate urdfs of bodies
-    body_urdfs = generate_urdfs(bodies)
-
-    # Find the fitness for each body (final distance from starting point)
-    fitness = [None] * num_bodies
-    for i in range(len(body_urdfs)):
-        distance = simulate_body(body_urdfs[i])
-        fitness[i] = distance[-1]
+    bodies = randomize_bodies(num_bodies, population_stream)
+
+    if processes is not None:
+        shared = SharedPopulation.create(bodies)
+        evaluator = ParallelEvaluator(shared, processes)
+
+        bodies = shared.population
+        fitness = shared.fitness
+
+        def evaluate(indices):
+            evaluator.evaluate(indices)
+    elif fidelity is not None:
+        fitness = [None] * num_bodies
+
+        def evaluate(indices):
+            indices = list(indices)
+            if len(indices) == 1:
+                fitness[indices[0]] = fidelity.evaluate(bodies[indices[0]])
+            else:
+                for index, value in zip(indices, fidelity.evaluate_batch([bodies[index] for index in indices])):
+                    fitness[index] = value
+    elif client is not None:
+        fitness = [None] * num_bodies
+
+        def evaluate(indices):
+            indices = list(indices)
+            for index, value in zip(indices, client.evaluate([bodies[index] for index in indices])):
+                fitness[index] = value
+    elif algorithm == "nsga2":
+        fitness = [None] * num_bodies
+
+        def evaluate(indices):
+            for index in indices:
+                measures = {}
+                distance = float(sb.simulate_body(generate_urdf(bodies[index], index), measures=measures)[-1])
+                fitness[index] = (distance, measures['effort'], measures['volume'])
+    elif novelty is not None:
+        fitness = [None] * num_bodies
+        distance = [None] * num_bodies
+        behaviour = [None] * num_bodies
+
+        def evaluate(indices):
+            indices = list(indices)
+            for index in indices:
+                urdf = generate_urdf(bodies[index], index)
+                distance[index], behaviour[index] = novelty_search.simulate_behaviour(urdf, novelty.points)
+            novelty.add([behaviour[index] for index in indices])
+
+            # The archive has grown, so every evaluated body is scored again
+            scored = [index for index in range(num_bodies) if behaviour[index] is not None]
+            for index, value in zip(scored, novelty.score([distance[index] for index in scored],
+                                                          [behaviour[index] for index in scored])):
+                fitness[index] = float(value)
+    else:
+        fitness = [None] * num_bodies
+
+        def evaluate(indices):
+            for index in indices:
+                fitness[index] = float(simulate_body(generate_urdf(bodies[index], index))[-1])
+
+    if store is not None:
+        if fidelity is not None:
+            raise ValueError("An evaluation store only records full-duration evaluations, so it cannot be used with "
+                             "fidelity")
+
+        uncached = evaluate
+
+        def evaluate(indices):
+            indices = list(indices)
+            found = store.lookup([bodies[index] for index in indices])
+
+            for index, value in zip(indices, found):
+                if value is not None:
+                    fitness[index] = value
+
+            missing = [index for index, value in zip(indices, found) if value is None]
+            if missing:
+                start = time.perf_counter()
+                uncached(missing)
+                store.add([bodies[index] for index in missing], [fitness[index] for index in missing],
+                          (time.perf_counter() - start) / len(missing))
+
+    if surrogate is not None:
+        simulate = evaluate
+
+        def evaluate(indices):
+            indices = list(indices)
+            replaced = set(indices)
+            others = [fitness[i] for i in range(num_bodies) if i not in replaced and fitness[i] is not None]
+            if not others:
+                # A whole-population algorithm replaces every body, so the bar is the previous generation's fitness
+                others = [fitness[i] for i in indices if fitness[i] is not None]
+            worst = (max(others) if minimise else min(others)) if others else None
+
+            screened = [(index, *surrogate.screen(bodies[index], worst)) for index in indices]
+            to_simulate = [index for index, simulated, _ in screened if simulated]
+            if to_simulate:
+                simulate(to_simulate)
+
+            for index, simulated, prediction in screened:
+                if simulated:
+                    surrogate.update(bodies[index], fitness[index], prediction)
+                else:
+                    fitness[index] = prediction
+
+    if precheck is not None:
+        checked = evaluate
+        prechecked = [0, 0]
+
+        def evaluate(indices):
+            indices = list(indices)
+            hopeless = stability.prescreen([bodies[index] for index in indices], precheck)
+
+            for index in np.asarray(indices)[hopeless]:
+                fitness[index] = floor_fitness
+
+            remaining = [index for index, skip in zip(indices, hopeless) if not skip]
+            if remaining:
+                checked(remaining)
+
+            prechecked[0] += len(indices)
+            prechecked[1] += int(hopeless.sum())
+
+    try:
+        # Find the fitness for each body (final distance from starting point)
+        evaluate(range(num_bodies))
+
+        bounds = body_schema(repair, repair_stream) if repair is not None else None
+        if algorithm == "microbial":
+            ga = Microbial(bodies, fitness, prob_reproduction, prob_mutation, mutation_deviation, encoding_type,
+                           minimise, bounds=bounds, rng=ga_stream, sharing_radius=sharing_radius)
+        elif algorithm in ("cmaes", "sep-cmaes"):
+            ga = CMAES(bodies, fitness, diagonal=algorithm == "sep-cmaes", minimise=minimise, bounds=bounds,
+                       rng=ga_stream)
+        elif algorithm == "de":
+            ga = DifferentialEvolution(bodies, fitness, minimise=minimise, bounds=bounds, rng=ga_stream)
+        elif algorithm == "nsga2":
+            ga = NSGA2(bodies, fitness, prob_reproduction, prob_mutation, mutation_deviation,
+                       minimise=(minimise, True, True), bounds=bounds, rng=ga_stream)
+        most_fit = ga.getMostFit()
 
-    ga = Microbial(bodies, fitness, prob_reproduction, prob_mutation, mutation_deviation, encoding_type, minimise)
+        if diversity and ga.diversity_tracker is None:
+            ga.track_diversity()
+        if ga.diversity_tracker is not None:
+            ga.diversity_tracker.record(0)
 
-    error = (None, None)
-    most_fit = ga.getMostFit()
+        # Create pandas dataframe to info related to fitness
+        columns = ('Generation', 'Fitness', 'body_w', 'body_l', 'body_h', 'leg_w1', 'leg_w2', 'leg_w3', 'leg_w4',
+                   'leg_l1', 'leg_l2', 'leg_l3', 'legl_4', 'legh_1', 'legh_2', 'legh_3', 'legh_4')
 
-    while most_fit == error:
-        most_fit = ga.getMostFit()
+        data = [0, most_fit[1]]
+        data.extend(most_fit[0])
 
-    # Create pandas dataframe to info related to fitness
-    columns = ('Generation', 'Fitness', 'body_w', 'body_l', 'body_h', 'leg_w1', 'leg_w2', 'leg_w3', 'leg_w4', 'leg_l1',
-               'leg_l2', 'leg_l3', 'legl_4', 'legh_1', 'legh_2', 'legh_3', 'legh_4')
+        df = pd.DataFrame(columns=columns)
+        df.loc[0] = data
 
-    data = [0, most_fit[1]]
-    data.extend(most_fit[0])
+        # Generational loop for genetic algorithm (output stays None if there are no generations)
+        output = None
+        for i in range(generations):
+            output = ga.batch_cycle(batch_pairs) if batch_pairs else ga.cycle()
+            print(f"Generation {i+1} of {generations}")
 
-    df = pd.DataFrame(columns=columns)
-    df.loc[0] = data
+            bodies = output[0]
+            individual = output[1]
 
-    # Generational loop for genetic algorithm
-    for i in range(generations):
-        output = ga.cycle()
-        print(f"Generation {i+1} of {generations}")
+            # Steady-state algorithms replace one individual, evolution strategies a whole batch
+            evaluate(individual if isinstance(individual, list) else [individual])
 
-        bodies = output[0]
-        individual = output[1]
+            ga.setFitness(fitness)
 
-        body_urdfs[individual] = generate_urdf(bodies[individual], individual)
-        fitness[individual] = simulate_body(body_urdfs[individual])[-1]
+            # Add most fit member of the population to dataframe
+            most_fit = ga.getMostFit()
+            new_data = [i+1, most_fit[1]]
+            new_data.extend(most_fit[0])
+            df.loc[len(df.index)] = new_data
 
-        ga.setFitness(fitness)
+            if ga.diversity_tracker is not None:
+                ga.diversity_tracker.record(i + 1)
 
-        # Add most fit member of the population to dataframe
-        most_fit = ga.getMostFit()
-        new_data = [i+1, most_fit[1]]
-        new_data.extend(most_fit[0])
-        df.loc[len(df.index)] = new_data
+        if processes is not None:
+            # Copy out of shared memory before it is freed
+            bodies, fitness = shared.detach(ga)
+            del output, most_fit
+    finally:
+        if processes is not None:
+            evaluator.close()
+            shared.unlink()
 
     # Set the generation as the index in the datafram
     df.set_index('Generation', inplace=True)
@@ -121,4 +358,32 @@ def body_trial(num_bodies: int, generations: int, title: str, prob_reproduction=
 
     df.to_csv(f'body_trial_{title}.csv')
 
+    if algorithm == "nsga2":
+        ga.export_front(f'pareto_front_{title}.csv', ['distance', 'effort', 'volume'] + list(BODY_GENES))
+        print(f"Pareto front of {int(np.sum(ga.rank == 0))} bodies written to pareto_front_{title}.csv")
+
+    if ga.diversity_tracker is not None:
+        pd.DataFrame(ga.diversity_tracker.history).set_index('generation').to_csv(f'diversity_log_{title}.csv')
+        print(f"Final diversity: {ga.diversity_tracker.history[-1]}")
+
+    if fidelity is not None:
+        fidelity.write_log(f'fidelity_log_{title}.csv')
+        print(f"Multi-fidelity: {fidelity.savings():.1%} of simulation steps saved, rank correlation with final "
+              f"distance by horizon: {fidelity.correlations()}")
+
+    if bounds is not None:
+        print(bounds.report())
+
+    if store is not None:
+        print(store.report())
+
+    if surrogate is not None:
+        print(surrogate.report())
+
+    if novelty is not None:
+        print(f"{novelty.report()}; farthest distance in the final population: {max(distance):.3f}")
+
+    if precheck is not None:
+        print(f"Stability pre-check: {prechecked[1]} of {prechecked[0]} bodies given the floor fitness")
+
     return bodies, fitness
@@ -0,0 +1,158 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+gait_sweep.py
+
+Last Modified: 10/19/2026
+
+Gait-parameter sweeps on one fixed body. Each worker connects to pybullet and loads the body once, lets it settle,
+snapshots the physics state with p.saveState, and then runs each of its gait variants from p.restoreState, so the
+connection, URDF loading and settling are paid once per worker instead of once per variant.
+"""
+
+import os
+from itertools import product
+from multiprocessing import Pool
+
+import numpy as np
+import pybullet as p
+import pybullet_data
+
+import three_crossover_evolution.gen_sim_viz.generate_body as gb
+import pyrosim.pyrosim as ps
+import simulate_body_nogui as sb
+from gait_engine import default_gait
+
+
+def _sweep_chunk(args):
+    """ Loads the body once, settles it, and returns the fitness (distance from the position after the first step to
+        the final one, as in simulate_body) of each gait in the chunk.
+    """
+
+    body_dims, gaits, duration, settle_steps, profile, control_every = args
+    urdf = gb.generate_body_fast(f"sweep{os.getpid()}", body_dims)
+
+    p.connect(p.DIRECT)
+    try:
+        p.setAdditionalSearchPath(pybullet_data.getDataPath())
+        p.setGravity(0, 0, -9.8)
+        p.setRealTimeSimulation(0)
+
+        profile = sb.get_profile(profile)
+        if profile['engine']:
+            p.setPhysicsEngineParameter(**profile['engine'])
+        sb.create_ground(profile['ground'])
+
+        robot_id = p.loadURDF(urdf)
+        ps.Prepare_To_Simulate(robot_id)
+
+        # Settle before any gait command (pybullet's default velocity motors brake the joints), then snapshot the
+        # state every variant starts from
+        for _ in range(settle_steps):
+            p.stepSimulation()
+
+        settled = p.saveState()
+        fitness = [None] * len(gaits)
+
+        for g, gait in enumerate(gaits):
+            p.restoreState(settled)
+
+            targets = gait.table(duration, control_every)
+            indices = [ps.jointNamesToIndices[name] for name in gait.joints]
+            forces = [gait.max_force] * len(gait)
+
+            start = None
+            for i in range(duration):
+                if i % control_every == 0:
+                    p.setJointMotorControlArray(robot_id, indices, p.POSITION_CONTROL,
+                                                targetPositions=targets[i // control_every], forces=forces)
+
+                p.stepSimulation()
+
+                if start is None:
+                    start = np.array(p.getBasePositionAndOrientation(robot_id)[0])
+
+            fitness[g] = float(np.linalg.norm(np.array(p.getBasePositionAndOrientation(robot_id)[0]) - start))
+    finally:
+        p.disconnect()
+        os.remove(urdf)
+
+    return fitness
+
+
+def sweep_gaits(body_dims, gaits, duration=10000, settle_steps=240, processes=None, profile='default',
+                control_every=1):
+    """ Evaluates one body with each of a list of gaits, spreading the gaits across worker processes.
+
+        The body first rests settle_steps steps before any gait command, with its joints braked by pybullet's default
+        velocity motors, and every variant starts from that settled state.
+        With settle_steps=0 every variant starts from the freshly loaded body instead, so the fitness values match
+        simulate_body with the same gait.
+
+        Parameters
+        ----------
+        body_dims : list[float]
+            The body parameters
+        gaits : list[gait_engine.Gait]
+            The controller variants
+        duration : int, optional
+            Simulation steps per variant (default is 10000)
+        settle_steps : int, optional
+            Steps to settle the body before the state is saved (default is 240, one simulated second)
+        processes : int, optional
+            Worker processes (default is the number of CPUs, capped at the number of gaits); 1 runs the sweep here
+        profile : str or dict, optional
+            The physics profile (default is 'default')
+        control_every : int, optional
+            Physics steps between motor commands (default is 1)
+
+        Returns
+        -------
+        np.ndarray
+            The fitness of the body with each gait, in order
+    """
+
+    gaits = list(gaits)
+    processes = min(processes or os.cpu_count(), len(gaits))
+    chunks = [chunk for chunk in np.array_split(np.arange(len(gaits)), processes) if len(chunk)]
+    jobs = [(list(body_dims), [gaits[g] for g in chunk], duration, settle_steps, profile, control_every)
+            for chunk in chunks]
+
+    if processes == 1:
+        results = list(map(_sweep_chunk, jobs))
+    else:
+        with Pool(processes) as pool:
+            results = pool.map(_sweep_chunk, jobs)
+
+    fitness = np.empty(len(gaits))
+    for chunk, values in zip(chunks, results):
+        fitness[chunk] = values
+
+    return fitness
+
+
+def sweep_grid(body_dims, amplitudes, phase_offsets, **sweep_kwargs):
+    """ Sweeps every combination of amplitude and phase offset sets for the original four-leg drivers.
+
+        Parameters
+        ----------
+        body_dims : list[float]
+            The body parameters
+        amplitudes : list[tuple[float]]
+            Amplitude sets, one value per leg
+        phase_offsets : list[tuple[float]]
+            Phase offset sets, one value per leg
+        **sweep_kwargs
+            Passed on to sweep_gaits
+
+        Returns
+        -------
+        np.ndarray
+            A (len(amplitudes), len(phase_offsets)) grid of fitness values
+    """
+
+    gaits = [default_gait(sb.LEG_JOINTS, amplitude, phase_offset)
+             for amplitude, phase_offset in product(amplitudes, phase_offsets)]
+
+    return sweep_gaits(body_dims, gaits, **sweep_kwargs).reshape(len(amplitudes), len(phase_offsets))
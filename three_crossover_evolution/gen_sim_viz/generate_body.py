@@ -4,10 +4,13 @@ SPDX License: BSD-3-Clause
 
 generate_body.py
 
-Last Modified: 11/18/2024
+Last Modified: 10/19/2026
 """
 
+import numpy as np
+
 import pyrosim.pyrosim as ps
+from pyrosim.builder import BUILDER
 
 
 def generate_body(body_num, body_dims):
@@ -59,3 +62,146 @@ def generate_body(body_num, body_dims):
     ps.End()
 
     return body_urdf
+
+
+def _slots(first, count):
+    """ Returns a list of `count` format placeholders, numbered from `first`. """
+    return ["{" + str(i) + "}" for i in range(first, first + count)]
+
+
+def _compile_body_template():
+    """ Builds the quadruped URDF once through pyrosim with format placeholders in place of every number that depends
+        on the body dimensions, so the template always matches what generate_body writes.
+
+        The 40 slots are, in order: body z, body size (3), then for each leg its joint position (3), leg position (3),
+        and leg size (3).
+    """
+
+    builder = BUILDER()
+    builder.Start_URDF()
+    builder.Send_Cube(name="Body", pos=[0, 0] + _slots(0, 1), size=_slots(1, 3))
+
+    for leg in range(4):
+        first = 4 + 9*leg
+        builder.Send_Joint(name=f"Body_Leg{leg + 1}", parent="Body", child=f"Leg{leg + 1}", type="revolute",
+                           position=_slots(first, 3))
+        builder.Send_Cube(name=f"Leg{leg + 1}", pos=_slots(first + 3, 3), size=_slots(first + 6, 3))
+
+    return builder.End()
+
+
+BODY_TEMPLATE = _compile_body_template()
+
+
+def body_slot_values(body_dims):
+    """ Computes the 40 template slot values for one body with the same arithmetic generate_body uses, so the rendered
+        numbers (including the sign of zero) are identical.
+    """
+
+    x = 0
+    y = 0
+    z = 0
+
+    body_w, body_l, body_h = body_dims[0], body_dims[1], body_dims[2]
+    leg_w = [body_dims[3], body_dims[4], body_dims[5], body_dims[6]]
+    leg_l = [body_dims[7], body_dims[8], body_dims[9], body_dims[10]]
+    leg_h = [body_dims[11], body_dims[12], body_dims[13], body_dims[14]]
+
+    top = max(leg_h)
+
+    return [z + (top + 0.5*body_h), body_w, body_l, body_h,
+            x - (0.5*body_w), y - (0.5*body_l), z + top,
+            -(0.5*leg_w[0]), -0.5*leg_l[0], -0.5*leg_h[0], leg_w[0], leg_l[0], leg_h[0],
+            x + (0.5*body_w), y - (0.5*body_l), z + top,
+            (0.5*leg_w[1]), -0.5*leg_l[1], -0.5*leg_h[1], leg_w[1], leg_l[1], leg_h[1],
+            x + (0.5*body_w), y + (0.5*body_l), z + top,
+            (0.5*leg_w[2]), 0.5*leg_l[2], -0.5*leg_h[2], leg_w[2], leg_l[2], leg_h[2],
+            x - (0.5*body_w), y + (0.5*body_l), z + top,
+            -(0.5*leg_w[3]), 0.5*leg_l[3], -0.5*leg_h[3], leg_w[3], leg_l[3], leg_h[3]]
+
+
+def population_slot_values(bodies):
+    """ Vectorized version of body_slot_values for a whole population.
+
+        Parameters
+        ----------
+        bodies : array_like
+            A (population size, 15) array of real-valued body dimensions
+
+        Returns
+        -------
+        np.ndarray
+            A (population size, 40) float64 array of template slot values
+    """
+
+    bodies = np.asarray(bodies, dtype=np.float64)
+    body_w, body_l, body_h = bodies[:, 0], bodies[:, 1], bodies[:, 2]
+    leg_w = bodies[:, 3:7]
+    leg_l = bodies[:, 7:11]
+    leg_h = bodies[:, 11:15]
+
+    top = leg_h.max(axis=1)
+    half_w = 0.5*body_w
+    half_l = 0.5*body_l
+
+    # Joint x and y offsets for legs 1-4 (same sign pattern as generate_body)
+    joint_x = np.stack([0.0 - half_w, 0.0 + half_w, 0.0 + half_w, 0.0 - half_w], axis=1)
+    joint_y = np.stack([0.0 - half_l, 0.0 - half_l, 0.0 + half_l, 0.0 + half_l], axis=1)
+
+    leg_x = 0.5*leg_w
+    leg_x[:, [0, 3]] = -leg_x[:, [0, 3]]
+    leg_y = np.where([True, True, False, False], -0.5, 0.5) * leg_l
+
+    legs = np.stack([joint_x, joint_y, np.repeat((0.0 + top)[:, None], 4, axis=1),
+                     leg_x, leg_y, -0.5*leg_h, leg_w, leg_l, leg_h], axis=2)
+
+    return np.concatenate([np.stack([0.0 + (top + 0.5*body_h), body_w, body_l, body_h], axis=1),
+                           legs.reshape(len(bodies), 36)], axis=1)
+
+
+def render_body(body_dims):
+    """ Renders the URDF for one body from the precompiled template. The output is byte-identical to the file written
+        by generate_body.
+    """
+
+    return BODY_TEMPLATE.format(*map(str, body_slot_values(body_dims)))
+
+
+def render_bodies(bodies):
+    """ Renders the URDFs for a whole population, computing every slot value in one vectorized pass. Bodies are treated
+        as real-valued, so for float genomes the output is byte-identical to generate_body.
+
+        Returns
+        -------
+        list[str]
+            The URDF document for each body, in population order
+    """
+
+    return [BODY_TEMPLATE.format(*map(str, row)) for row in population_slot_values(bodies).tolist()]
+
+
+def generate_body_fast(body_num, body_dims):
+    """ Template fast path for generate_body: writes the same body_{body_num}.urdf file in a single write. """
+
+    body_urdf = f"body_{body_num}.urdf"
+
+    with open(body_urdf, "w") as f:
+        f.write(render_body(body_dims))
+
+    return body_urdf
+
+
+def generate_bodies_fast(bodies, first_num=0):
+    """ Template fast path for a whole population. Writes body_{first_num + i}.urdf for each body and returns the
+        filenames.
+    """
+
+    all_urdfs = [None] * len(bodies)
+
+    for i, text in enumerate(render_bodies(bodies)):
+        all_urdfs[i] = f"body_{first_num + i}.urdf"
+
+        with open(all_urdfs[i], "w") as f:
+            f.write(text)
+
+    return all_urdfs
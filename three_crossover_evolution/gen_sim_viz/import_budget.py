@@ -0,0 +1,103 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+import_budget.py
+
+Last Modified: 10/19/2026
+
+Measures the import time of the evaluation worker entry point in a fresh interpreter and checks it against a budget.
+Spawned workers pay this cost once each, so it should stay limited to pybullet, numpy and the simulation core; plotting
+and pandas are only imported lazily where they are used.
+
+Run it with:
+    python -m three_crossover_evolution.gen_sim_viz.import_budget
+"""
+
+import subprocess
+import sys
+
+# The module a spawned evaluation worker imports, and the budget (in seconds) for importing it from scratch
+WORKER_ENTRY_POINT = "three_crossover_evolution.gen_sim_viz.parallel_evaluation"
+WORKER_IMPORT_BUDGET = 0.35
+
+# Packages a worker must never import
+FORBIDDEN_PACKAGES = ("pandas", "matplotlib", "scipy")
+
+
+def measure_import_time(module=WORKER_ENTRY_POINT, repeats=3):
+    """ Imports a module in fresh interpreters with -X importtime.
+
+        Returns
+        -------
+        tuple[float, list[tuple[float, str]], list[str]]
+            The best total import time in seconds over the repeats, the ten slowest modules imported directly by
+            the entry point as (seconds, name), leaving out those loaded at interpreter start-up, and the forbidden
+            packages that were imported
+    """
+
+    best = None
+
+    for _ in range(repeats):
+        # The child lists the modules already loaded at start-up before importing, so they can be left out of the
+        # ranking
+        code = f"import sys; print('\\n'.join(sys.modules)); import {module}"
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                capture_output=True, text=True, check=True)
+        startup = set(result.stdout.split())
+
+        direct = {}
+        children = {}
+        imported = set()
+        total = 0.0
+
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue
+
+            name = name.rstrip()
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            seconds = int(cumulative) / 1e6
+            imported.add(name.strip().split(".")[0])
+
+            # Top-level entries add up to the total, and their children (listed before them) are the entry point's
+            # direct imports unless they belong to a start-up module
+            if depth == 0:
+                total += seconds
+                if name.strip() not in startup:
+                    direct.update(children)
+                children = {}
+            elif depth == 1 and name.strip() not in startup:
+                children[name.strip()] = seconds
+
+        if best is None or total < best[0]:
+            slowest = sorted(((t, n) for n, t in direct.items()), reverse=True)[:10]
+            forbidden = sorted(imported & set(FORBIDDEN_PACKAGES))
+            best = (total, slowest, forbidden)
+
+    return best
+
+
+def check_worker_imports(budget=WORKER_IMPORT_BUDGET):
+    """ Prints an import-time report for the worker entry point and returns whether it is within budget and free of
+        forbidden packages.
+    """
+
+    total, slowest, forbidden = measure_import_time()
+
+    print(f"Importing {WORKER_ENTRY_POINT}: {total:.3f} s (budget {budget:.3f} s)")
+    for seconds, name in slowest:
+        print(f"    {seconds:.3f} s  {name}")
+
+    if forbidden:
+        print(f"Forbidden packages imported: {', '.join(forbidden)}")
+
+    return total <= budget and not forbidden
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_worker_imports() else 1)
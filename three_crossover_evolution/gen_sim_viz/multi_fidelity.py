@@ -0,0 +1,284 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+multi_fidelity.py
+
+Last Modified: 10/19/2026
+"""
+
+import csv
+import os
+
+import numpy as np
+
+import three_crossover_evolution.gen_sim_viz.generate_body as gb
+import simulate_body_nogui as sb
+
+
+def _run_to_horizon(args):
+    """ Simulates one body up to `horizon` steps of a `duration`-step run and returns the distance at each checkpoint
+        reached, as {steps: distance}. Module level so it can be used with Pool.map.
+    """
+
+    body_dims, horizon, checkpoints, sim_kwargs = args
+    urdf = gb.generate_body_fast(f"fidelity{os.getpid()}", body_dims)
+    reached = {}
+
+    def on_checkpoint(steps, distance):
+        reached[steps] = distance
+        return steps < horizon
+
+    try:
+        distances = sb.simulate_body(urdf, checkpoints=checkpoints, on_checkpoint=on_checkpoint, **sim_kwargs)
+    finally:
+        os.remove(urdf)
+
+    if horizon == sim_kwargs['duration']:
+        reached[horizon] = float(distances[-1])
+
+    return reached
+
+
+def spearman(a, b):
+    """ Spearman rank correlation of two equal-length sequences (no tie correction). """
+
+    if len(a) < 2:
+        return float('nan')
+
+    rank_a = np.argsort(np.argsort(a))
+    rank_b = np.argsort(np.argsort(b))
+
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+class SuccessiveHalving:
+    """ A multi-fidelity evaluator: bodies are first simulated for a short horizon and only promising ones are promoted
+        to longer horizons, successive-halving style. The fitness of a body that is not promoted is the distance it
+        reached at the last horizon it was run to, but never better than the worst full-duration distance of the
+        reference bodies: a partial distance is shorter than a full one, which would otherwise rank stopped bodies
+        above the promoted ones when minimising.
+
+        All horizons are prefixes of the same full-duration run (the motor drivers are built for the full duration),
+        so a promoted body's short-horizon distance is exactly the start of its full run.
+
+        Two modes:
+            * evaluate(body) - for steady-state algorithms like Microbial that produce one offspring at a time. The
+              body is run once with checkpoints at each horizon and stopped at the first checkpoint where it falls
+              below the promote_quantile of the distances that fully-evaluated bodies had at that horizon.
+            * evaluate_batch(bodies) - ranks the whole batch at each horizon and promotes the best 1/eta of it to the
+              next horizon.
+
+        Every promotion decision is logged, and an audit_fraction of bodies is always run to the full duration so
+        the correlation between cheap horizons and the final distance can be measured (see correlations()).
+
+        Attributes
+        ----------
+        horizons : list[int]
+            Increasing numbers of steps; the last one is the full duration
+        promote_quantile : float
+            evaluate(): the quantile of reference distances a body must reach to be promoted
+        eta : float
+            evaluate_batch(): only the best 1/eta of the batch is promoted at each horizon
+        log : list[dict]
+            One entry per promotion decision: candidate, horizon, distance, threshold, promoted
+        simulated_steps : int
+            The number of simulation steps actually run
+        full_steps : int
+            The number of steps a full evaluation of every candidate would have needed
+    """
+
+    def __init__(self, horizons=(1000, 3000, 10000), promote_quantile=0.5, eta=2, minimise=False, window=100,
+                 min_reference=5, audit_fraction=0.05, seed=None, map_function=map, **sim_kwargs):
+        """ Parameters
+            ----------
+            horizons : tuple[int], optional
+                Increasing horizons in steps; the last is the full duration (default is (1000, 3000, 10000))
+            promote_quantile : float, optional
+                Quantile of the reference distances needed for promotion in evaluate() (default is 0.5, the median)
+            eta : float, optional
+                Reduction factor per horizon in evaluate_batch() (default is 2, i.e. halving)
+            minimise : bool, optional
+                Whether smaller distances are better (default is False)
+            window : int, optional
+                How many recent full evaluations form the reference distribution for thresholds (default is 100)
+            min_reference : int, optional
+                Bodies are always promoted until this many full evaluations exist (default is 5)
+            audit_fraction : float, optional
+                Fraction of bodies always run to the full duration (default is 0.05)
+            seed : int, optional
+                Seed for choosing audited bodies
+            map_function : callable, optional
+                Used to run a batch, e.g. Pool.map (default is the builtin map)
+            **sim_kwargs
+                Passed on to simulate_body
+        """
+
+        self.horizons = sorted(horizons)
+        self.promote_quantile = promote_quantile
+        self.eta = eta
+        self.sign = -1 if minimise else 1
+        self.window = window
+        self.min_reference = min_reference
+        self.audit_fraction = audit_fraction
+        self.rng = np.random.default_rng(seed)
+        self.map_function = map_function
+        self.sim_kwargs = dict(sim_kwargs, duration=self.horizons[-1])
+
+        # Distances at every horizon of each fully-evaluated body, one row per body
+        self.reference = []
+
+        self.log = []
+        self.candidates = 0
+        self.simulated_steps = 0
+        self.full_steps = 0
+
+    def threshold(self, level):
+        """ The distance a body must reach at horizons[level] to be promoted by evaluate(), or None if there are not
+            yet enough reference bodies.
+        """
+
+        if len(self.reference) < self.min_reference:
+            return None
+
+        scores = self.sign * np.array(self.reference[-self.window:])[:, level]
+        return self.sign * np.quantile(scores, self.promote_quantile)
+
+    def evaluate(self, body):
+        """ Evaluates one body, stopping it at the first horizon where it is not promising. Returns its fitness. """
+
+        candidate = self.candidates
+        self.candidates += 1
+        audit = self.rng.random() < self.audit_fraction
+        decisions = []
+
+        def on_checkpoint(steps, distance):
+            level = self.horizons.index(steps)
+            threshold = self.threshold(level)
+            promoted = audit or threshold is None or self.sign * distance >= self.sign * threshold
+            decisions.append((steps, distance, threshold, promoted))
+            return promoted
+
+        urdf = gb.generate_body_fast(f"fidelity{os.getpid()}", body)
+        try:
+            distances = sb.simulate_body(urdf, checkpoints=self.horizons[:-1], on_checkpoint=on_checkpoint,
+                                         **self.sim_kwargs)
+        finally:
+            os.remove(urdf)
+
+        for steps, distance, threshold, promoted in decisions:
+            self.log_decision(candidate, steps, distance, threshold, promoted, audit)
+
+        reached = {steps: distance for steps, distance, _, _ in decisions}
+        if all(promoted for _, _, _, promoted in decisions):
+            reached[self.horizons[-1]] = float(distances[-1])
+
+        return self.record(reached, 1)
+
+    def evaluate_batch(self, bodies):
+        """ Evaluates a batch of bodies with successive halving across the batch. Returns their fitness values. """
+
+        n = len(bodies)
+        first = self.candidates
+        self.candidates += n
+        audit = self.rng.random(n) < self.audit_fraction
+
+        fitness = [None] * n
+        reached = [{} for _ in range(n)]
+        alive = list(range(n))
+
+        for level, horizon in enumerate(self.horizons):
+            jobs = [(list(bodies[i]), horizon, self.horizons[:-1], self.sim_kwargs) for i in alive]
+
+            for i, result in zip(alive, self.map_function(_run_to_horizon, jobs)):
+                reached[i].update(result)
+                fitness[i] = result[max(result)]
+
+            self.simulated_steps += horizon * len(alive)
+
+            if level == len(self.horizons) - 1:
+                break
+
+            # Keep the best 1/eta of this horizon (plus any audited bodies)
+            keep = max(1, int(np.ceil(len(alive) / self.eta)))
+            order = sorted(alive, key=lambda i: self.sign * reached[i][horizon], reverse=True)
+            threshold = reached[order[keep - 1]][horizon]
+            promoted = set(order[:keep]) | {i for i in alive if audit[i]}
+
+            for i in alive:
+                self.log_decision(first + i, horizon, reached[i][horizon], threshold, i in promoted, bool(audit[i]))
+
+            alive = [i for i in alive if i in promoted]
+
+        for i in alive:
+            self.record(reached[i], 0)
+
+        # Only now, with this batch's full evaluations in the reference, are the stopped bodies given their fitness
+        for i in set(range(n)) - set(alive):
+            fitness[i] = self.stopped_fitness(fitness[i])
+
+        self.full_steps += n * self.horizons[-1]
+
+        return fitness
+
+    def record(self, reached, count_steps):
+        """ Updates the step counters and, for a fully-evaluated body, the reference distribution. Returns the fitness
+            (the distance at the last horizon reached, see stopped_fitness for a body that was stopped early).
+        """
+
+        last = max(reached)
+
+        if count_steps:
+            self.simulated_steps += last
+            self.full_steps += self.horizons[-1]
+
+        if last == self.horizons[-1]:
+            self.reference.append([reached[horizon] for horizon in self.horizons])
+            return reached[last]
+
+        return self.stopped_fitness(reached[last])
+
+    def stopped_fitness(self, distance):
+        """ The fitness of a body stopped at a cheaper horizon: its distance there, or the worst full-duration distance
+            of the reference bodies if that is worse.
+        """
+
+        if not self.reference:
+            return distance
+
+        worst = np.min(self.sign * np.array(self.reference[-self.window:])[:, -1])
+        return float(self.sign * min(self.sign * distance, worst))
+
+    def log_decision(self, candidate, horizon, distance, threshold, promoted, audit):
+        self.log.append({'candidate': candidate, 'horizon': horizon, 'distance': distance, 'threshold': threshold,
+                         'promoted': promoted, 'audit': audit})
+
+    def savings(self):
+        """ The fraction of simulation steps saved compared with fully evaluating every candidate. """
+
+        return 1 - self.simulated_steps / self.full_steps if self.full_steps else 0.0
+
+    def correlations(self):
+        """ Spearman rank correlation between the distance at each cheaper horizon and the final distance, over the
+            reference (fully-evaluated) bodies. Audited bodies keep this estimate honest, since otherwise only bodies
+            that already looked good are run to the end.
+
+            Returns
+            -------
+            dict[int, float]
+                The correlation for each horizon except the last
+        """
+
+        reference = np.array(self.reference).reshape(-1, len(self.horizons))
+
+        return {horizon: spearman(reference[:, level], reference[:, -1])
+                for level, horizon in enumerate(self.horizons[:-1])}
+
+    def write_log(self, filename):
+        """ Writes the promotion log to a CSV file. """
+
+        with open(filename, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=['candidate', 'horizon', 'distance', 'threshold', 'promoted',
+                                                   'audit'])
+            writer.writeheader()
+            writer.writerows(self.log)
@@ -0,0 +1,316 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+novelty.py
+
+Last Modified: 10/19/2026
+
+Novelty search for locomotion. Each simulated body is summarised by a behaviour descriptor taken from its trajectory
+(where it ended up and the path it took to get there), every descriptor is kept in a growing archive, and a body's
+novelty is the mean distance from its descriptor to its k nearest neighbours in the archive. The fitness the GA sees
+blends novelty with the distance walked, so the search keeps exploring new gaits instead of refining one local optimum.
+
+The archive is searched through a spatial index so that scoring stays sub-linear as it grows into the tens of thousands:
+a scipy cKDTree if scipy is installed (optional), or otherwise a grid hash over the final position.
+"""
+
+import numpy as np
+
+import simulate_body_nogui as sb
+
+
+def behaviour_descriptor(positions, points=4):
+    """ Returns the behaviour descriptor of a trajectory: the XY displacement from the start at `points` evenly spaced
+        times, the final displacement first.
+
+        Parameters
+        ----------
+        positions : array_like
+            The (samples, 3) base positions of the trajectory
+        points : int, optional
+            The number of displacements (default is 4)
+
+        Returns
+        -------
+        np.ndarray
+            The (2 * points,) descriptor
+    """
+
+    xy = np.asarray(positions, dtype=np.float64)[:, :2]
+    samples = np.linspace(0, len(xy) - 1, points + 1)[1:].round().astype(int)[::-1]
+
+    return (xy[samples] - xy[0]).ravel()
+
+
+def simulate_behaviour(body_urdf, points=4, stride=100, **sim_kwargs):
+    """ Simulates a body and returns its final distance (as simulate_body) and its behaviour descriptor. The base
+        position is captured every stride steps.
+    """
+
+    distances, trajectory = sb.simulate_body(body_urdf, capture=('pos',), stride=stride, **sim_kwargs)
+    return float(distances[-1]), behaviour_descriptor(trajectory['pos'], points)
+
+
+class _Points:
+    """ A growing (n, dims) array of points, doubled in capacity as needed. """
+
+    def __init__(self, dims):
+        self.data = np.empty((64, dims))
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, points):
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+
+        if self.size + len(points) > len(self.data):
+            grown = np.empty((max(2 * len(self.data), self.size + len(points)), self.data.shape[1]))
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+
+        self.data[self.size:self.size + len(points)] = points
+        self.size += len(points)
+
+    @property
+    def points(self):
+        return self.data[:self.size]
+
+
+def _nearest(queries, points, k):
+    """ Brute force: the sorted distances from each query to its k nearest points, as a (queries, k) array. """
+
+    squared = (np.square(queries).sum(axis=1)[:, None] + np.square(points).sum(axis=1)[None, :]
+               - 2 * queries @ points.T)
+    distances = np.sqrt(np.maximum(squared, 0))
+
+    k = min(k, len(points))
+    nearest = np.partition(distances, k - 1, axis=1)[:, :k] if k < len(points) else distances
+    return np.sort(nearest, axis=1)
+
+
+class BruteForceIndex:
+    """ Compares each query with every archived point (linear in the archive size). """
+
+    def __init__(self, dims):
+        self.archive = _Points(dims)
+
+    def __len__(self):
+        return len(self.archive)
+
+    def add(self, points):
+        self.archive.add(points)
+
+    def query(self, queries, k):
+        return _nearest(np.atleast_2d(queries), self.archive.points, k)
+
+
+class GridIndex:
+    """ A grid hash over the first two coordinates of the points (the final XY displacement of a behaviour
+        descriptor). A query visits rings of cells around its own cell, nearest first, and stops once the next ring
+        cannot hold a point closer than its k-th nearest so far; distances are over all coordinates, so the result is
+        exact.
+    """
+
+    def __init__(self, dims, cell_size=1.0):
+        self.archive = _Points(dims)
+        self.cell_size = cell_size
+        self.cells = {}
+        self.low = None
+        self.high = None
+
+    def __len__(self):
+        return len(self.archive)
+
+    def _cell(self, point):
+        return tuple(np.floor(point[:2] / self.cell_size).astype(int))
+
+    def add(self, points):
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        start = len(self.archive)
+        self.archive.add(points)
+
+        cells = np.floor(points[:, :2] / self.cell_size).astype(int)
+        for offset, cell in enumerate(map(tuple, cells)):
+            self.cells.setdefault(cell, []).append(start + offset)
+
+        low, high = cells.min(axis=0), cells.max(axis=0)
+        self.low = low if self.low is None else np.minimum(self.low, low)
+        self.high = high if self.high is None else np.maximum(self.high, high)
+
+    def _ring(self, center, r):
+        """ The archive indices in the cells at Chebyshev distance r from center. """
+
+        cx, cy = center
+        if r == 0:
+            return self.cells.get(center, [])
+
+        found = []
+        for dx in range(-r, r + 1):
+            for dy in (-r, r) if abs(dx) < r else range(-r, r + 1):
+                found.extend(self.cells.get((cx + dx, cy + dy), ()))
+        return found
+
+    def query(self, queries, k):
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float64))
+        k = min(k, len(self.archive))
+        points = self.archive.points
+        result = np.empty((len(queries), k))
+
+        for q, query in enumerate(queries):
+            center = self._cell(query)
+            # Beyond this ring there are no occupied cells
+            last = int(np.max(np.maximum(np.abs(self.low - center), np.abs(self.high - center))))
+
+            best = np.empty(0)
+            for r in range(last + 1):
+                ring = self._ring(center, r)
+                if ring:
+                    best = np.sort(np.concatenate([best, _nearest(query[None, :], points[ring], k)[0]]))[:k]
+
+                # Points in ring r + 1 are at least r cells away in the grid coordinates
+                if len(best) == k and best[-1] <= r * self.cell_size:
+                    break
+
+            result[q] = best
+
+        return result
+
+
+class KDTreeIndex:
+    """ A scipy cKDTree over the archive. The tree is static, so new points are first compared by brute force and the
+        tree is rebuilt once they exceed rebuild_fraction of the points in it.
+    """
+
+    def __init__(self, dims, rebuild_fraction=0.25):
+        from scipy.spatial import cKDTree
+
+        self._tree_class = cKDTree
+        self.archive = _Points(dims)
+        self.rebuild_fraction = rebuild_fraction
+        self.tree = None
+        self.built = 0
+
+    def __len__(self):
+        return len(self.archive)
+
+    def add(self, points):
+        self.archive.add(points)
+
+        if len(self.archive) - self.built > max(64, self.rebuild_fraction * self.built):
+            self.tree = self._tree_class(self.archive.points.copy())
+            self.built = len(self.archive)
+
+    def query(self, queries, k):
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float64))
+        k = min(k, len(self.archive))
+        parts = []
+
+        if self.built:
+            distances, _ = self.tree.query(queries, min(k, self.built))
+            parts.append(distances.reshape(len(queries), -1))
+        if len(self.archive) > self.built:
+            parts.append(_nearest(queries, self.archive.points[self.built:], k))
+
+        return np.sort(np.concatenate(parts, axis=1), axis=1)[:, :k]
+
+
+def make_index(kind, dims, cell_size=1.0):
+    """ Returns a spatial index: "kdtree" (needs scipy), "grid", "brute", or "auto" for a KD-tree if scipy is installed
+        and a grid hash otherwise.
+    """
+
+    if kind == "auto":
+        try:
+            return KDTreeIndex(dims)
+        except ImportError:
+            return GridIndex(dims, cell_size)
+    elif kind == "kdtree":
+        try:
+            return KDTreeIndex(dims)
+        except ImportError as e:
+            raise ImportError("The KD-tree index requires scipy; use index='grid' or 'auto' instead") from e
+    elif kind == "grid":
+        return GridIndex(dims, cell_size)
+    elif kind == "brute":
+        return BruteForceIndex(dims)
+
+    raise ValueError(f"Unknown index {kind!r}, expected 'auto', 'kdtree', 'grid' or 'brute'")
+
+
+class NoveltyArchive:
+    """ The archive of behaviour descriptors of every simulated body, with novelty scoring.
+
+        Attributes
+        ----------
+        k : int
+            The number of nearest neighbours the novelty is averaged over
+        weight : float
+            The weight of novelty in the blended fitness, (1 - weight) * distance + weight * novelty (both in metres)
+        points : int
+            The number of displacements in each behaviour descriptor
+        index : BruteForceIndex, GridIndex or KDTreeIndex
+            The spatial index of the archive
+
+        Methods
+        -------
+        add(descriptors)
+            Adds behaviour descriptors to the archive
+        novelty(descriptors)
+            Returns the novelty of archived descriptors
+        score(distances, descriptors)
+            Returns the blended fitness of archived descriptors
+        report()
+            Returns a summary of the archive
+    """
+
+    def __init__(self, k=15, weight=0.5, points=4, index="auto", cell_size=1.0):
+        """ Parameters
+            ----------
+            k : int, optional
+                Nearest neighbours per novelty score (default is 15)
+            weight : float, optional
+                The weight of novelty in the blended fitness (default is 0.5); 1 is pure novelty search
+            points : int, optional
+                Displacements per behaviour descriptor (default is 4)
+            index : str, optional
+                "auto", "kdtree", "grid" or "brute" (default is "auto")
+            cell_size : float, optional
+                The cell size of a grid index, in metres (default is 1.0)
+        """
+
+        self.k = k
+        self.weight = weight
+        self.points = points
+        self.index = make_index(index, 2 * points, cell_size)
+
+    def __len__(self):
+        return len(self.index)
+
+    def add(self, descriptors):
+        """ Adds behaviour descriptors, (n, 2 * points), to the archive. """
+
+        self.index.add(descriptors)
+
+    def novelty(self, descriptors):
+        """ Returns the mean distance from each descriptor to its k nearest neighbours in the archive. The descriptors
+            must already be in the archive: the nearest match, the descriptor itself, is left out.
+        """
+
+        descriptors = np.atleast_2d(np.asarray(descriptors, dtype=np.float64))
+        if len(self) < 2:
+            return np.zeros(len(descriptors))
+
+        return self.index.query(descriptors, self.k + 1)[:, 1:].mean(axis=1)
+
+    def score(self, distances, descriptors):
+        """ Returns the blended fitness (1 - weight) * distance + weight * novelty of archived descriptors. """
+
+        return (1 - self.weight) * np.asarray(distances, dtype=np.float64) + self.weight * self.novelty(descriptors)
+
+    def report(self):
+        """ Returns a summary of the archive. """
+
+        return f"Novelty archive: {len(self)} behaviours, k = {self.k}, weight = {self.weight}, " \
+               f"index = {type(self.index).__name__}"
@@ -0,0 +1,117 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+parallel_evaluation.py
+
+Last Modified: 10/19/2026
+"""
+
+import os
+from multiprocessing import Pool
+
+import three_crossover_evolution.gen_sim_viz.generate_body as gb
+import simulate_body_nogui as sb
+from genalgs import SharedPopulation
+
+# Per-worker state, set by _init_worker
+_shared = None
+_sim_kwargs = None
+
+
+def _init_worker(spec, sim_kwargs):
+    global _shared, _sim_kwargs
+
+    _shared = SharedPopulation.attach(spec)
+    _sim_kwargs = sim_kwargs
+
+
+def evaluate_body(body_dims, **sim_kwargs):
+    """ Simulates one body and returns its fitness (final distance from the starting point). The URDF is written to a
+        file named after the current process, so concurrent workers never overwrite each other's bodies.
+    """
+
+    urdf = gb.generate_body_fast(f"worker{os.getpid()}", body_dims)
+
+    try:
+        return float(sb.simulate_body(urdf, **sim_kwargs)[-1])
+    finally:
+        os.remove(urdf)
+
+
+def _evaluate_index(index):
+    """ Reads the genome at index from shared memory, simulates it, and writes its fitness back in place. """
+
+    _shared.fitness[index] = evaluate_body(_shared.population[index], **_sim_kwargs)
+
+    return index
+
+
+class ParallelEvaluator:
+    """ Evaluates bodies of a SharedPopulation in a pool of worker processes.
+
+        Workers attach to the shared population once, when they start. Evaluating a batch only sends the indices to
+        the workers; each worker reads the genome from shared memory, simulates it, and writes the final distance into
+        the shared fitness vector. A genetic algorithm constructed with shared.population and shared.fitness therefore
+        sees the new fitness values directly.
+
+        Attributes
+        ----------
+        shared : SharedPopulation
+            The population being evaluated
+        pool : multiprocessing.Pool
+            The worker processes
+
+        Methods
+        -------
+        evaluate(indices=None)
+            Evaluates the given individuals (default: the whole population) and returns their fitness values
+        close()
+            Shuts down the worker pool
+    """
+
+    def __init__(self, shared: SharedPopulation, processes=None, **sim_kwargs):
+        """ Parameters
+            ----------
+            shared : SharedPopulation
+                The shared population to evaluate
+            processes : int, optional
+                The number of worker processes (default is the number of CPUs)
+            **sim_kwargs
+                Passed on to simulate_body (e.g. duration)
+        """
+
+        self.shared = shared
+        self.pool = Pool(processes, initializer=_init_worker, initargs=(shared.spec, sim_kwargs))
+
+    def evaluate(self, indices=None):
+        """ Evaluates the individuals at the given indices in parallel, writing their fitness in place.
+
+            Parameters
+            ----------
+            indices : list[int], optional
+                The individuals to evaluate (default is the whole population)
+
+            Returns
+            -------
+            np.ndarray
+                The new fitness values, in the order of indices
+        """
+
+        if indices is None:
+            indices = range(len(self.shared.fitness))
+
+        indices = list(indices)
+        self.pool.map(_evaluate_index, indices)
+
+        return self.shared.fitness[indices]
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,180 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+render_headless.py
+
+Last Modified: 10/19/2026
+"""
+
+import os
+from multiprocessing import Pool
+
+import numpy as np
+import pybullet as p
+
+import three_crossover_evolution.gen_sim_viz.generate_body as gb
+import simulate_body_nogui as sb
+
+VIDEO_EXTENSIONS = ('.mp4', '.gif', '.avi', '.mov')
+
+
+def _open_frame_writer(output: str, fps: int):
+    """ Returns a function that saves one RGB frame. Outputs ending in a video extension are encoded with imageio
+        (optional dependency, only needed for video); anything else is treated as a directory for a PNG sequence.
+    """
+
+    if output.lower().endswith(VIDEO_EXTENSIONS):
+        try:
+            import imageio.v2 as imageio
+        except ImportError as e:
+            raise ImportError("Writing video requires imageio (and imageio-ffmpeg for .mp4); "
+                              "pass a directory to write a PNG image sequence instead") from e
+
+        writer = imageio.get_writer(output, fps=fps)
+        return writer.append_data, writer.close
+
+    from matplotlib import image
+
+    os.makedirs(output, exist_ok=True)
+    count = [0]
+
+    def save_png(frame):
+        image.imsave(os.path.join(output, f"frame_{count[0]:05d}.png"), frame)
+        count[0] += 1
+
+    return save_png, lambda: None
+
+
+def render_body(body: str, output: str, duration=10000, frame_every=40, width=640, height=480, camera_distance=8.0,
+                camera_yaw=45.0, camera_pitch=-25.0, fps=None, amplitude=(1, -1, -1, 1), phase_offset=(0, 0, 0, 0)):
+    """ Simulates a body in p.DIRECT mode and renders it offscreen with the TinyRenderer, following the body with the
+        camera. No display is needed.
+
+        Parameters
+        ----------
+        body : str
+            The URDF file of the body
+        output : str
+            A video file (.mp4, .gif, ...) or a directory for a PNG image sequence
+        duration : int, optional
+            Number of simulation steps (default is 10000)
+        frame_every : int, optional
+            Frame decimation: one frame is rendered every frame_every steps (default is 40, i.e. 6 frames per
+            simulated second at pybullet's 240 Hz time step)
+        width, height : int, optional
+            Frame size in pixels
+        camera_distance, camera_yaw, camera_pitch : float, optional
+            Camera placement relative to the body's base
+        fps : int, optional
+            Video frame rate. Defaults to real time for the chosen decimation.
+
+        Returns
+        -------
+        float
+            The final distance between the body and its starting position
+    """
+
+    if fps is None:
+        fps = max(1, round(240 / frame_every))
+
+    write_frame, close = _open_frame_writer(output, fps)
+    projection = p.computeProjectionMatrixFOV(fov=60, aspect=width / height, nearVal=0.1, farVal=100)
+
+    def capture(step, robot_id):
+        if step % frame_every:
+            return
+
+        target = p.getBasePositionAndOrientation(robot_id)[0]
+        view = p.computeViewMatrixFromYawPitchRoll(cameraTargetPosition=target, distance=camera_distance,
+                                                   yaw=camera_yaw, pitch=camera_pitch, roll=0, upAxisIndex=2)
+        rgba = p.getCameraImage(width, height, viewMatrix=view, projectionMatrix=projection,
+                                renderer=p.ER_TINY_RENDERER)[2]
+
+        write_frame(np.reshape(rgba, (height, width, 4))[:, :, :3].astype(np.uint8))
+
+    try:
+        distances = sb.simulate_body(body, duration, amplitude, phase_offset, on_step=capture)
+    finally:
+        close()
+
+    return distances[-1]
+
+
+def _render_one(args):
+    name, body_dims, output, render_kwargs = args
+    urdf = gb.generate_body_fast(name, body_dims)
+    return render_body(urdf, output, **render_kwargs)
+
+
+def render_bodies(bodies, output_dir: str, names=None, processes=None, extension="", **render_kwargs):
+    """ Renders many bodies in parallel, one body per worker process.
+
+        Parameters
+        ----------
+        bodies : list[list[float]]
+            Body parameter vectors to render
+        output_dir : str
+            Directory in which each body's video (or PNG sequence directory) is written
+        names : list[str], optional
+            A unique name for each body, used for its URDF and output (default is render_0, render_1, ...)
+        processes : int, optional
+            Number of worker processes (default is the number of CPUs)
+        extension : str, optional
+            Video extension such as ".mp4" or ".gif"; empty (default) writes PNG sequences
+        **render_kwargs
+            Passed on to render_body
+
+        Returns
+        -------
+        list[float]
+            The final distance of each body
+    """
+
+    if names is None:
+        names = [f"render_{i}" for i in range(len(bodies))]
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(name, list(body), os.path.join(output_dir, name + extension), render_kwargs)
+            for name, body in zip(names, bodies)]
+
+    with Pool(processes) as pool:
+        return pool.map(_render_one, jobs)
+
+
+def render_trial_populations(trial_results, output_dir: str, top=None, processes=None, extension="",
+                             **render_kwargs):
+    """ Renders the final populations of many trials in one batch across a process pool.
+
+        Parameters
+        ----------
+        trial_results : dict[str, list]
+            Maps a trial name to its final [population, fitness] (for example each entry returned by
+            three_crossover_trial, keyed by crossover method and trial number)
+        output_dir : str
+            Directory for the rendered output, named {trial}_rank{r}_{index}
+        top : int, optional
+            Only render the top fittest bodies of each population (default renders them all)
+
+        Returns
+        -------
+        dict[str, float]
+            The rendered final distance for each output name
+    """
+
+    names = []
+    bodies = []
+
+    for trial, (population, fitness) in trial_results.items():
+        order = np.argsort(fitness)[::-1]
+
+        if top is not None:
+            order = order[:top]
+
+        for rank, index in enumerate(order):
+            names.append(f"{trial}_rank{rank}_{index}")
+            bodies.append(population[index])
+
+    distances = render_bodies(bodies, output_dir, names, processes, extension, **render_kwargs)
+
+    return dict(zip(names, distances))
@@ -0,0 +1,100 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+stability.py
+
+Last Modified: 10/19/2026
+
+A cheap analytic static-stability check computed straight from the 15 body parameters, vectorized over a population.
+It uses the geometry generate_body builds: the body sits on top of the tallest leg, each leg hangs from a body corner
+and extends outward from it, and every link has a mass of 1.
+"""
+
+import numpy as np
+
+# Corner signs of legs 1-4 in generate_body (counter-clockwise from the back left)
+LEG_SIGNS = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=np.float64)
+
+# Directions the support function of the support polygon is sampled in
+_DIRECTIONS = np.stack([np.cos(np.linspace(0, 2*np.pi, 64, endpoint=False)),
+                        np.sin(np.linspace(0, 2*np.pi, 64, endpoint=False))], axis=1)
+
+
+def stability_check(bodies, contact_tolerance=0.05, margin_scale=0.1, min_dimension=0.05, max_spread=0.5):
+    """ Scores how likely each body is to fail (topple or collapse) before it can walk.
+
+        Three checks, each scored from 0 (fine) to 1 (hopeless):
+            * support - the signed distance from the centre of mass to the edge of the support polygon (the convex hull
+              of the footprints of the legs touching the ground), scored 0.5 at the edge, 1 at margin_scale outside
+              and 0 at margin_scale inside
+            * thin - how far the smallest dimension is below min_dimension
+            * spread - how far the difference between the tallest and shortest leg, as a fraction of the tallest, is
+              above max_spread
+
+        Parameters
+        ----------
+        bodies : array_like
+            A (population size, 15) array of body dimensions
+        contact_tolerance : float, optional
+            Legs within this height of the tallest one are treated as touching the ground (default is 0.05)
+        margin_scale : float, optional
+            The stability margin at which the support score saturates (default is 0.1)
+        min_dimension : float, optional
+            Dimensions below this are scored as too thin (default is 0.05)
+        max_spread : float, optional
+            The largest acceptable leg-height spread, as a fraction of the tallest leg (default is 0.5)
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            'margin', 'contact_legs', 'support', 'thin', 'spread' and the combined 'score' (the largest of the three
+            check scores), each of shape (population size,)
+    """
+
+    bodies = np.atleast_2d(np.asarray(bodies, dtype=np.float64))
+    body_w, body_l = bodies[:, 0], bodies[:, 1]
+    leg_w, leg_l, leg_h = bodies[:, 3:7], bodies[:, 7:11], bodies[:, 11:15]
+
+    top = leg_h.max(axis=1)
+    contact = leg_h >= top[:, None] - contact_tolerance
+
+    # Leg attachment corners and the far corner of each footprint, shape (n, 4, 2)
+    joints = LEG_SIGNS * np.stack([0.5*body_w, 0.5*body_l], axis=1)[:, None, :]
+    far = joints + LEG_SIGNS * np.stack([leg_w, leg_l], axis=2)
+
+    # Centre of mass: the body at the origin and each leg at the centre of its footprint, all of mass 1
+    com = (0.5 * (joints + far)).sum(axis=1) / 5
+
+    # All four corners of each footprint; feet off the ground do not support the body
+    corners = np.concatenate([joints, far, np.stack([joints[..., 0], far[..., 1]], axis=2),
+                              np.stack([far[..., 0], joints[..., 1]], axis=2)], axis=1)
+    projections = corners @ _DIRECTIONS.T
+    projections[~np.tile(contact, 4)] = -np.inf
+
+    # Signed distance to the boundary of a convex set: min over directions of its support function minus the point's
+    margin = (projections.max(axis=1) - com @ _DIRECTIONS.T).min(axis=1)
+
+    support = np.clip(0.5 - margin / (2*margin_scale), 0, 1)
+    thin = np.clip((min_dimension - bodies.min(axis=1)) / min_dimension, 0, 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(top > 0, (top - leg_h.min(axis=1)) / top, 1.0)
+    spread = np.clip((ratio - max_spread) / (1 - max_spread), 0, 1)
+
+    return {'margin': margin, 'contact_legs': contact.sum(axis=1), 'support': support, 'thin': thin,
+            'spread': spread, 'score': np.maximum.reduce([support, thin, spread])}
+
+
+def failure_score(bodies, **kwargs):
+    """ The combined predicted-failure score from stability_check, one value in [0, 1] per body. """
+
+    return stability_check(bodies, **kwargs)['score']
+
+
+def prescreen(bodies, threshold=0.9, **kwargs):
+    """ Returns a boolean mask of the bodies whose failure score is at least threshold, i.e. the ones that can be given
+        a floor fitness without being simulated.
+    """
+
+    return failure_score(bodies, **kwargs) >= threshold
@@ -0,0 +1,257 @@
+"""
+© 2026 Emily Maxwell Outland <maxwelea@rose-hulman.edu>
+SPDX License: BSD-3-Clause
+
+surrogate.py
+
+Last Modified: 10/19/2026
+"""
+
+import numpy as np
+
+
+class KNNSurrogate:
+    """ An incremental k-nearest-neighbour regressor over genomes, in NumPy.
+
+        Evaluated (genome, fitness) pairs are appended to preallocated arrays that double in size when full. A
+        prediction is the mean fitness of the k nearest evaluated genomes, and its uncertainty is their standard
+        deviation (plus the model's running prediction error, see SurrogateFilter).
+
+        Attributes
+        ----------
+        k : int
+            The number of neighbours
+        scale : np.ndarray or None
+            Per-gene scale the genomes are divided by before measuring distance (e.g. the gene ranges)
+        count : int
+            The number of stored samples
+    """
+
+    def __init__(self, k=5, scale=None, capacity=1024):
+        self.k = k
+        self.scale = None if scale is None else np.asarray(scale, dtype=np.float64)
+        self.genomes = None
+        self.fitness = np.empty(capacity)
+        self.count = 0
+
+    def add(self, genomes, fitness):
+        """ Adds evaluated genomes (n, genome length) and their fitness values (n,). """
+
+        genomes = self.transform(genomes)
+        fitness = np.asarray(fitness, dtype=np.float64).reshape(-1)
+
+        if self.genomes is None:
+            self.genomes = np.empty((len(self.fitness), genomes.shape[1]))
+
+        needed = self.count + len(genomes)
+        if needed > len(self.fitness):
+            capacity = max(needed, 2 * len(self.fitness))
+            self.genomes = np.resize(self.genomes, (capacity, self.genomes.shape[1]))
+            self.fitness = np.resize(self.fitness, capacity)
+
+        self.genomes[self.count:needed] = genomes
+        self.fitness[self.count:needed] = fitness
+        self.count = needed
+
+    def predict(self, genomes):
+        """ Returns the predicted fitness and its spread, each of shape (n,), for genomes of shape (n, genome length).
+        """
+
+        genomes = self.transform(genomes)
+        k = min(self.k, self.count)
+
+        distances = ((genomes[:, None, :] - self.genomes[None, :self.count, :]) ** 2).sum(axis=2)
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        neighbours = self.fitness[nearest]
+
+        return neighbours.mean(axis=1), neighbours.std(axis=1)
+
+    def transform(self, genomes):
+        genomes = np.atleast_2d(np.asarray(genomes, dtype=np.float64))
+        return genomes if self.scale is None else genomes / self.scale
+
+
+class RandomFeatureRidge:
+    """ Ridge regression on random Fourier features, trained incrementally.
+
+        Each genome is mapped to `features` random cosine features approximating an RBF kernel. Only the normal
+        equations (features x features) and the inverse of their matrix are stored. The inverse is updated with a
+        Sherman-Morrison rank-1 update per sample, O(features^2) each, and refactored by Cholesky only for batches
+        larger than the number of features, so training cost does not grow with the number of samples seen. The
+        uncertainty of a prediction is the usual Bayesian-ridge predictive spread.
+
+        Attributes
+        ----------
+        count : int
+            The number of samples the model has been trained on
+    """
+
+    def __init__(self, genome_length, features=256, length_scale=1.0, ridge=1.0, scale=None, seed=None):
+        rng = np.random.default_rng(seed)
+
+        self.scale = None if scale is None else np.asarray(scale, dtype=np.float64)
+        self.weights = rng.normal(0.0, 1.0 / length_scale, (genome_length, features))
+        self.offsets = rng.uniform(0.0, 2 * np.pi, features)
+        self.norm = np.sqrt(2.0 / features)
+
+        self.gram = ridge * np.eye(features)
+        self.target = np.zeros(features)
+        self.feature_sum = np.zeros(features)
+        self.sum_y = 0.0
+        self.sum_y2 = 0.0
+        self.count = 0
+        self.coefficients = np.zeros(features)
+        self.inverse = np.eye(features) / ridge
+
+    def features(self, genomes):
+        genomes = np.atleast_2d(np.asarray(genomes, dtype=np.float64))
+        if self.scale is not None:
+            genomes = genomes / self.scale
+        return self.norm * np.cos(genomes @ self.weights + self.offsets)
+
+    def add(self, genomes, fitness):
+        """ Adds evaluated genomes (n, genome length) and their fitness values (n,), then updates the ridge fit. """
+
+        phi = self.features(genomes)
+        fitness = np.asarray(fitness, dtype=np.float64).reshape(-1)
+
+        self.gram += phi.T @ phi
+        self.target += phi.T @ fitness
+        self.feature_sum += phi.sum(axis=0)
+        self.sum_y += fitness.sum()
+        self.sum_y2 += (fitness ** 2).sum()
+        self.count += len(fitness)
+
+        if len(phi) < len(self.gram):
+            # Sherman-Morrison: (A + x x^T)^-1 = A^-1 - (A^-1 x)(A^-1 x)^T / (1 + x^T A^-1 x), with A^-1 symmetric
+            for x in phi:
+                u = self.inverse @ x
+                self.inverse -= np.outer(u, u / (1.0 + x @ u))
+        else:
+            # A^-1 = L^-T L^-1 from the Cholesky factor, cheaper than the rank-1 updates for a batch this large
+            factor_inverse = np.linalg.solve(np.linalg.cholesky(self.gram), np.eye(len(self.gram)))
+            self.inverse = factor_inverse.T @ factor_inverse
+
+        # Fit the deviation from the mean fitness, so the zero-mean features do not have to learn the offset
+        mean = self.sum_y / self.count
+        self.coefficients = self.inverse @ (self.target - mean * self.feature_sum)
+
+    def predict(self, genomes):
+        """ Returns the predicted fitness and its spread, each of shape (n,). """
+
+        phi = self.features(genomes)
+        mean = self.sum_y / self.count if self.count else 0.0
+        variance = max(self.sum_y2 / self.count - mean ** 2, 0.0) if self.count else 0.0
+
+        prediction = mean + phi @ self.coefficients
+        spread = np.sqrt(variance * np.einsum('ij,jk,ik->i', phi, self.inverse, phi))
+
+        return prediction, spread
+
+
+class SurrogateFilter:
+    """ Pre-screens offspring with an online surrogate model before they are simulated.
+
+        A candidate is skipped (not simulated) only when the model is confident it would be worse than the current
+        population's worst member: its predicted fitness plus `confidence` times its uncertainty must still be below
+        the worst fitness (for maximisation). Skipped candidates are given their predicted fitness. An `exploration`
+        fraction of candidates is always simulated, and nothing is skipped until the model has `min_samples`
+        training samples.
+
+        The uncertainty combines the model's own spread with its running root-mean-square prediction error on the
+        simulated candidates, so a model that has been predicting badly skips less.
+
+        Attributes
+        ----------
+        candidates : int
+            The number of candidates screened
+        skipped : int
+            The number of candidates not simulated
+        errors : list[float]
+            Prediction errors (predicted - simulated) on the simulated candidates that had a prediction
+        rng : np.random.Generator or RandomStream
+            The stream of the exploration draws (body_trial replaces it with a stream spawned from its seed)
+    """
+
+    def __init__(self, model, exploration=0.1, confidence=2.0, min_samples=20, minimise=False, seed=None):
+        """ Parameters
+            ----------
+            model : KNNSurrogate or RandomFeatureRidge
+                The surrogate model, with add(genomes, fitness) and predict(genomes) -> (mean, spread)
+            exploration : float, optional
+                Fraction of candidates always simulated (default is 0.1)
+            confidence : float, optional
+                How many uncertainties below the worst fitness a prediction must be to skip (default is 2.0)
+            min_samples : int, optional
+                The model must have this many samples before anything is skipped (default is 20)
+            minimise : bool, optional
+                Whether smaller fitness values are better (default is False)
+            seed : int, optional
+                Seed for the exploration draw
+        """
+
+        self.model = model
+        self.exploration = exploration
+        self.confidence = confidence
+        self.min_samples = min_samples
+        self.sign = -1 if minimise else 1
+        self.rng = np.random.default_rng(seed)
+
+        self.candidates = 0
+        self.skipped = 0
+        self.errors = []
+
+    def rmse(self):
+        return float(np.sqrt(np.mean(np.square(self.errors)))) if self.errors else 0.0
+
+    def screen(self, genome, worst):
+        """ Decides whether a candidate should be simulated.
+
+            Parameters
+            ----------
+            genome : list[float]
+                The candidate genome
+            worst : float or None
+                The current population's worst fitness (None if not known yet)
+
+            Returns
+            -------
+            tuple[bool, float or None]
+                Whether to simulate it, and the model's prediction (None if the model was not consulted)
+        """
+
+        self.candidates += 1
+
+        if self.model.count < self.min_samples or worst is None:
+            return True, None
+
+        mean, spread = self.model.predict(genome)
+        prediction = float(mean[0])
+        uncertainty = float(np.hypot(spread[0], self.rmse()))
+
+        if self.rng.random() < self.exploration:
+            return True, prediction
+
+        if self.sign * (prediction + self.sign * self.confidence * uncertainty) < self.sign * worst:
+            self.skipped += 1
+            return False, prediction
+
+        return True, prediction
+
+    def update(self, genome, fitness, prediction=None):
+        """ Trains the model on a simulated candidate and records the prediction error if there was a prediction. """
+
+        if prediction is not None:
+            self.errors.append(prediction - fitness)
+
+        self.model.add([genome], [fitness])
+
+    def skip_rate(self):
+        return self.skipped / self.candidates if self.candidates else 0.0
+
+    def report(self):
+        """ Returns a one-line summary of the skip rate and prediction error. """
+
+        mae = float(np.mean(np.abs(self.errors))) if self.errors else 0.0
+        return (f"Surrogate: skipped {self.skipped} of {self.candidates} candidates ({self.skip_rate():.1%}), "
+                f"prediction MAE {mae:.4f}, RMSE {self.rmse():.4f} over {len(self.errors)} simulated predictions")
@@ -4,48 +4,68 @@ SPDX License: BSD-3-Clause
 
 three_crossover_trial.py
 
-Last Modified: 04/14/2025
+Last Modified: 10/19/2026
 """
 
 import simulate_body_nogui as sb
-from genalgs import Recombination
+from genalgs import RandomStream, Recombination
 import evolution_trial as evo
 
 import numpy as np
-import pandas as pd
+
+
+def evaluate_bodies(bodies, client=None, store=None):
+    """ Returns the fitness (final distance from the starting point) of each body, simulating them here or, if an
+        eval_daemon.EvaluationClient is given, in one batch on the evaluation daemon. If an
+        evaluation_store.EvaluationStore is given, bodies it already holds are read from it instead and the rest are
+        recorded in it.
+    """
+
+    def simulate(batch):
+        if client is not None:
+            return client.evaluate(batch)
+
+        return [float(sb.simulate_body(urdf)[-1]) for urdf in evo.generate_urdfs(batch)]
+
+    if store is not None:
+        return store.evaluate(bodies, simulate)
+
+    return simulate(bodies)
 
 
 def three_crossover_trial(num_bodies: int, generations: int, title: str, prob_reproduction=0.5, prob_mutation=0.1,
-               mutation_deviation=0.05, encoding_type=1, minimise=False):
+               mutation_deviation=0.05, encoding_type=1, minimise=False, client=None, repair="reflect",
+               store=None, seed=None):
+    # pandas is only needed for logging here, so it is not imported by evaluation workers that import this module
+    import pandas as pd
 
-    # Generate bodies (list of parameters)
-    starting_bodies = evo.randomize_bodies(num_bodies)
+    # One independent random stream for the starting bodies and one for each genetic algorithm
+    population_stream, *streams = RandomStream(seed).spawn(4)
 
-    # Generate urdfs of bodies
-    starting_body_urdfs = evo.generate_urdfs(starting_bodies)
+    # Generate bodies (list of parameters)
+    starting_bodies = evo.randomize_bodies(num_bodies, population_stream)
 
     # Find the fitness for each body (final distance from starting point)
-    starting_fitness = [None] * num_bodies
-    for i in range(len(starting_body_urdfs)):
-        distance = sb.simulate_body(starting_body_urdfs[i])
-        starting_fitness[i] = distance[-1]
+    starting_fitness = evaluate_bodies(starting_bodies, client, store)
 
     # Create three genetic algorithms, each with a different method of crossover
     uniform = Recombination(starting_bodies, starting_fitness, prob_reproduction, prob_mutation, mutation_deviation,
-                            encoding_type, minimise, name="uniform", crossover_method=0)
+                            encoding_type, minimise, name="uniform", crossover_method=0,
+                            bounds=evo.body_schema(repair, streams[0]) if repair is not None else None, rng=streams[0])
 
     single = Recombination(starting_bodies, starting_fitness, prob_reproduction, prob_mutation, mutation_deviation,
-                            encoding_type, minimise, name="single", crossover_method=1)
+                            encoding_type, minimise, name="single", crossover_method=1,
+                            bounds=evo.body_schema(repair, streams[1]) if repair is not None else None, rng=streams[1])
 
     double = Recombination(starting_bodies, starting_fitness, prob_reproduction, prob_mutation, mutation_deviation,
-                            encoding_type, minimise, name= "double", crossover_method=2)
+                            encoding_type, minimise, name= "double", crossover_method=2,
+                            bounds=evo.body_schema(repair, streams[2]) if repair is not None else None, rng=streams[2])
 
     methods = [uniform, single, double]
 
     for method in methods:
         ga = method
 
-        body_urdfs = starting_body_urdfs
         fitness = starting_fitness
 
         print(f"Trial of {ga.name} crossover method")
@@ -75,8 +95,7 @@ def three_crossover_trial(num_bodies: int, generations: int, title: str, prob_re
             bodies = output[0]
             individual = output[1]
 
-            body_urdfs[individual] = evo.generate_urdf(bodies[individual], individual)
-            fitness[individual] = sb.simulate_body(body_urdfs[individual])[-1]
+            fitness[individual] = evaluate_bodies([bodies[individual]], client, store)[0]
 
             ga.setFitness(fitness)
 
@@ -95,7 +114,13 @@ def three_crossover_trial(num_bodies: int, generations: int, title: str, prob_re
         best_body = ga.getMostFit()
         print(f"{ga.name} method best fitness: {best_body[1]}, body: {best_body[0]}")
 
+        if ga.bounds is not None:
+            print(ga.bounds.report())
+
         df.to_csv(f'{ga.name}_trial_{title}.csv')
 
+    if store is not None:
+        print(store.report())
+
     return [[uniform.population, uniform.fitness], [single.population, single.fitness],
             [double.population, double.fitness]]
\ No newline at end of file
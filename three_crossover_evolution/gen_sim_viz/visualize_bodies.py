@@ -4,15 +4,20 @@ SPDX License: BSD-3-Clause
 
 visualize_bodies.py
 
-Last Modified: 11/20/2024
+Last Modified: 10/19/2026
 """
 
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+import hashlib
+import os
+
 import three_crossover_evolution.gen_sim_viz.evolution_trial as evo
 import simulate_body_gui as sbg
+import simulate_body_nogui as sb
+import replay_body_gui as rbg
 
 
 def visualize_trial(trial_number: int):
@@ -29,14 +34,25 @@ def visualize_trial(trial_number: int):
     plt.show()
 
 
-def load_simulate_body(trial_number: int):
+def load_simulate_body(trial_number: int, replay=True, speed=1.0):
     # filename = f"trial_bodies/body_trial_{trial_number}.csv"
     filename = f"gen_sim_viz/body_trial_{trial_number}.csv"
     df = pd.read_csv(filename)
     last = np.array(df.loc[1000]['body_w':'legh_4'])
 
     urdf = evo.generate_urdf(last, trial_number)
-    distance = sbg.simulate_body_gui(urdf)
+
+    if not replay:
+        return sbg.simulate_body_gui(urdf)
+
+    # Simulate once without the GUI (recording the trajectory), then replay the recording at any speed. The recording
+    # is named by the body's hash, so a regenerated trial records its new body instead of replaying the old one
+    body_hash = hashlib.sha1(np.asarray(last, dtype=np.float64).tobytes()).hexdigest()[:12]
+    trajectory = f"body_trial_{trial_number}_{body_hash}_trajectory.npz"
+    if not os.path.exists(trajectory):
+        sb.simulate_body(urdf, record=trajectory)
+
+    distance = rbg.replay_body_gui(urdf, trajectory, speed=speed)
 
     return distance
 